@@ -1,27 +1,51 @@
 """Selenium WebDriver 인스턴스를 관리합니다."""
 
 import logging  # noqa: F401 # 로깅 모듈 임포트
+import os
+import threading
+import time
 from configparser import ConfigParser
-from typing import TYPE_CHECKING
+from typing import Any, Callable
 
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from src.core import command_stats, read_cache
+from src.core.config import get_cache_dir
+from src.core.driver_cache import resolve_chromedriver
+from src.core.http_client import KreamHttpClient
 
 # logger_setup 임포트
 from src.core.logger_setup import setup_logger
-
-if TYPE_CHECKING:
-    from ..stubs import chromedriver_autoinstaller
-else:
-    import chromedriver_autoinstaller
+from src.core.network_capture import enable_capture
+from src.core.resource_blocking import apply_blocking_profile, page_load_summary
+from src.core.selector_registry import SelectorRegistry, init_registry
+from src.core.tab_manager import TabManager
 
 # 전역 로거 설정
 logger = setup_logger(__name__)
 
+KREAM_ORIGIN = "https://kream.co.kr"
+# 복구 리스너 시그니처: (죽은 드라이버, 새 드라이버)
+RecoveryListener = Callable[[RemoteWebDriver, WebDriver], object]
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
 
 class BrowserManager:
-    """브라우저 자동화를 위한 Selenium WebDriver 인스턴스를 관리합니다."""
+    """브라우저 자동화를 위한 Selenium WebDriver 인스턴스를 관리합니다.
+
+    기본 드라이버(로그인 세션과 매크로가 사용하는 브라우저) 외에 `pool_size - 1`개의
+    추가 드라이버를 풀로 관리합니다. 검색/상세 조회처럼 독립적으로 실행될 수 있는
+    작업은 `lease_driver()`로 전용 드라이버를 대여해 기본 드라이버와 충돌하지 않습니다.
+    """
 
     def __init__(self: "BrowserManager", config: ConfigParser) -> None:
         """설정을 사용하여 BrowserManager를 초기화합니다.
@@ -31,55 +55,741 @@ class BrowserManager:
         """
         self.config = config
         self.driver: WebDriver | None = None
+        self.pool_size: int = max(
+            1, self.config.getint("Browser", "pool_size", fallback=3)
+        )
+        self._pool: list[WebDriver] = []
+        self._leases: dict[str, WebDriver] = {}
+        self._affinity: dict[str, WebDriver] = {}
+        self._synced_cookies: dict[int, frozenset[tuple[str, str]]] = {}
+        self._slots: dict[int, str] = {}
+        self._reserved_slots: set[str] = set()
+        self._lock = threading.RLock()
+        self._pool_changed = threading.Condition(self._lock)
+        self._primary_lock = threading.Lock()
+        self._prewarm_thread: threading.Thread | None = None
+        self._created_at = time.perf_counter()
+        self._first_driver_logged = False
+        self._recovery_listeners: list[RecoveryListener] = []
+        self._snapshots: dict[int, dict[str, Any]] = {}
+        self._watchdog_thread: threading.Thread | None = None
+        self._watchdog_stop = threading.Event()
+        # 드라이버별 실행 중인 명령 수 (감시 스레드의 확인 명령 제외)
+        self._busy: dict[int, int] = {}
+        self._busy_lock = threading.Lock()
+        self._pinging = threading.local()
+        # 드라이버별 연속 확인 실패 횟수와 아직 응답을 기다리는 확인 스레드
+        self._ping_failures: dict[int, int] = {}
+        self._pingers: dict[int, threading.Thread] = {}
+        self._http: KreamHttpClient | None = None
+        self._tab_managers: dict[int, TabManager] = {}
+        self.selectors: SelectorRegistry = init_registry(get_cache_dir(config))
 
-    def get_driver(self: "BrowserManager") -> WebDriver:
-        """기존 WebDriver 인스턴스를 반환하거나, 없으면 새로 생성하여 반환합니다."""
-        if not self.driver:
-            options = Options()
-
-            user_agent = self.config.get("Browser", "user_agent", fallback=None)
-
-            if user_agent:
-                options.add_argument(f"user-agent={user_agent}")
-
-            if self.config.getboolean("Browser", "headless", fallback=False):
-                logger.info(
-                    "Headless 모드로 브라우저를 설정합니다."
-                )  # 헤드리스 모드 설정 로그 추가
-                options.add_argument("--headless=new")
-                options.add_argument("--disable-gpu")
-                options.add_argument("--window-size=1920,1080")
-                options.add_argument("--start-maximized")
-                options.add_experimental_option(
-                    "excludeSwitches", ["enable-automation"]
+    def _profile_dir(self: "BrowserManager", slot: str) -> str | None:
+        """슬롯별 Chrome 사용자 데이터 디렉토리 경로를 반환합니다.
+
+        Chrome은 하나의 사용자 데이터 디렉토리를 여러 인스턴스가 동시에 쓰지 못하므로,
+        기본 드라이버와 각 풀 드라이버는 서로 다른 슬롯 디렉토리를 사용합니다.
+
+        Args:
+            slot: 프로필 슬롯 이름입니다 (예: "primary", "pool_0").
+
+        Returns:
+            절대 경로이거나, persistent_profile 옵션이 꺼져 있으면 None입니다.
+        """
+        if not self.config.getboolean("Browser", "persistent_profile", fallback=True):
+            return None
+        return os.path.abspath(get_cache_dir(self.config, "profiles", slot))
+
+    def _build_options(
+        self: "BrowserManager", profile_dir: str | None, capture_network: bool = False
+    ) -> Options:
+        """설정 파일을 바탕으로 Chrome 옵션을 생성합니다.
+
+        Args:
+            profile_dir: 사용할 사용자 데이터 디렉토리입니다. None이면 임시 프로필을 씁니다.
+            capture_network: 성능 로그로 API 응답을 수집할 수 있게 할지 여부입니다.
+        """
+        options = Options()
+
+        if profile_dir:
+            # 쿠키/로컬 스토리지/HTTP 캐시가 재시작 후에도 유지됩니다.
+            options.add_argument(f"--user-data-dir={profile_dir}")
+
+        user_agent = self.config.get("Browser", "user_agent", fallback=None)
+
+        if user_agent:
+            options.add_argument(f"user-agent={user_agent}")
+
+        if self.config.getboolean("Browser", "headless", fallback=False):
+            logger.info(
+                "Headless 모드로 브라우저를 설정합니다."
+            )  # 헤드리스 모드 설정 로그 추가
+            options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--start-maximized")
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option("useAutomationExtension", False)
+
+        # load 이벤트까지 기다릴지 여부 (각 호출자가 자신의 준비 조건을 기다림)
+        strategy = self.config.get("Browser", "page_load_strategy", fallback="eager")
+        if strategy not in PAGE_LOAD_STRATEGIES:
+            logger.warning(f"알 수 없는 page_load_strategy '{strategy}', eager 사용")
+            strategy = "eager"
+        options.page_load_strategy = strategy
+
+        if capture_network:
+            enable_capture(options)
+
+        # 추가 Chrome 옵션
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        return options
+
+    def _create_driver(self: "BrowserManager", slot: str = "primary") -> WebDriver:
+        """새 Chrome WebDriver 인스턴스를 생성합니다.
+
+        Args:
+            slot: 영구 프로필 슬롯 이름입니다.
+
+        Raises:
+            Exception: WebDriver 초기화에 실패한 경우.
+        """
+        profile_dir = self._profile_dir(slot)
+        # 스크래핑을 맡는 드라이버만 성능 로그를 켭니다 (풀이 없으면 기본 드라이버).
+        capture_network = self.config.getboolean(
+            "Browser", "network_capture", fallback=True
+        ) and (slot != "primary" or self.pool_size <= 1)
+
+        # 크롬 드라이버 경로 확인 (Chrome 버전이 바뀐 경우에만 재설치)
+        driver_path: str | None = None
+        resolve_started = time.perf_counter()
+        try:
+            driver_path = resolve_chromedriver(get_cache_dir(self.config, "driver"))
+        except Exception as e:
+            logger.error(f"ChromeDriver 경로 확인 중 오류: {e}", exc_info=True)
+            # 실패 시에는 Selenium Manager가 드라이버를 찾도록 진행합니다.
+        resolve_ms = (time.perf_counter() - resolve_started) * 1000
+
+        try:
+            logger.info("Chrome WebDriver 초기화를 시도합니다...")
+            launch_started = time.perf_counter()
+            service = Service(executable_path=driver_path) if driver_path else None
+            try:
+                driver = webdriver.Chrome(
+                    options=self._build_options(profile_dir, capture_network),
+                    service=service,
+                )
+            except WebDriverException:
+                if not profile_dir:
+                    raise
+                # 이전 Chrome 프로세스가 프로필을 잠그고 있으면 임시 프로필로 실행합니다.
+                logger.warning(
+                    f"프로필({profile_dir})로 실행하지 못해 임시 프로필로 재시도합니다.",
+                    exc_info=True,
                 )
-                options.add_experimental_option("useAutomationExtension", False)
+                driver = webdriver.Chrome(
+                    options=self._build_options(None, capture_network),
+                    service=service,
+                )
+            launch_ms = (time.perf_counter() - launch_started) * 1000
+            logger.info(
+                f"Chrome WebDriver 초기화 성공. "
+                f"(드라이버 확인 {resolve_ms:.1f}ms, 브라우저 실행 {launch_ms:.0f}ms)"
+            )
+        except Exception as e:
+            logger.error(f"Chrome WebDriver 초기화 실패: {e}", exc_info=True)
+            raise
+
+        # 기본 드라이버(매크로/결제)는 가벼운 프로필, 풀 드라이버(스크래핑)는 강한 프로필
+        profile_option = (
+            "blocking_profile" if slot == "primary" else "pool_blocking_profile"
+        )
+        default_profile = "light" if slot == "primary" else "scraping"
+        apply_blocking_profile(
+            driver,
+            self.config.get("Browser", profile_option, fallback=default_profile),
+        )
+
+        if self.config.getboolean("Browser", "instrument_commands", fallback=False):
+            command_stats.instrument(driver)
+        read_cache.enable(
+            driver, self.config.getfloat("Browser", "read_cache_ttl", fallback=0.5)
+        )
+        self._track_commands(driver)
+
+        if not self._first_driver_logged:
+            self._first_driver_logged = True
+            elapsed = time.perf_counter() - self._created_at
+            logger.info(f"첫 WebDriver 준비까지 걸린 시간: {elapsed:.2f}s")
+        return driver
+
+    def _track_commands(self: "BrowserManager", driver: WebDriver) -> None:
+        """드라이버의 `execute`를 감싸 실행 중인 명령 수를 셉니다.
+
+        감시 스레드는 명령이 실행 중인 드라이버를 확인하지 않습니다. 긴 페이지 로드나
+        스크립트 대기 뒤에 확인 명령이 밀려 멈춘 것으로 오인하지 않기 위함입니다.
+        """
+        original = driver.execute
+        key = id(driver)
+
+        def execute(driver_command: str, params: dict | None = None) -> Any:
+            if getattr(self._pinging, "active", False):
+                return original(driver_command, params)
+            with self._busy_lock:
+                self._busy[key] = self._busy.get(key, 0) + 1
+            try:
+                return original(driver_command, params)
+            finally:
+                with self._busy_lock:
+                    remaining = self._busy.get(key, 0) - 1
+                    if remaining > 0:
+                        self._busy[key] = remaining
+                    else:
+                        self._busy.pop(key, None)
+
+        setattr(driver, "execute", execute)
+
+    def _running_command(self: "BrowserManager", driver: WebDriver) -> bool:
+        """드라이버가 명령을 실행 중인지 여부입니다 (감시 스레드의 확인 명령 제외)."""
+        with self._busy_lock:
+            return self._busy.get(id(driver), 0) > 0
+
+    def is_leased(self: "BrowserManager", driver: RemoteWebDriver) -> bool:
+        """드라이버가 풀에서 대여된 상태인지 여부입니다.
+
+        대여한 쪽이 오래 들고 있으면 감시 스레드가 명령 사이에만 확인하므로,
+        대여한 쪽도 사용하기 전에 스스로 상태를 확인합니다.
+        """
+        with self._lock:
+            return any(d is driver for d in self._leases.values())
+
+    def get_driver(self: "BrowserManager") -> WebDriver:
+        """기존 WebDriver 인스턴스를 반환하거나, 없으면 새로 생성하여 반환합니다.
+
+        백그라운드 예열이 기본 드라이버를 실행하는 중이면, 새로 실행하지 않고
+        그 실행이 끝날 때까지 기다렸다가 같은 인스턴스를 반환합니다.
+        """
+        with self._primary_lock:
+            if not self.driver:
+                self.driver = self._create_driver()
+            return self.driver
+
+    def _create_pool_driver(
+        self: "BrowserManager", owner: str | None = None
+    ) -> WebDriver:
+        """비어 있는 프로필 슬롯을 골라 풀 드라이버를 생성하고 풀에 추가합니다.
+
+        Args:
+            owner: 지정하면 생성된 드라이버를 곧바로 이 owner에게 대여합니다.
+        """
+        with self._lock:
+            used = set(self._slots.values()) | self._reserved_slots
+            slot = next(
+                s for i in range(len(used) + 1) if (s := f"pool_{i}") not in used
+            )
+            self._reserved_slots.add(slot)
+        try:
+            driver = self._create_driver(slot)
+        except Exception:
+            with self._lock:
+                self._reserved_slots.discard(slot)
+                self._pool_changed.notify_all()
+            raise
+        with self._lock:
+            self._reserved_slots.discard(slot)
+            self._pool.append(driver)
+            self._slots[id(driver)] = slot
+            if owner is not None:
+                self._leases[owner] = driver
+                self._affinity[owner] = driver
+            self._pool_changed.notify_all()
+        return driver
+
+    def prewarm_pool(
+        self: "BrowserManager",
+        on_progress: Callable[[str], None] | None = None,
+    ) -> None:
+        """풀 드라이버를 `pool_size - 1`개까지 미리 실행합니다.
+
+        Args:
+            on_progress: 드라이버가 하나 준비될 때마다 진행 메시지를 받을 콜백입니다.
+        """
+        total = self.pool_size - 1
+        while True:
+            with self._lock:
+                if len(self._pool) + len(self._reserved_slots) >= total:
+                    break
+            self._create_pool_driver()
+            message = f"추가 브라우저 준비 완료 ({len(self._pool)}/{total})"
+            logger.info(message)
+            if on_progress:
+                on_progress(message)
+
+    def start_prewarm(
+        self: "BrowserManager",
+        include_pool: bool = True,
+        on_progress: Callable[[str], None] | None = None,
+        on_primary_ready: Callable[[], object] | None = None,
+    ) -> threading.Thread:
+        """백그라운드 스레드에서 기본 드라이버(와 풀)를 미리 실행합니다.
+
+        실행 중에 `get_driver()`/`lease_driver()`를 호출하면 새로 실행하지 않고
+        진행 중인 실행이 끝나기를 기다립니다.
+
+        Args:
+            include_pool: True이면 기본 드라이버 다음에 풀 드라이버까지 실행합니다.
+            on_progress: 진행 메시지를 받을 콜백입니다 (예열 스레드에서 호출됩니다).
+            on_primary_ready: 기본 드라이버가 준비된 직후 예열 스레드에서 호출됩니다.
+
+        Returns:
+            예열 작업을 수행하는 스레드입니다.
+        """
+        if self._prewarm_thread and self._prewarm_thread.is_alive():
+            return self._prewarm_thread
+
+        def report(message: str) -> None:
+            if on_progress:
+                on_progress(message)
+
+        def run() -> None:
+            try:
+                report("브라우저를 준비하는 중입니다...")
+                started = time.perf_counter()
+                self.get_driver()
+                report(f"브라우저 준비 완료 ({time.perf_counter() - started:.1f}초)")
+                if on_primary_ready:
+                    on_primary_ready()
+                if include_pool:
+                    self.prewarm_pool(on_progress)
+            except Exception as e:
+                logger.error(f"브라우저 예열 중 오류: {e}", exc_info=True)
+                report(f"브라우저 준비 중 오류가 발생했습니다: {e}")
+
+        self._prewarm_thread = threading.Thread(
+            target=run, name="browser-prewarm", daemon=True
+        )
+        self._prewarm_thread.start()
+        return self._prewarm_thread
 
-            # 크롬 드라이버 자동 설치
+    def lease_driver(
+        self: "BrowserManager", owner: str, timeout: float | None = None
+    ) -> WebDriver:
+        """풀에서 owner 전용 드라이버를 대여합니다.
+
+        같은 owner는 가능한 한 이전에 사용했던 드라이버를 다시 받습니다(affinity).
+        풀 드라이버가 실행 중이면 그 실행이 끝나기를 기다리고, 남는 드라이버가 없으면
+        다른 owner가 반납할 때까지 기다립니다. 매크로 탭이 바뀌지 않도록 기본 드라이버는
+        내주지 않으며, 풀 크기가 1(풀 없이 브라우저 하나만 사용)일 때만 기본 드라이버를
+        반환합니다.
+
+        Args:
+            owner: 드라이버를 사용할 주체의 이름입니다 (예: 플러그인 이름).
+            timeout: 여유 드라이버를 기다릴 최대 시간(초)입니다. None이면
+                `[Browser] lease_timeout`을 사용합니다.
+
+        Returns:
+            대여된 WebDriver 인스턴스입니다.
+
+        Raises:
+            TimeoutException: timeout 안에 여유 풀 드라이버가 생기지 않은 경우.
+        """
+        if self.pool_size <= 1:
+            return self.get_driver()
+        if timeout is None:
+            timeout = self.config.getfloat("Browser", "lease_timeout", fallback=60)
+        deadline = time.monotonic() + timeout
+
+        driver: WebDriver | None = None
+        with self._lock:
+            while True:
+                leased = self._leases.get(owner)
+                if leased is not None:
+                    return leased
+
+                idle = [d for d in self._pool if d not in self._leases.values()]
+                driver = self._affinity.get(owner)
+                if driver not in idle:
+                    # 다른 owner가 최근에 쓰던 드라이버는 가급적 피해서 고릅니다.
+                    bound = set(map(id, self._affinity.values()))
+                    unbound = [d for d in idle if id(d) not in bound]
+                    driver = (unbound or idle)[0] if idle else None
+                if driver is not None:
+                    self._leases[owner] = driver
+                    self._affinity[owner] = driver
+                    break
+                if not self._reserved_slots and len(self._pool) < self.pool_size - 1:
+                    break
+                # 예열 중인 풀 드라이버가 준비되거나 다른 owner가 반납하기를 기다립니다.
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(
+                        f"'{owner}'에 대여할 여유 풀 드라이버가 {timeout:g}초 안에 "
+                        "생기지 않았습니다."
+                    )
+                self._pool_changed.wait(remaining)
+
+        if driver is None:
+            driver = self._create_pool_driver(owner)
+
+        logger.debug(
+            f"풀 드라이버 대여: owner='{owner}', 대여 중 {len(self._leases)}개"
+        )
+
+        self._share_session(driver)
+        return driver
+
+    def free_pool_drivers(self: "BrowserManager") -> int:
+        """지금 대여되지 않은(또는 아직 만들지 않은) 풀 드라이버 수를 반환합니다.
+
+        검색처럼 드라이버를 계속 들고 있는 owner의 몫을 빼고 계산하므로, 동시에
+        실행할 작업자 수를 정할 때 사용합니다. 풀 크기가 1이면 0입니다.
+        """
+        with self._lock:
+            return max(0, self.pool_size - 1 - len(self._leases))
+
+    def release_driver(self: "BrowserManager", owner: str) -> None:
+        """owner가 대여한 드라이버를 풀에 반납합니다.
+
+        Args:
+            owner: `lease_driver()`에 전달했던 이름입니다.
+        """
+        with self._lock:
+            if self._leases.pop(owner, None) is not None:
+                logger.debug(f"풀 드라이버 반납: owner='{owner}'")
+                self._pool_changed.notify_all()
+
+    def discard_driver(self: "BrowserManager", driver: RemoteWebDriver) -> None:
+        """응답하지 않는 드라이버를 풀에서 제거하고 종료합니다.
+
+        다음 `get_driver()`/`lease_driver()` 호출 시 새 드라이버가 생성됩니다.
+
+        Args:
+            driver: 제거할 WebDriver 인스턴스입니다.
+        """
+        with self._lock:
+            if driver is self.driver:
+                self.driver = None
+            if driver in self._pool:
+                self._pool.remove(driver)
+            for mapping in (self._leases, self._affinity):
+                for owner in [o for o, d in mapping.items() if d is driver]:
+                    del mapping[owner]
+            self._synced_cookies.pop(id(driver), None)
+            self._slots.pop(id(driver), None)
+            self._snapshots.pop(id(driver), None)
+            self._tab_managers.pop(id(driver), None)
+            self._pool_changed.notify_all()
+        self._forget_activity(driver)
+        self._quit_quietly(driver)
+        logger.info("응답하지 않는 WebDriver를 제거했습니다.")
+
+    def tabs(self: "BrowserManager", driver: RemoteWebDriver) -> TabManager:
+        """드라이버의 이름 있는 탭을 관리하는 TabManager를 반환합니다.
+
+        Args:
+            driver: 탭을 관리할 WebDriver 인스턴스입니다.
+        """
+        with self._lock:
+            manager = self._tab_managers.get(id(driver))
+            if manager is None or manager.driver is not driver:
+                manager = self._tab_managers[id(driver)] = TabManager(driver)
+            return manager
+
+    @property
+    def http(self: "BrowserManager") -> KreamHttpClient:
+        """기본 드라이버의 쿠키를 공유하는 HTTP 클라이언트를 반환합니다."""
+        if self._http is None:
+            self._http = KreamHttpClient(self, self.config)
+        return self._http
+
+    @property
+    def watchdog_active(self: "BrowserManager") -> bool:
+        """감시 스레드가 드라이버 상태를 확인하고 있는지 여부입니다."""
+        return bool(self._watchdog_thread and self._watchdog_thread.is_alive())
+
+    def add_recovery_listener(
+        self: "BrowserManager", listener: RecoveryListener
+    ) -> None:
+        """드라이버가 재생성되었을 때 호출될 콜백을 등록합니다.
+
+        콜백은 감시 스레드에서 (죽은 드라이버, 새 드라이버) 인자로 호출됩니다.
+        죽은 드라이버를 들고 있는 객체는 새 드라이버로 참조를 바꾸면 됩니다.
+
+        Args:
+            listener: 등록할 콜백입니다.
+        """
+        self._recovery_listeners.append(listener)
+
+    def start_watchdog(self: "BrowserManager") -> threading.Thread | None:
+        """드라이버 상태를 주기적으로 확인하는 감시 스레드를 시작합니다.
+
+        `[Browser] watchdog_interval`(초)마다 쉬고 있는 각 드라이버에 가벼운 명령을
+        보냅니다. 프로세스가 종료되었거나, 세션 확인이 실패하거나 `watchdog_timeout`(초)
+        안에 응답하지 않는 일이 `watchdog_failures`번 연속되면 드라이버를 다시 만들고
+        쿠키와 보고 있던 페이지를 복원합니다. 명령을 실행 중인 드라이버는 작업이 진행
+        중인 것으로 보고 확인하지 않으며, 대여 중이라도 명령 사이에는 확인합니다.
+
+        Returns:
+            감시 스레드이거나, watchdog_interval이 0이면 None입니다.
+        """
+        interval = self.config.getfloat("Browser", "watchdog_interval", fallback=10)
+        if interval <= 0:
+            return None
+        if self.watchdog_active:
+            return self._watchdog_thread
+        timeout = self.config.getfloat("Browser", "watchdog_timeout", fallback=30)
+        max_failures = max(
+            1, self.config.getint("Browser", "watchdog_failures", fallback=3)
+        )
+
+        def run() -> None:
+            while not self._watchdog_stop.wait(interval):
+                with self._lock:
+                    drivers = [d for d in [self.driver, *self._pool] if d is not None]
+                for driver in drivers:
+                    if self._watchdog_stop.is_set():
+                        return
+                    if self._process_exited(driver):
+                        logger.warning("ChromeDriver 프로세스가 종료되었습니다.")
+                    elif self._running_command(driver):
+                        continue
+                    elif self._is_healthy(driver, timeout):
+                        self._ping_failures.pop(id(driver), None)
+                        continue
+                    else:
+                        failures = self._ping_failures.get(id(driver), 0) + 1
+                        self._ping_failures[id(driver)] = failures
+                        if failures < max_failures:
+                            logger.info(
+                                f"드라이버 확인 실패 {failures}/{max_failures}회"
+                            )
+                            continue
+                    try:
+                        self._respawn(driver)
+                    except Exception as e:
+                        logger.error(f"드라이버 재생성 실패: {e}", exc_info=True)
+
+        self._watchdog_stop.clear()
+        self._watchdog_thread = threading.Thread(
+            target=run, name="browser-watchdog", daemon=True
+        )
+        self._watchdog_thread.start()
+        logger.info(f"브라우저 감시 시작 (주기 {interval:g}초, 제한 {timeout:g}초)")
+        return self._watchdog_thread
+
+    def _forget_activity(self: "BrowserManager", driver: RemoteWebDriver) -> None:
+        """제거된 드라이버의 명령/확인 기록을 지웁니다."""
+        self._ping_failures.pop(id(driver), None)
+        self._pingers.pop(id(driver), None)
+        with self._busy_lock:
+            self._busy.pop(id(driver), None)
+
+    @staticmethod
+    def _process_exited(driver: WebDriver) -> bool:
+        """드라이버의 ChromeDriver 프로세스가 종료되었는지 여부입니다."""
+        process = getattr(getattr(driver, "service", None), "process", None)
+        return process is not None and process.poll() is not None
+
+    def _is_healthy(self: "BrowserManager", driver: WebDriver, timeout: float) -> bool:
+        """드라이버가 응답하는지 확인하고, 응답하면 복원용 상태를 기록합니다.
+
+        이전 확인 명령이 아직 끝나지 않았으면 새 명령을 보내지 않고 실패로 봅니다.
+
+        Args:
+            driver: 확인할 드라이버입니다.
+            timeout: 응답을 기다릴 최대 시간(초)입니다. 넘기면 멈춘 것으로 봅니다.
+        """
+        previous_pinger = self._pingers.get(id(driver))
+        if previous_pinger is not None and previous_pinger.is_alive():
+            logger.warning("드라이버가 이전 확인 명령에 아직 응답하지 않습니다.")
+            return False
+
+        snapshot: dict[str, Any] = {}
+        error: list[Exception] = []
+
+        def ping() -> None:
+            self._pinging.active = True
             try:
-                logger.info("ChromeDriver 자동 설치를 시도합니다...")
-                chromedriver_autoinstaller.install()
-                logger.info("ChromeDriver 자동 설치 완료.")
+                with command_stats.command_scope("watchdog"), read_cache.uncached():
+                    snapshot["url"] = driver.current_url
+                    if driver is self.driver:
+                        snapshot["cookies"] = driver.get_cookies()
+            except NoSuchWindowException:
+                # 보던 탭만 닫힌 경우로, 세션은 살아 있습니다.
+                pass
             except Exception as e:
-                logger.error(f"ChromeDriver 자동 설치 중 오류: {e}", exc_info=True)
-                # 설치 실패 시에도 일단 진행하도록 둘 수 있으나, 심각한 오류로 간주하고 raise 할 수도 있음
+                error.append(e)
 
-            # 추가 Chrome 옵션
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
+        pinger = threading.Thread(target=ping, name="browser-ping", daemon=True)
+        pinger.start()
+        pinger.join(timeout)
+        if pinger.is_alive():
+            self._pingers[id(driver)] = pinger
+            logger.warning(f"드라이버가 {timeout:g}초 동안 응답하지 않습니다.")
+            return False
+        self._pingers.pop(id(driver), None)
+        if error:
+            logger.warning(f"드라이버 세션 확인 실패: {error[0]}")
+            return False
+        if snapshot:
+            previous = self._snapshots.get(id(driver), {})
+            self._snapshots[id(driver)] = {**previous, **snapshot}
+        return True
 
+    def _respawn(self: "BrowserManager", dead: WebDriver) -> WebDriver | None:
+        """죽은 드라이버를 같은 슬롯의 새 드라이버로 바꾸고 상태를 복원합니다.
+
+        Args:
+            dead: 응답하지 않는 드라이버입니다.
+
+        Returns:
+            새 드라이버이거나, 이미 다른 곳에서 교체/제거된 경우 None입니다.
+        """
+        with self._lock:
+            is_primary = dead is self.driver
+            if not is_primary and dead not in self._pool:
+                return None
+            slot = "primary" if is_primary else self._slots.get(id(dead), "pool_0")
+            snapshot = self._snapshots.pop(id(dead), {})
+            self._tab_managers.pop(id(dead), None)
+        self._forget_activity(dead)
+        logger.warning(f"'{slot}' 드라이버를 다시 시작합니다.")
+
+        # 멈춘 드라이버의 quit()은 오래 걸릴 수 있으므로 기다리지 않습니다.
+        threading.Thread(target=self._quit_quietly, args=(dead,), daemon=True).start()
+
+        if is_primary:
+            with self._primary_lock:
+                if self.driver is not dead:
+                    return None
+                new = self._create_driver(slot)
+                self.driver = new
+        else:
+            new = self._create_driver(slot)
+            with self._lock:
+                if dead not in self._pool:
+                    self._quit_quietly(new)
+                    return None
+                self._pool[self._pool.index(dead)] = new
+                self._slots.pop(id(dead), None)
+                self._slots[id(new)] = slot
+                self._synced_cookies.pop(id(dead), None)
+                for mapping in (self._leases, self._affinity):
+                    for owner in [o for o, d in mapping.items() if d is dead]:
+                        mapping[owner] = new
+                self._pool_changed.notify_all()
+
+        self._restore_state(new, snapshot)
+        logger.info(f"'{slot}' 드라이버 복구 완료: {snapshot.get('url', '(URL 없음)')}")
+        for listener in list(self._recovery_listeners):
             try:
-                logger.info("Chrome WebDriver 초기화를 시도합니다...")
-                self.driver = webdriver.Chrome(options=options)
-                logger.info("Chrome WebDriver 초기화 성공.")
+                listener(dead, new)
             except Exception as e:
-                logger.error(f"Chrome WebDriver 초기화 실패: {e}", exc_info=True)
-                raise
+                logger.error(f"복구 리스너 호출 중 오류: {e}", exc_info=True)
+        return new
+
+    def _restore_state(
+        self: "BrowserManager", driver: WebDriver, snapshot: dict[str, Any]
+    ) -> None:
+        """새 드라이버에 쿠키와 마지막으로 보던 페이지를 복원합니다.
+
+        Args:
+            driver: 새로 만든 드라이버입니다.
+            snapshot: 감시 스레드가 마지막으로 기록한 상태입니다.
+        """
+        try:
+            if driver is self.driver:
+                cookies = snapshot.get("cookies") or []
+                if cookies and not driver.get_cookies():
+                    # 영구 프로필이 없으면 쿠키를 직접 되살립니다.
+                    driver.get(f"{KREAM_ORIGIN}/robots.txt")
+                    for cookie in cookies:
+                        cookie.pop("sameSite", None)
+                        driver.add_cookie(cookie)
+            else:
+                self._share_session(driver)
+            url = snapshot.get("url", "")
+            if url.startswith("http"):
+                driver.get(url)
+        except WebDriverException as e:
+            logger.warning(f"드라이버 상태 복원 실패: {e}")
+
+    @staticmethod
+    def _quit_quietly(driver: RemoteWebDriver) -> None:
+        """오류를 무시하고 드라이버를 종료합니다."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _share_session(self: "BrowserManager", target: WebDriver) -> None:
+        """기본 드라이버의 KREAM 쿠키를 풀 드라이버에 복사합니다.
+
+        로그인은 기본 드라이버에서만 이루어지므로, 풀 드라이버가 로그인이 필요한 페이지를
+        열 수 있도록 쿠키를 동기화합니다. 쿠키가 바뀌지 않았다면 아무것도 하지 않습니다.
 
-        return self.driver
+        Args:
+            target: 쿠키를 받을 풀 드라이버입니다.
+        """
+        source = self.driver
+        if source is None or source is target:
+            return
+        try:
+            cookies = [
+                c for c in source.get_cookies() if "kream" in c.get("domain", "")
+            ]
+            snapshot = frozenset((c["name"], c["value"]) for c in cookies)
+            if not cookies or self._synced_cookies.get(id(target)) == snapshot:
+                return
+            if not target.current_url.startswith(KREAM_ORIGIN):
+                target.get(f"{KREAM_ORIGIN}/robots.txt")
+            for cookie in cookies:
+                cookie.pop("sameSite", None)
+                target.add_cookie(cookie)
+            self._synced_cookies[id(target)] = snapshot
+            logger.debug(f"풀 드라이버에 쿠키 {len(cookies)}개를 동기화했습니다.")
+        except WebDriverException as e:
+            logger.warning(f"풀 드라이버 쿠키 동기화 실패: {e}")
 
     def quit(self: "BrowserManager") -> None:
-        """WebDriver를 종료하고 모든 관련 창을 닫습니다."""
+        """기본 드라이버와 풀 드라이버를 모두 종료합니다."""
+        self._watchdog_stop.set()
+        if self._http is not None:
+            self._http.close()
+        summary = page_load_summary()
+        if summary:
+            logger.info(f"페이지 로드 통계 (유형/차단 프로필별): {summary}")
+        report_path = command_stats.write_report()
+        if report_path:
+            logger.info(
+                "WebDriver 명령 통계 상위 (태그: 횟수, 총 ms): "
+                f"{command_stats.top_tags()} → {report_path}"
+            )
+        cache_summary = read_cache.summary()
+        if cache_summary["hits"]:
+            logger.info(f"WebDriver 조회 캐시 통계: {cache_summary}")
+        dead = self.selectors.dead_selectors()
+        if dead:
+            logger.warning(f"적중하지 않게 된 선택자 (사이트 구조 변경 의심): {dead}")
+        unused = self.selectors.unused_selectors()
+        if unused:
+            logger.debug(f"한 번도 적중하지 않은 대체 선택자: {unused}")
+        self.selectors.save()
+        with self._lock:
+            pool, self._pool = self._pool, []
+            self._leases.clear()
+            self._affinity.clear()
+            self._synced_cookies.clear()
+            self._slots.clear()
+            self._snapshots.clear()
+            self._tab_managers.clear()
+        for driver in pool:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"풀 드라이버 종료 중 오류: {e}")
         if self.driver:
             logger.info("WebDriver를 종료합니다.")  # 종료 로그 추가
             self.driver.quit()
@@ -0,0 +1,35 @@
+"""작업 취소 요청을 전달하는 토큰과 예외입니다.
+
+Qt에 의존하지 않으므로 Selenium 보조 함수처럼 낮은 수준의 모듈에서도 사용할 수
+있습니다. 토큰을 만들고 작업을 실행하는 쪽은 `task_runner.TaskRunner`입니다.
+"""
+
+from __future__ import annotations
+
+import threading
+
+
+class TaskCancelled(Exception):
+    """작업이 취소 토큰을 확인하다 중단되었을 때 발생하는 예외입니다."""
+
+
+class CancellationToken:
+    """작업 하나의 취소 요청을 전달합니다."""
+
+    def __init__(self: "CancellationToken") -> None:
+        """CancellationToken을 초기화합니다."""
+        self._event = threading.Event()
+
+    def cancel(self: "CancellationToken") -> None:
+        """작업 취소를 요청합니다."""
+        self._event.set()
+
+    @property
+    def cancelled(self: "CancellationToken") -> bool:
+        """취소가 요청되었으면 True입니다."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self: "CancellationToken") -> None:
+        """취소가 요청되었으면 TaskCancelled를 발생시킵니다."""
+        if self._event.is_set():
+            raise TaskCancelled()
@@ -0,0 +1,213 @@
+"""WebDriver 명령 수와 소요 시간을 호출한 플러그인/함수별로 집계합니다.
+
+검색 한 번, 상세 조회 한 번, 매크로 반복 한 번이 WebDriver 명령을 몇 개 보내고 어디에서
+시간이 걸리는지 확인하기 위한 선택 기능입니다(`[Browser] instrument_commands`).
+Selenium의 모든 명령(find_element, execute_script, get, current_url 등)은 결국
+`WebDriver.execute()`를 거치므로, 드라이버 인스턴스의 `execute`를 감싸 명령마다
+(태그, 명령) 단위로 횟수/총 시간/최대 시간/오류 수를 누적합니다.
+
+태그는 `command_scope()`로 지정한 이름이 있으면 그 이름을, 없으면 호출 스택에서
+Selenium과 src.core 밖의 첫 번째 함수("search_plugin.search" 형식)를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from src.core.logger_setup import LOG_DIR, setup_logger
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+# 호출자 태그를 찾을 때 건너뛸 모듈 접두사 (드라이버/헬퍼 내부 프레임)
+_SKIPPED_MODULES = ("selenium.", "src.core.", "contextlib", "threading")
+_MAX_STACK_DEPTH = 30
+# 실행 중 태그별 상위 통계를 DEBUG로 남기는 명령 수 간격
+SUMMARY_LOG_INTERVAL = 500
+
+# (태그, 명령) → [횟수, 총 ms, 최대 ms, 오류 수]
+_stats: dict[tuple[str, str], list[float]] = {}
+_stats_lock = threading.Lock()
+_recorded = 0
+_scopes = threading.local()
+_started_at = datetime.datetime.now()
+
+
+def instrument(driver: WebDriver) -> WebDriver:
+    """드라이버의 모든 명령을 집계하도록 `execute`를 감쌉니다.
+
+    같은 드라이버에 여러 번 호출해도 한 번만 감쌉니다.
+
+    Args:
+        driver: 계측할 WebDriver 인스턴스입니다.
+
+    Returns:
+        같은 드라이버 인스턴스입니다 (isinstance 검사와 기존 호출 코드가 그대로 동작).
+    """
+    if getattr(driver, "_command_stats_instrumented", False):
+        return driver
+    original = driver.execute
+
+    def execute(driver_command: str, params: Optional[dict] = None) -> Any:
+        tag = _caller_tag()
+        started = time.perf_counter()
+        failed = False
+        try:
+            return original(driver_command, params)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            _record(tag, driver_command, (time.perf_counter() - started) * 1000, failed)
+
+    # 인스턴스 속성으로 덮어쓰므로 WebElement 명령(parent.execute)도 함께 집계됩니다.
+    setattr(driver, "execute", execute)
+    setattr(driver, "_command_stats_instrumented", True)
+    logger.debug(f"WebDriver 명령 계측 활성화: {driver.session_id}")
+    return driver
+
+
+@contextmanager
+def command_scope(tag: str) -> Iterator[None]:
+    """이 블록 안에서 현재 스레드가 보내는 명령을 tag로 집계합니다.
+
+    중첩하면 가장 안쪽 태그를 사용합니다.
+
+    Args:
+        tag: 집계에 사용할 이름입니다 (예: "macro.iteration").
+    """
+    stack = getattr(_scopes, "stack", None)
+    if stack is None:
+        stack = _scopes.stack = []
+    stack.append(tag)
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+def _caller_tag() -> str:
+    """현재 명령을 보낸 플러그인/함수 이름을 찾습니다."""
+    stack = getattr(_scopes, "stack", None)
+    if stack:
+        return str(stack[-1])
+    frame: Optional[FrameType] = sys._getframe(2)
+    for _ in range(_MAX_STACK_DEPTH):
+        if frame is None:
+            break
+        module = str(frame.f_globals.get("__name__", ""))
+        if not module.startswith(_SKIPPED_MODULES):
+            return f"{module.rsplit('.', 1)[-1]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _record(tag: str, command: str, elapsed_ms: float, failed: bool) -> None:
+    """명령 한 건의 결과를 누적하고, SUMMARY_LOG_INTERVAL번마다 상위 태그를 남깁니다."""
+    global _recorded
+    with _stats_lock:
+        entry = _stats.setdefault((tag, command), [0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+        if failed:
+            entry[3] += 1
+        _recorded += 1
+        recorded = _recorded
+    if recorded % SUMMARY_LOG_INTERVAL == 0:
+        logger.debug(
+            f"WebDriver 명령 {recorded}개 누적, 상위 태그 (횟수, 총 ms): {top_tags()}"
+        )
+
+
+def summary() -> dict[str, dict[str, Any]]:
+    """태그별 명령 통계를 총 소요 시간이 큰 순서로 반환합니다.
+
+    Returns:
+        태그 → {"count", "total_ms", "commands": {명령 → {count, total_ms,
+        avg_ms, max_ms, errors}}} 딕셔너리입니다.
+    """
+    with _stats_lock:
+        items = [(key, list(value)) for key, value in _stats.items()]
+
+    tags: dict[str, dict[str, Any]] = {}
+    for (tag, command), (count, total, peak, errors) in items:
+        entry = tags.setdefault(tag, {"count": 0, "total_ms": 0.0, "commands": {}})
+        entry["count"] += int(count)
+        entry["total_ms"] += total
+        entry["commands"][command] = {
+            "count": int(count),
+            "total_ms": round(total, 1),
+            "avg_ms": round(total / count, 1) if count else 0.0,
+            "max_ms": round(peak, 1),
+            "errors": int(errors),
+        }
+    for entry in tags.values():
+        entry["total_ms"] = round(entry["total_ms"], 1)
+        entry["commands"] = dict(
+            sorted(entry["commands"].items(), key=lambda kv: -kv[1]["total_ms"])
+        )
+    return dict(sorted(tags.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+
+def top_tags(limit: int = 10) -> dict[str, tuple[int, float]]:
+    """총 소요 시간이 큰 태그부터 limit개의 (횟수, 총 ms)를 반환합니다."""
+    return {
+        tag: (entry["count"], entry["total_ms"])
+        for tag, entry in list(summary().items())[:limit]
+    }
+
+
+def reset() -> None:
+    """누적된 통계를 비웁니다."""
+    global _recorded
+    with _stats_lock:
+        _stats.clear()
+        _recorded = 0
+
+
+def write_report(path: Optional[str] = None) -> Optional[str]:
+    """현재 세션의 명령 통계를 JSON 파일로 저장합니다.
+
+    Args:
+        path: 저장할 경로입니다. None이면 로그 디렉토리에
+            "commands_<세션 시작 시각>.json"으로 저장합니다.
+
+    Returns:
+        저장한 파일 경로이거나, 기록된 명령이 없거나 저장에 실패하면 None입니다.
+    """
+    report = summary()
+    if not report:
+        return None
+    if path is None:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = os.path.join(
+            LOG_DIR, f"commands_{_started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        )
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "started_at": _started_at.isoformat(timespec="seconds"),
+                    "written_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                    "tags": report,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+    except OSError as e:
+        logger.warning(f"WebDriver 명령 통계 저장 실패: {e}")
+        return None
+    return path
@@ -71,7 +71,53 @@ class ConfigManager:
         logger.debug(f"User-agent 설정: {user_agent}")
 
         # Default settings
-        self.cfg["Browser"] = {"user_agent": user_agent, "headless": "yes"}
+        self.cfg["Browser"] = {
+            "user_agent": user_agent,
+            "headless": "yes",
+            "page_load_strategy": "eager",
+            "pool_size": "3",
+            "lease_timeout": "60",
+            "persistent_profile": "yes",
+            "prewarm": "yes",
+            "prewarm_pool": "yes",
+            "blocking_profile": "light",
+            "pool_blocking_profile": "scraping",
+            "network_capture": "yes",
+            "watchdog_interval": "10",
+            "watchdog_timeout": "30",
+            "watchdog_failures": "3",
+            "instrument_commands": "no",
+            "read_cache_ttl": "0.5",
+            "task_threads": "4",
+        }
+        self.cfg["Http"] = {
+            "enabled": "yes",
+            "timeout": "5",
+            "cookie_sync_interval": "30",
+        }
+        self.cfg["Search"] = {
+            "stream_results": "yes",
+            "max_results": "200",
+            "stream_timeout": "30",
+            "scroll_wait": "3",
+            "prefetch_ahead": "4",
+            "prefetch_behind": "1",
+            "prefetch_workers": "4",
+            "search_as_you_type": "yes",
+            "debounce_ms": "400",
+            "min_query_length": "2",
+        }
+        self.cfg["Cache"] = {
+            "search_enabled": "yes",
+            "search_ttl": "600",
+            "search_max_age": "86400",
+            "search_max_entries": "200",
+            "detail_enabled": "yes",
+            "detail_static_ttl": "604800",
+            "detail_price_ttl": "60",
+        }
+        self.cfg["Catalog"] = {"enabled": "yes", "max_results": "50"}
+        self.cfg["Batch"] = {"workers": "2", "progress_interval": "5"}
         self.cfg["Macro"] = {"min_interval": "8", "max_interval": "18"}
         logger.debug(
             f"기본 설정: Browser={self.cfg['Browser']}, Macro={self.cfg['Macro']}"
@@ -146,3 +192,22 @@ class ConfigManager:
         raise KeyError(
             f"옵션 {option}이 섹션 {section}에 없고 대체 값이 제공되지 않았습니다."
         )
+
+
+def get_cache_dir(config: configparser.ConfigParser, *parts: str) -> str:
+    """캐시 파일을 저장할 디렉토리 경로를 반환하고, 없으면 생성합니다.
+
+    기본 위치는 로그 디렉토리와 마찬가지로 현재 작업 디렉토리 아래의 'cache'이며,
+    설정 파일의 [Cache] dir 옵션으로 변경할 수 있습니다.
+
+    Args:
+        config: ConfigParser 인스턴스입니다.
+        *parts: 캐시 디렉토리 아래의 하위 경로 요소입니다.
+
+    Returns:
+        생성된(또는 이미 존재하는) 디렉토리의 경로입니다.
+    """
+    base_dir = config.get("Cache", "dir", fallback="cache") or "cache"
+    path = os.path.join(base_dir, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
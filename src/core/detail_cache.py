@@ -0,0 +1,183 @@
+"""제품 ID별 상세 정보를 필드마다 다른 유효 시간(TTL)으로 SQLite에 캐시합니다.
+
+모델번호/출시일/색상/발매가/사이즈 목록은 거의 바뀌지 않으므로 오래 보관하고,
+최근 거래가/등락처럼 자주 바뀌는 가격 필드는 짧게 보관합니다. 필드마다 저장 시각을
+따로 기록하므로 호출자는 오래된 필드만 골라 다시 조회할 수 있습니다.
+
+TTL은 `[Cache] detail_static_ttl`(고정 필드), `detail_price_ttl`(가격 필드)로 정하며,
+`detail_ttl_<필드>`로 필드 하나의 TTL만 바꿀 수도 있습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping, NamedTuple, Optional
+
+from src.core.config import get_cache_dir
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+DB_FILE_NAME = "details.sqlite3"
+
+# 거의 바뀌지 않는 필드
+STATIC_FIELDS = ("model_no", "release_date", "color", "release_price", "sizes")
+# 자주 바뀌는 가격 필드
+PRICE_FIELDS = ("recent_price", "fluctuation", "fluctuation_type")
+# 값이 없음을 뜻하는 표시. 렌더링이 덜 된 화면에서 읽은 "N/A" 등을 fresh 값으로
+# 오래 보관하지 않도록 저장하지 않습니다. 빈 사이즈 목록은 "사이즈 없음"이므로
+# 저장합니다(읽지 못한 경우에는 sizes 키가 없습니다).
+_MISSING: tuple[Any, ...] = (None, "", "N/A", "-")
+# 빈 문자열도 유효한 값인 필드 → 그 값을 정하는 필드. 등락이 없으면 등락 종류는
+# ""이므로 등락 값이 있을 때에만 저장합니다.
+_DERIVED_FIELDS = {"fluctuation_type": "fluctuation"}
+
+
+def _is_missing(detail: Mapping[str, Any], field: str) -> bool:
+    """detail의 field 값이 없음을 뜻하는지 확인합니다."""
+    source = _DERIVED_FIELDS.get(field)
+    if source is not None:
+        return detail.get(field) is None or detail.get(source) in _MISSING
+    return detail.get(field) in _MISSING
+
+
+class CachedDetail(NamedTuple):
+    """캐시 조회 결과입니다."""
+
+    values: Dict[str, Any]
+    # TTL이 지났거나 저장된 적이 없는 필드
+    stale: FrozenSet[str]
+
+
+class DetailCache:
+    """제품 ID → 필드별 값과 저장 시각을 보관하는 SQLite 캐시입니다."""
+
+    def __init__(
+        self: "DetailCache", path: Optional[str], ttls: Mapping[str, float]
+    ) -> None:
+        """DetailCache를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로입니다. None이면 메모리에만 저장합니다.
+            ttls: 필드 → 유효 시간(초)입니다. 여기 있는 필드만 저장합니다.
+        """
+        self.ttls = dict(ttls)
+        self._lock = threading.Lock()
+        try:
+            # 상세 조회 작업 스레드와 백그라운드 갱신 스레드에서 함께 씁니다.
+            self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        except sqlite3.Error as e:
+            logger.warning(f"상세 정보 캐시 DB를 열 수 없어 메모리만 사용합니다: {e}")
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS details ("
+            "product_id TEXT NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, PRIMARY KEY (product_id, field))"
+        )
+        self._db.commit()
+
+    def get(self: "DetailCache", product_id: str) -> Optional[CachedDetail]:
+        """제품의 캐시된 필드를 반환합니다.
+
+        TTL이 지난 필드도 값은 그대로 돌려주고 stale에 표시합니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+
+        Returns:
+            CachedDetail이거나, 저장된 필드가 하나도 없으면 None입니다.
+        """
+        with self._lock:
+            try:
+                rows = self._db.execute(
+                    "SELECT field, value, stored_at FROM details WHERE product_id = ?",
+                    (product_id,),
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"상세 정보 캐시 읽기 실패 ({product_id}): {e}")
+                return None
+        if not rows:
+            return None
+
+        now = time.time()
+        values: Dict[str, Any] = {}
+        fresh = set()
+        for field, value, stored_at in rows:
+            if field not in self.ttls:
+                continue
+            try:
+                values[field] = json.loads(value)
+            except ValueError:
+                continue
+            if now - stored_at <= self.ttls[field]:
+                fresh.add(field)
+        return CachedDetail(values, frozenset(self.ttls) - fresh)
+
+    def put(self: "DetailCache", product_id: str, detail: Mapping[str, Any]) -> None:
+        """상세 정보의 필드를 저장합니다. 비어 있는 필드는 기존 값을 유지합니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+            detail: DetailPlugin.get_details() 형식의 결과입니다.
+        """
+        if "error" in detail:
+            return
+        now = time.time()
+        rows = [
+            (product_id, field, json.dumps(detail[field], ensure_ascii=False), now)
+            for field in self.ttls
+            if not _is_missing(detail, field)
+        ]
+        with self._lock:
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?)", rows
+                )
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"상세 정보 캐시 저장 실패 ({product_id}): {e}")
+
+    def invalidate(self: "DetailCache", product_id: str) -> None:
+        """제품의 캐시를 지웁니다."""
+        with self._lock:
+            try:
+                self._db.execute(
+                    "DELETE FROM details WHERE product_id = ?", (product_id,)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"상세 정보 캐시 삭제 실패 ({product_id}): {e}")
+
+    def close(self: "DetailCache") -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._db.close()
+
+
+def create_detail_cache(config: ConfigParser) -> Optional[DetailCache]:
+    """설정에 따라 DetailCache를 만듭니다.
+
+    Args:
+        config: 설정 파서 인스턴스입니다.
+
+    Returns:
+        DetailCache 인스턴스이거나, `[Cache] detail_enabled`가 꺼져 있으면 None입니다.
+    """
+    if not config.getboolean("Cache", "detail_enabled", fallback=True):
+        return None
+    static_ttl = config.getfloat("Cache", "detail_static_ttl", fallback=604800)
+    price_ttl = config.getfloat("Cache", "detail_price_ttl", fallback=60)
+    ttls = {
+        field: config.getfloat("Cache", f"detail_ttl_{field}", fallback=default)
+        for fields, default in ((STATIC_FIELDS, static_ttl), (PRICE_FIELDS, price_ttl))
+        for field in fields
+    }
+    return DetailCache(os.path.join(get_cache_dir(config), DB_FILE_NAME), ttls)
@@ -0,0 +1,135 @@
+"""ChromeDriver 설치 경로를 디스크에 캐시합니다.
+
+`chromedriver_autoinstaller.install()`은 호출될 때마다 Chrome 버전을 확인하고
+일치하는 드라이버 버전을 네트워크로 조회합니다. 이 모듈은 설치된 Chrome의 파일 정보
+(경로와 수정 시각)를 지문으로 저장해 두고, 지문이 그대로라면 stat 한 번으로
+이전에 설치한 드라이버 경로를 돌려줍니다. Chrome이 업데이트된 경우에만 버전을 다시
+확인하며, 해당 메이저 버전의 드라이버가 이미 있으면 네트워크 없이 재사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from typing import TYPE_CHECKING, Any, Optional
+
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from ..stubs import chromedriver_autoinstaller
+else:
+    import chromedriver_autoinstaller
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+CACHE_FILE_NAME = "chromedriver.json"
+
+
+def _chrome_install_path() -> Optional[str]:
+    """현재 플랫폼에서 Chrome 설치 위치(지문 계산 대상)를 찾습니다.
+
+    Returns:
+        macOS/Linux는 Chrome 실행 파일, Windows는 버전별 폴더가 생기는
+        Application 디렉토리 경로입니다. 찾지 못하면 None을 반환합니다.
+    """
+    if sys.platform == "darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    elif sys.platform == "win32":
+        candidates = [
+            os.path.join(root, "Google", "Chrome", "Application")
+            for root in (
+                os.environ.get("PROGRAMW6432") or os.environ.get("PROGRAMFILES"),
+                os.environ.get("PROGRAMFILES(X86)"),
+                os.environ.get("LOCALAPPDATA"),
+            )
+            if root
+        ]
+    else:
+        candidates = [
+            found
+            for name in ("google-chrome", "google-chrome-stable", "chromium")
+            if (found := shutil.which(name))
+        ]
+
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _fingerprint() -> Optional[list[Any]]:
+    """Chrome 설치 상태의 지문(경로, 수정 시각)을 계산합니다."""
+    path = _chrome_install_path()
+    if not path:
+        return None
+    try:
+        return [path, os.stat(path).st_mtime_ns]
+    except OSError:
+        return None
+
+
+def _load(cache_file: str) -> dict[str, Any]:
+    """캐시 파일을 읽습니다. 없거나 손상된 경우 빈 딕셔너리를 반환합니다."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(cache_file: str, data: dict[str, Any]) -> None:
+    """캐시 파일을 저장합니다. 실패해도 드라이버 실행에는 영향을 주지 않습니다."""
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning(f"ChromeDriver 캐시 저장 실패: {e}")
+
+
+def resolve_chromedriver(cache_dir: str) -> Optional[str]:
+    """현재 설치된 Chrome에 맞는 ChromeDriver 실행 파일 경로를 반환합니다.
+
+    Args:
+        cache_dir: 캐시 파일과 드라이버를 저장할 디렉토리입니다.
+
+    Returns:
+        ChromeDriver 실행 파일 경로이거나, 확인/설치에 실패한 경우 None입니다.
+    """
+    cache_file = os.path.join(cache_dir, CACHE_FILE_NAME)
+    data = _load(cache_file)
+    drivers: dict[str, str] = data.get("drivers", {})
+    fingerprint = _fingerprint()
+
+    # 1) 지문이 같으면 버전 확인 없이 바로 재사용
+    if fingerprint and data.get("fingerprint") == fingerprint:
+        cached = drivers.get(str(data.get("chrome_major")))
+        if cached and os.path.isfile(cached):
+            logger.debug(f"ChromeDriver 캐시 적중: {cached}")
+            return cached
+
+    # 2) Chrome 버전이 바뀌었거나 지문을 계산할 수 없으면 버전을 다시 확인
+    version = chromedriver_autoinstaller.get_chrome_version()
+    major = version.split(".")[0] if version else None
+    driver_path = drivers.get(major) if major else None
+
+    if driver_path and os.path.isfile(driver_path):
+        logger.info(f"Chrome {major} 용 ChromeDriver를 캐시에서 재사용합니다.")
+    else:
+        logger.info(
+            f"Chrome {major or '(버전 미확인)'} 용 ChromeDriver를 설치합니다..."
+        )
+        driver_path = chromedriver_autoinstaller.install(path=cache_dir)
+        if not driver_path:
+            return None
+
+    if major:
+        drivers[major] = driver_path
+    _save(
+        cache_file,
+        {"fingerprint": fingerprint, "chrome_major": major, "drivers": drivers},
+    )
+    return driver_path
@@ -0,0 +1,199 @@
+"""WebDriver 쿠키를 공유하는 KREAM HTTP 클라이언트입니다.
+
+로그인 확인이나 제품 상세/사이즈 조회처럼 렌더링된 페이지가 필요 없는 읽기 작업은
+브라우저로 페이지를 여는 대신 keep-alive 연결을 재사용하는 `requests.Session`으로
+처리합니다. 세션 쿠키는 기본 WebDriver에서 복사하며, 주기적으로 또는 로그인/로그아웃/
+드라이버 재생성 직후에 다시 동기화합니다. 모든 메서드는 실패 시 None(또는 빈 값)을
+반환하므로, 호출자는 기존 브라우저 경로로 대체합니다.
+
+`[Http] web_base`/`api_base` 설정으로 요청 대상을 바꿀 수 있어 로컬 스텁 서버로
+동작을 확인할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.logger_setup import setup_logger
+from src.core.network_capture import parse_product_detail
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+    from src.core.browser import BrowserManager
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+DEFAULT_WEB_BASE = "https://kream.co.kr"
+DEFAULT_API_BASE = "https://api.kream.co.kr"
+
+
+class KreamHttpClient:
+    """기본 WebDriver의 쿠키로 인증된 HTTP 요청을 보냅니다."""
+
+    def __init__(
+        self: "KreamHttpClient", browser: BrowserManager, config: ConfigParser
+    ) -> None:
+        """KreamHttpClient를 초기화합니다.
+
+        Args:
+            browser: 쿠키를 가져올 BrowserManager 인스턴스입니다.
+            config: 설정 파서 인스턴스입니다.
+        """
+        self.browser = browser
+        self.web_base = config.get("Http", "web_base", fallback=DEFAULT_WEB_BASE)
+        self.api_base = config.get("Http", "api_base", fallback=DEFAULT_API_BASE)
+        self.timeout = config.getfloat("Http", "timeout", fallback=5)
+        self.cookie_sync_interval = config.getfloat(
+            "Http", "cookie_sync_interval", fallback=30
+        )
+        self.session_path = config.get("Http", "session_path", fallback="/api/m/me")
+        self.enabled = config.getboolean("Http", "enabled", fallback=True)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=config.getint("Http", "pool_maxsize", fallback=8),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        user_agent = config.get("Browser", "user_agent", fallback=None)
+        if user_agent:
+            # 브라우저와 같은 User-Agent를 써야 세션 쿠키가 그대로 인정됩니다.
+            self.session.headers["User-Agent"] = user_agent
+        self.session.headers["Accept"] = "application/json, text/plain, */*"
+
+        self._lock = threading.Lock()
+        self._synced_at = 0.0
+        browser.add_recovery_listener(lambda _dead, _new: self.invalidate())
+
+    def invalidate(self: "KreamHttpClient") -> None:
+        """다음 요청 전에 쿠키를 다시 동기화하도록 표시합니다."""
+        self._synced_at = 0.0
+
+    def sync_cookies(self: "KreamHttpClient", force: bool = False) -> bool:
+        """기본 WebDriver의 KREAM 쿠키를 세션에 복사합니다.
+
+        Args:
+            force: True이면 동기화 주기와 상관없이 즉시 복사합니다.
+
+        Returns:
+            세션 쿠키가 준비되었으면 True, 드라이버가 없거나 실패하면 False입니다.
+        """
+        with self._lock:
+            if (
+                not force
+                and self._synced_at
+                and time.monotonic() - self._synced_at < self.cookie_sync_interval
+            ):
+                return True
+            driver = self.browser.driver
+            if driver is None:
+                return False
+            try:
+                cookies = driver.get_cookies()
+            except Exception as e:
+                logger.debug(f"WebDriver 쿠키 읽기 실패: {e}")
+                return False
+
+            self.session.cookies.clear()
+            host = urllib.parse.urlparse(self.web_base).hostname or ""
+            for cookie in cookies:
+                domain = cookie.get("domain", "").lstrip(".")
+                if not (host.endswith(domain) or domain.endswith(host)):
+                    continue
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain"),
+                    path=cookie.get("path", "/"),
+                )
+            self._synced_at = time.monotonic()
+            logger.debug(f"HTTP 세션에 쿠키 {len(self.session.cookies)}개 동기화")
+            return True
+
+    def _request(
+        self: "KreamHttpClient", url: str, **kwargs: Any
+    ) -> Optional[requests.Response]:
+        """쿠키를 동기화한 뒤 GET 요청을 보냅니다. 실패하면 None을 반환합니다."""
+        if not self.enabled or not self.sync_cookies():
+            return None
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            logger.debug(f"HTTP 요청 실패 ({url}): {e}")
+            return None
+        logger.debug(
+            f"HTTP {response.status_code} {url} "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+        return response
+
+    def get_json(
+        self: "KreamHttpClient", path: str, params: Optional[dict[str, Any]] = None
+    ) -> Any:
+        """API 경로에 GET 요청을 보내 JSON 응답을 반환합니다.
+
+        Args:
+            path: api_base 기준 경로입니다 (예: "/api/p/products/12345").
+            params: 쿼리 파라미터입니다.
+
+        Returns:
+            파싱된 JSON이거나, 요청/응답이 올바르지 않으면 None입니다.
+        """
+        response = self._request(f"{self.api_base}{path}", params=params)
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def is_logged_in(self: "KreamHttpClient") -> Optional[bool]:
+        """계정 API 응답 코드로 로그인 여부를 확인합니다.
+
+        웹 페이지는 로그아웃 상태에서도 200으로 응답한 뒤 스크립트로 이동하므로,
+        `[Http] session_path` API의 상태 코드로 판단합니다.
+
+        Returns:
+            로그인 상태이면 True, 인증 오류(401/403)이면 False,
+            판단할 수 없으면 None입니다.
+        """
+        response = self._request(
+            f"{self.api_base}{self.session_path}", allow_redirects=False
+        )
+        if response is None:
+            return None
+        if response.status_code == 200:
+            return True
+        if response.status_code in (401, 403):
+            return False
+        return None
+
+    def product_detail(self: "KreamHttpClient", product_id: str) -> dict[str, Any]:
+        """제품 상세 API에서 가격/속성/사이즈 정보를 가져옵니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+
+        Returns:
+            network_capture.parse_product_detail() 형식의 딕셔너리입니다.
+            실패하면 빈 딕셔너리입니다.
+        """
+        path = f"/api/p/products/{product_id}"
+        payload = self.get_json(path)
+        if payload is None:
+            return {}
+        return parse_product_detail([(f"{self.api_base}{path}", payload)], product_id)
+
+    def close(self: "KreamHttpClient") -> None:
+        """연결 풀을 닫습니다."""
+        self.session.close()
@@ -0,0 +1,109 @@
+"""제품 썸네일을 백그라운드에서 내려받아 디코딩해 둡니다.
+
+검색 결과를 넘길 때마다 UI 스레드에서 `requests.get`으로 이미지를 받으면 화면이
+멈추므로, 컨트롤러가 현재 결과 주변의 썸네일을 미리 요청하고 이 모듈이 작업 스레드에서
+내려받아 `QImage`로 디코딩해 보관합니다. (`QPixmap`은 GUI 스레드에서만 만들 수 있으므로
+`QImage`로 보관하고 표시할 때 변환합니다.) 준비된 이미지는 `image_ready` 시그널로 알립니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import requests
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from src.core.logger_setup import setup_logger
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+
+class ImagePrefetcher(QObject):
+    """URL별 썸네일을 내려받아 디코딩된 QImage로 LRU 보관합니다."""
+
+    # (URL, 디코딩된 이미지). 실패하면 null QImage입니다.
+    image_ready = pyqtSignal(str, QImage)
+
+    def __init__(
+        self: "ImagePrefetcher",
+        max_workers: int = 4,
+        max_images: int = 64,
+        timeout: float = 5,
+    ) -> None:
+        """ImagePrefetcher를 초기화합니다.
+
+        Args:
+            max_workers: 동시에 내려받을 최대 이미지 수입니다.
+            max_images: 메모리에 보관할 최대 이미지 수입니다.
+            timeout: 이미지 하나의 요청 제한 시간(초)입니다.
+        """
+        super().__init__()
+        self.max_images = max(1, max_images)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="thumbnail"
+        )
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._images: OrderedDict[str, QImage] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+
+    def get(self: "ImagePrefetcher", url: str) -> Optional[QImage]:
+        """이미 디코딩된 이미지를 반환합니다. 없으면 None입니다 (내려받지 않음)."""
+        with self._lock:
+            image = self._images.get(url)
+            if image is not None:
+                self._images.move_to_end(url)
+            return image
+
+    def request(self: "ImagePrefetcher", url: str) -> Optional[QImage]:
+        """이미지를 반환하거나, 없으면 내려받기를 시작하고 None을 반환합니다.
+
+        내려받기가 끝나면 image_ready 시그널이 발생합니다.
+        """
+        image = self.get(url)
+        if image is None:
+            self.prefetch([url])
+        return image
+
+    def prefetch(self: "ImagePrefetcher", urls: Iterable[Optional[str]]) -> None:
+        """주어진 순서대로 아직 없는 이미지의 내려받기를 예약합니다.
+
+        Args:
+            urls: 미리 받을 이미지 URL 목록입니다 (가까운 것부터). None은 건너뜁니다.
+        """
+        with self._lock:
+            for url in urls:
+                if not url or url in self._images or url in self._pending:
+                    continue
+                self._pending[url] = self._executor.submit(self._download, url)
+
+    def _download(self: "ImagePrefetcher", url: str) -> None:
+        """이미지를 내려받아 디코딩하고 보관합니다. 작업 스레드에서 실행됩니다."""
+        image = QImage()
+        try:
+            response = self._session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            if not image.loadFromData(response.content):
+                logger.debug(f"썸네일 디코딩 실패: {url}")
+        except requests.RequestException as e:
+            logger.debug(f"썸네일 내려받기 실패 ({url}): {e}")
+
+        with self._lock:
+            self._pending.pop(url, None)
+            if not image.isNull():
+                self._images[url] = image
+                self._images.move_to_end(url)
+                while len(self._images) > self.max_images:
+                    self._images.popitem(last=False)
+        self.image_ready.emit(url, image)
+
+    def shutdown(self: "ImagePrefetcher") -> None:
+        """대기 중인 내려받기를 취소하고 작업 스레드를 정리합니다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
@@ -5,14 +5,21 @@ UI와 플러그인 간의 상호작용을 관리합니다.
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from src.core.cancellation import CancellationToken
+from src.core.image_prefetcher import ImagePrefetcher
 
 # logger_setup 임포트
 from src.core.logger_setup import setup_logger
+from src.core.task_runner import TaskRunner
 
 from ..plugins import DetailPlugin, LoginPlugin, MacroPlugin, SearchPlugin
+from ..plugins.search import BatchLookup
 from .plugin_manager import PluginManager
 
 if TYPE_CHECKING:
@@ -34,6 +41,9 @@ class MainController(QObject):
     sizes_ready = pyqtSignal(list)
     log_message = pyqtSignal(str)  # UI 로깅용
     macro_status_changed = pyqtSignal(bool)
+    browser_status = pyqtSignal(str)  # 브라우저 예열 진행 상황
+    thumbnail_ready = pyqtSignal(str, QImage)  # 미리 받은 제품 썸네일
+    batch_finished = pyqtSignal(str, int, int)  # 일괄 조회 (출력 경로, 성공, 실패)
 
     def __init__(
         self: MainController,
@@ -79,6 +89,31 @@ class MainController(QObject):
         self.current_product_id: Optional[str] = None
         self._current_email: Optional[str] = None
 
+        # 검색 결과 주변 썸네일 미리 받기 (페이지 이동 방향으로 더 많이)
+        config = plugin_manager.config
+        self.prefetch_ahead = config.getint("Search", "prefetch_ahead", fallback=4)
+        self.prefetch_behind = config.getint("Search", "prefetch_behind", fallback=1)
+        self._page_direction = 1
+        self.thumbnails = ImagePrefetcher(
+            max_workers=config.getint("Search", "prefetch_workers", fallback=4)
+        )
+        self.thumbnails.image_ready.connect(self.thumbnail_ready)
+
+        # 검색/상세 조회/로그인은 GUI 스레드를 막지 않도록 작업 스레드에서 실행합니다.
+        # "search" 그룹은 검색 드라이버를, "primary" 그룹은 기본 드라이버를 사용합니다.
+        self.tasks = TaskRunner(
+            max_threads=config.getint("Browser", "task_threads", fallback=4)
+        )
+        self.tasks.task_failed.connect(self._handle_task_failed)
+
+        # 검색어 목록 일괄 조회 (처음 실행할 때 만듭니다)
+        self.batch: Optional[BatchLookup] = None
+        self.batch_running = False
+        self.batch_progress_interval = config.getfloat(
+            "Batch", "progress_interval", fallback=5
+        )
+        self._batch_reported_at = 0.0
+
         # 플러그인 시그널 연결
         self._connect_plugin_signals()
 
@@ -105,9 +140,17 @@ class MainController(QObject):
 
         if self.search_plugin and hasattr(self.search_plugin, "search_result"):
             self.search_plugin.search_result.connect(self._handle_search_result)
+            self.search_plugin.search_progress.connect(self._handle_search_progress)
         else:  # 로깅 추가
             logger.warning("Search plugin or search_result signal not found.")
 
+        # 오래된 캐시 결과(검색 결과, 가격 필드)는 작업 실행기에서 낮은 우선순위로
+        # 다시 조회하므로 종료 시 함께 취소됩니다.
+        if self.search_plugin:
+            self.search_plugin.tasks = self.tasks
+        if self.detail_plugin:
+            self.detail_plugin.tasks = self.tasks
+
         if self.detail_plugin and hasattr(self.detail_plugin, "sizes_ready"):
             self.detail_plugin.sizes_ready.connect(self._handle_sizes_ready)
         else:  # 로깅 추가
@@ -165,6 +208,8 @@ class MainController(QObject):
             logger.debug(
                 f"[DEBUG CONTROLLER] 제품 ID 설정: {self.current_product_id}"
             )  # print -> logger.debug
+            if "info" not in result:
+                self._prefetch_neighbors()
         else:
             logger.error(
                 f"[DEBUG CONTROLLER] 수신된 검색 결과의 타입이 올바르지 않습니다: {type(result)}"
@@ -174,6 +219,138 @@ class MainController(QObject):
         # 검색 결과를 UI로 전달
         self.search_result_received.emit(result)
 
+    def thumbnail(self: MainController, url: str) -> Optional[QImage]:
+        """미리 받은 썸네일을 반환하고, 없으면 내려받기를 시작합니다.
+
+        Args:
+            url: 이미지 URL입니다.
+
+        Returns:
+            디코딩된 이미지이거나, 아직 없으면 None입니다 (준비되면
+            thumbnail_ready 시그널이 발생합니다).
+        """
+        return self.thumbnails.request(url)
+
+    def _prefetch_neighbors(self: MainController) -> None:
+        """현재 검색 결과 주변 제품의 썸네일을 가까운 순서로 미리 받습니다.
+
+        사용자가 넘기고 있는 방향으로는 prefetch_ahead개, 반대 방향으로는
+        prefetch_behind개를 받습니다.
+        """
+        if not self.search_plugin:
+            return
+        products = self.search_plugin.products
+        index = self.search_plugin.current_index
+        ahead, behind = self.prefetch_ahead, self.prefetch_behind
+        # 현재 제품의 썸네일을 가장 먼저 받습니다.
+        offsets = [0]
+        for step in range(1, max(ahead, behind) + 1):
+            if step <= ahead:
+                offsets.append(step * self._page_direction)
+            if step <= behind:
+                offsets.append(-step * self._page_direction)
+        self.thumbnails.prefetch(
+            products[index + offset].image_url
+            for offset in offsets
+            if 0 <= index + offset < len(products)
+        )
+
+    def _handle_search_progress(self: MainController, loaded: int, done: bool) -> None:
+        """검색 결과 스트리밍 진행 상황을 처리합니다.
+
+        Args:
+            loaded: 지금까지 로드된 검색 결과 수입니다.
+            done: 모든 결과를 로드했으면 True입니다.
+        """
+        logger.debug(f"검색 결과 {loaded}개 로드됨 (완료: {done})")
+        if done:
+            self.log_message.emit(f"검색 결과 {loaded}개를 모두 불러왔습니다.")
+
+    def _handle_task_failed(self: MainController, group: str, message: str) -> None:
+        """백그라운드 작업이 예외로 끝났을 때 UI에 알립니다.
+
+        Args:
+            group: 작업 그룹 이름입니다.
+            message: 오류 메시지입니다.
+        """
+        self.log_message.emit(f"작업 중 오류 발생 ({group}): {message}")
+        if group == "batch":
+            self.batch_running = False
+            self.batch_finished.emit("", 0, 0)
+
+    def start_batch(self: MainController, input_path: str, output_path: str) -> bool:
+        """작업 스레드에서 검색어 목록 파일을 일괄 조회합니다.
+
+        Args:
+            input_path: 검색어(또는 모델번호) 목록 CSV/텍스트 파일 경로입니다.
+            output_path: 결과를 기록할 CSV 경로입니다.
+
+        Returns:
+            일괄 조회를 시작했으면 True입니다.
+        """
+        if self.batch_running:
+            self.log_message.emit("일괄 조회가 이미 실행 중입니다.")
+            return False
+        if self.batch is None:
+            self.batch = BatchLookup(
+                self.plugin_manager.browser,
+                self.plugin_manager.config,
+                self.search_plugin.cache if self.search_plugin else None,
+                self.detail_plugin.cache if self.detail_plugin else None,
+            )
+            self.batch.progress.connect(self._handle_batch_progress)
+            self.batch.finished.connect(self._handle_batch_finished)
+
+        batch = self.batch
+        self.batch_running = True
+        self._batch_reported_at = 0.0
+        self.log_message.emit(f"일괄 조회를 시작합니다: {input_path}")
+        self.tasks.submit(
+            "batch", lambda token: batch.run(input_path, output_path, token)
+        )
+        return True
+
+    def cancel_batch(self: MainController) -> None:
+        """실행 중인 일괄 조회를 중단합니다. 진행 중인 항목까지는 기록됩니다."""
+        if self.batch_running:
+            self.tasks.cancel("batch")
+            self.log_message.emit("일괄 조회 중단을 요청했습니다.")
+
+    def _handle_batch_progress(
+        self: MainController, done: int, total: int, per_minute: float
+    ) -> None:
+        """일괄 조회 진행 상황을 batch_progress_interval초마다 UI에 알립니다.
+
+        Args:
+            done: 완료한 항목 수입니다.
+            total: 전체 항목 수입니다.
+            per_minute: 분당 처리 항목 수입니다.
+        """
+        now = time.monotonic()
+        if (
+            done < total
+            and now - self._batch_reported_at < self.batch_progress_interval
+        ):
+            return
+        self._batch_reported_at = now
+        self.log_message.emit(f"일괄 조회 진행: {done}/{total} ({per_minute:.1f}개/분)")
+
+    def _handle_batch_finished(
+        self: MainController, output_path: str, ok: int, failed: int
+    ) -> None:
+        """일괄 조회 종료를 처리합니다.
+
+        Args:
+            output_path: 결과 CSV 경로입니다.
+            ok: 성공한 항목 수입니다.
+            failed: 실패한 항목 수입니다.
+        """
+        self.batch_running = False
+        self.log_message.emit(
+            f"일괄 조회 종료: 성공 {ok}개, 실패 {failed}개 → {output_path}"
+        )
+        self.batch_finished.emit(output_path, ok, failed)
+
     def _handle_macro_status(self: MainController, status: bool) -> None:
         """매크로 상태 변경 시그널을 처리합니다.
 
@@ -209,12 +386,64 @@ class MainController(QObject):
         """
         if self.login_plugin:
             self._current_email = username
-            self.login_plugin.login(username, password)
+            login_plugin = self.login_plugin
+            self.tasks.submit(
+                "primary", lambda _token: login_plugin.login(username, password)
+            )
         else:
             self.log_message.emit("로그인 플러그인이 로드되지 않았습니다.")
 
+    def start_browser(self: MainController) -> None:
+        """브라우저를 준비하고 저장된 세션 복원을 시도합니다.
+
+        [Browser] prewarm 옵션이 켜져 있으면 백그라운드 스레드에서 드라이버(와 풀)를
+        실행하고, 기본 드라이버가 준비되는 즉시 세션 복원을 "primary" 작업 그룹에
+        제출합니다. 진행 상황은 browser_status 시그널로 UI에 전달됩니다. 드라이버
+        감시 스레드도 함께 시작하며, 드라이버가 재생성되면 browser_status로 알립니다.
+        """
+        config = self.plugin_manager.config
+        browser = self.plugin_manager.browser
+        browser.add_recovery_listener(
+            lambda _dead, _new: self.browser_status.emit(
+                "브라우저가 응답하지 않아 다시 시작하고 이전 페이지를 복원했습니다."
+            )
+        )
+        browser.start_watchdog()
+
+        def submit_restore() -> None:
+            # 로그인/상세 조회와 같은 기본 드라이버를 쓰므로 "primary" 그룹에서 실행합니다.
+            self.tasks.submit("primary", lambda _token: self.restore_session())
+
+        if not config.getboolean("Browser", "prewarm", fallback=False):
+            submit_restore()
+            return
+
+        browser.start_prewarm(
+            include_pool=config.getboolean("Browser", "prewarm_pool", fallback=True),
+            on_progress=self.browser_status.emit,
+            on_primary_ready=submit_restore,
+        )
+
+    def restore_session(self: MainController) -> bool:
+        """브라우저 프로필에 저장된 세션으로 로그인 상태 복원을 시도합니다.
+
+        Returns:
+            세션이 복원되었으면 True, 아니면 False를 반환합니다.
+        """
+        if not self.login_plugin:
+            return False
+        self._current_email = self.login_plugin.saved_email
+        if self.login_plugin.restore_session():
+            return True
+        self._current_email = None
+        return False
+
     def logout(self: MainController) -> None:
-        """로그아웃을 시도합니다."""
+        """작업 스레드에서 로그아웃을 시도합니다."""
+        self.tasks.submit("primary", self._logout)
+
+    def _logout(self: MainController, token: CancellationToken) -> None:
+        """로그아웃을 실행하고 결과와 관계없이 로그아웃 상태로 바꿉니다."""
         try:
             if self.login_plugin:
                 self.login_plugin.logout()
@@ -228,13 +457,23 @@ class MainController(QObject):
             self.login_status_changed.emit(False, "로그아웃되었습니다.")
 
     def search_product(self: MainController, query: str) -> None:
-        """제품을 검색합니다.
+        """작업 스레드에서 제품을 검색합니다. 진행 중인 이전 검색은 취소합니다.
+
+        로컬 제품 카탈로그에 일치하는 제품이 있으면 먼저 바로 표시하고, 실시간
+        검색 결과가 도착하면 그 목록을 갱신/확장합니다.
 
         Args:
             query: 검색어입니다.
         """
         if self.search_plugin:
-            self.search_plugin.search(query)
+            self._page_direction = 1
+            search_plugin = self.search_plugin
+            search_plugin.show_offline(query)
+            self.tasks.submit(
+                "search",
+                lambda token: search_plugin.search(query, token),
+                cancel_previous=True,
+            )
         else:
             self.log_message.emit("검색 플러그인이 로드되지 않았습니다.")
 
@@ -242,6 +481,7 @@ class MainController(QObject):
         """다음 검색 결과를 가져옵니다."""
         try:
             if self.search_plugin:
+                self._page_direction = 1
                 self.search_plugin.next_result()
             else:
                 self.log_message.emit("검색 플러그인이 로드되지 않았습니다.")
@@ -251,12 +491,15 @@ class MainController(QObject):
     def previous_result(self: MainController) -> None:
         """이전 검색 결과를 가져옵니다."""
         if self.search_plugin:
+            self._page_direction = -1
             self.search_plugin.previous_result()
         else:
             self.log_message.emit("검색 플러그인이 로드되지 않았습니다.")
 
     def get_product_details(self: MainController) -> bool:
-        """선택된 제품의 상세 정보를 가져옵니다.
+        """작업 스레드에서 선택된 제품의 상세 정보를 가져옵니다.
+
+        결과는 details_received/sizes_ready 시그널로 전달됩니다.
 
         Returns:
             상세 정보 요청 성공 여부입니다.
@@ -270,7 +513,10 @@ class MainController(QObject):
             return False
 
         if self.detail_plugin:
-            self.detail_plugin.get_details(self.current_product_id)
+            detail_plugin, product_id = self.detail_plugin, self.current_product_id
+            self.tasks.submit(
+                "primary", lambda _token: detail_plugin.get_details(product_id)
+            )
             return True
         else:
             self.log_message.emit("상세 정보 플러그인이 로드되지 않았습니다.")
@@ -0,0 +1,309 @@
+"""Chrome 성능 로그로 KREAM API(JSON) 응답을 수집하고 파싱합니다.
+
+검색/상세 페이지는 화면에 그리는 데이터를 `api.kream.co.kr`에서 JSON으로 받아옵니다.
+DOM에서 선택자 목록을 하나씩 시도하며 텍스트를 읽는 대신, 성능 로그의
+`Network.responseReceived` 이벤트로 해당 요청을 찾고 CDP `Network.getResponseBody`로
+본문을 읽어 제품/가격/사이즈 정보를 바로 꺼냅니다. 응답 구조가 바뀌거나 로그를
+사용할 수 없으면 빈 결과를 돌려주므로, 호출자는 기존 DOM 스크래핑으로 대체합니다.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+API_HOST = "api.kream.co.kr"
+
+# 응답 필드 후보 (API 버전에 따라 키 이름이 조금씩 다릅니다)
+_NAME_KEYS = ("name", "title")
+_TRANSLATED_NAME_KEYS = ("translated_name", "name_kr")
+_PRICE_KEYS = ("lowest_ask", "market_price", "price", "display_price")
+_RECENT_PRICE_KEYS = ("last_sale_price", "recent_price", "last_price")
+_IMAGE_KEYS = ("image_urls", "image_url", "images", "thumbnail")
+_WISH_KEYS = ("wish_count", "interest_count", "wish_figure")
+_REVIEW_KEYS = ("review_count", "review_figure")
+
+
+def enable_capture(options: Options) -> None:
+    """Chrome 옵션에 네트워크 이벤트 성능 로그를 켭니다.
+
+    Args:
+        options: WebDriver 생성 전의 Chrome 옵션입니다.
+    """
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    # 네트워크 이벤트만 기록해 로그 양을 줄입니다.
+    options.add_experimental_option(
+        "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+    )
+
+
+def _read_log(driver: WebDriver) -> list[dict[str, Any]]:
+    """성능 로그를 읽어 비웁니다. 로그가 꺼져 있으면 빈 목록을 반환합니다."""
+    try:
+        entries = driver.get_log("performance")  # type: ignore[attr-defined]
+    except (WebDriverException, ValueError):
+        return []
+    return entries or []
+
+
+def clear(driver: WebDriver) -> None:
+    """이전 페이지에서 쌓인 성능 로그를 버립니다. 새 탐색 직전에 호출합니다."""
+    _read_log(driver)
+
+
+def collect_json_responses(
+    driver: WebDriver, url_part: str = API_HOST
+) -> list[tuple[str, Any]]:
+    """마지막 호출 이후 받은 JSON 응답 중 URL에 url_part가 포함된 것을 반환합니다.
+
+    Args:
+        driver: 성능 로그가 켜진 Chrome WebDriver입니다.
+        url_part: 수집할 요청 URL에 포함되어야 하는 문자열입니다.
+
+    Returns:
+        (요청 URL, 파싱된 JSON) 튜플 목록입니다 (수신 순서).
+    """
+    responses: list[tuple[str, Any]] = []
+    for entry in _read_log(driver):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method") != "Network.responseReceived":
+            continue
+
+        params = message.get("params", {})
+        response = params.get("response", {})
+        url = response.get("url", "")
+        if url_part not in url or "json" not in response.get("mimeType", ""):
+            continue
+
+        try:
+            body = driver.execute_cdp_cmd(  # type: ignore[attr-defined]
+                "Network.getResponseBody", {"requestId": params.get("requestId")}
+            )
+            responses.append((url, json.loads(body.get("body", ""))))
+        except (AttributeError, WebDriverException, ValueError) as e:
+            # 본문이 이미 해제되었거나 아직 수신 중인 요청은 건너뜁니다.
+            logger.debug(f"응답 본문 읽기 실패 ({url}): {e}")
+
+    if responses:
+        logger.debug(f"API 응답 {len(responses)}건 수집")
+    return responses
+
+
+def _walk(node: Any) -> Iterator[dict[str, Any]]:
+    """JSON 트리의 모든 딕셔너리를 깊이 우선으로 순회합니다."""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+
+
+def _first(data: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """주어진 keys 중 data에 값이 있는 첫 번째 키의 값을 반환합니다."""
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, "", []):
+            return value
+    return None
+
+
+def _format_price(value: Any) -> Optional[str]:
+    """숫자 가격을 화면 표기("123,000원")로 바꿉니다."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return f"{int(value):,}원"
+    return str(value)
+
+
+def _brand_name(release: dict[str, Any]) -> Optional[str]:
+    """Release 객체에서 브랜드 이름을 꺼냅니다 (문자열 또는 객체)."""
+    brand = release.get("brand")
+    if isinstance(brand, dict):
+        return _first(brand, ("name", "title"))
+    return brand or release.get("brand_name")
+
+
+def _image_url(release: dict[str, Any]) -> Optional[str]:
+    """Release 객체에서 대표 이미지 URL을 꺼냅니다."""
+    image = _first(release, _IMAGE_KEYS)
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = _first(image, ("url", "src"))
+    return image if isinstance(image, str) else None
+
+
+def _product_entries(payload: Any) -> Iterator[dict[str, Any]]:
+    """응답에서 제품 항목({release, market} 또는 release 자체)을 순서대로 찾습니다."""
+    seen: set[Any] = set()
+    for node in _walk(payload):
+        release = node.get("release") if isinstance(node.get("release"), dict) else None
+        candidate = release or node
+        if "id" not in candidate or not _first(candidate, _NAME_KEYS):
+            continue
+        if not (release or _brand_name(candidate)):
+            continue
+        if candidate["id"] in seen:
+            continue
+        seen.add(candidate["id"])
+        yield node
+
+
+def parse_search_products(responses: list[tuple[str, Any]]) -> list[dict[str, Any]]:
+    """검색 API 응답에서 검색 결과 순서대로 제품 정보를 추출합니다.
+
+    Args:
+        responses: collect_json_responses()의 결과입니다.
+
+    Returns:
+        ProductRecord와 같은 키를 가진 딕셔너리 목록입니다.
+        값이 없는 키는 포함하지 않으므로 호출자가 DOM 값으로 채울 수 있습니다.
+    """
+    products: list[dict[str, Any]] = []
+    for url, payload in responses:
+        if "search" not in url and "/tabs/" not in url:
+            continue
+        for node in _product_entries(payload):
+            release: dict[str, Any] = node.get("release") or node
+            market: dict[str, Any] = (
+                node["market"] if isinstance(node.get("market"), dict) else {}
+            )
+            counter: dict[str, Any] = (
+                node["counter"] if isinstance(node.get("counter"), dict) else {}
+            )
+
+            info: dict[str, Any] = {
+                "id": str(release["id"]),
+                "name": _first(release, _NAME_KEYS),
+                "translated_name": _first(release, _TRANSLATED_NAME_KEYS),
+                "brand": _brand_name(release),
+                "price": _format_price(
+                    _first(market, _PRICE_KEYS) or _first(release, _PRICE_KEYS)
+                ),
+                "image_url": _image_url(release),
+                "wish_figure": _first(counter, _WISH_KEYS) or _first(node, _WISH_KEYS),
+                "review_figure": _first(counter, _REVIEW_KEYS)
+                or _first(node, _REVIEW_KEYS),
+            }
+            if "is_brand_official" in release or "is_brand_delivery" in release:
+                info["is_brand_official"] = bool(
+                    release.get("is_brand_official") or release.get("is_brand_delivery")
+                )
+            products.append({k: v for k, v in info.items() if v not in (None, "")})
+    return products
+
+
+def _size_options(node: dict[str, Any], product_id: str) -> list[str]:
+    """제품 노드 아래에서 첫 번째 사이즈 옵션 목록을 찾습니다.
+
+    다른 제품(추천 상품 등)의 노드 안으로는 내려가지 않으므로, 같은 응답에 있는
+    다른 옵션 목록을 이 제품의 사이즈로 잘못 읽지 않습니다.
+
+    Args:
+        node: release.id가 product_id인 노드입니다.
+        product_id: 제품 ID입니다.
+
+    Returns:
+        사이즈 이름 목록이거나, 찾지 못하면 빈 목록입니다.
+    """
+    pending: list[Any] = [node]
+    while pending:
+        current = pending.pop(0)
+        if isinstance(current, list):
+            pending.extend(current)
+            continue
+        if not isinstance(current, dict):
+            continue
+        release = current.get("release")
+        if (
+            current is not node
+            and isinstance(release, dict)
+            and str(release.get("id")) != product_id
+        ):
+            continue
+        # 사이즈 옵션 목록: [{"key": "260", "name": "260"}, ...] 형태
+        options = current.get("options") or current.get("sizes")
+        if isinstance(options, list) and options:
+            sizes = []
+            for option in options:
+                if isinstance(option, dict):
+                    size = _first(option, ("name", "option", "key", "size"))
+                else:
+                    size = option
+                if isinstance(size, (str, int, float)) and str(size).strip():
+                    sizes.append(str(size).strip())
+            if sizes:
+                return sizes
+        pending.extend(
+            value for value in current.values() if isinstance(value, (dict, list))
+        )
+    return []
+
+
+def parse_product_detail(
+    responses: list[tuple[str, Any]], product_id: str
+) -> dict[str, Any]:
+    """상세 API 응답에서 product_id 제품의 가격/속성/사이즈 정보를 추출합니다.
+
+    Args:
+        responses: collect_json_responses()의 결과입니다.
+        product_id: 상세 페이지의 제품 ID입니다.
+
+    Returns:
+        DetailPlugin.get_details() 결과 형식의 부분 딕셔너리입니다.
+        찾은 값만 포함하며, 아무것도 찾지 못하면 빈 딕셔너리입니다.
+    """
+    detail: dict[str, Any] = {}
+    sizes: list[str] = []
+    for url, payload in responses:
+        if f"/products/{product_id}" not in url:
+            continue
+        for node in _walk(payload):
+            release = (
+                node.get("release") if isinstance(node.get("release"), dict) else None
+            )
+            if not (release and str(release.get("id")) == product_id):
+                continue
+            fields = {
+                "release_price": _format_price(release.get("original_price")),
+                "model_no": release.get("style_code"),
+                "release_date": release.get("date_released"),
+                "color": release.get("colorway"),
+            }
+            market = node.get("market")
+            if isinstance(market, dict):
+                fields["recent_price"] = _format_price(
+                    _first(market, _RECENT_PRICE_KEYS)
+                )
+                change = market.get("change_value")
+                if isinstance(change, (int, float)) and not isinstance(change, bool):
+                    fields["fluctuation"] = f"{int(change):+,}원"
+                    fields["fluctuation_type"] = (
+                        "increase" if change > 0 else "decrease" if change else ""
+                    )
+            for key, value in fields.items():
+                if value and key not in detail:
+                    detail[key] = value
+            if not sizes:
+                sizes = _size_options(node, product_id)
+
+    if sizes:
+        detail["sizes"] = sizes
+    return detail
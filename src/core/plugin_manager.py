@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 from src.core.browser import BrowserManager
 from src.core.logger_setup import setup_logger, trace_log
 from src.core.plugin_base import PluginBase
+from src.core.product_catalog import ProductCatalog, close_catalog, init_catalog
 from src.plugins import LoginPlugin, MacroPlugin, SearchPlugin
 from src.plugins.search import DetailPlugin
 
@@ -38,6 +39,8 @@ class PluginManager:
         self.config = config
         self.plugins: Dict[str, PluginBase] = {}
         self.main_controller = main_controller
+        # 검색/상세 조회 결과를 모아 두는 로컬 제품 카탈로그 (플러그인이 함께 사용)
+        self.catalog: Optional[ProductCatalog] = init_catalog(config)
 
     def load_plugins(self: PluginManager) -> None:
         """사용 가능한 모든 플러그인을 로드합니다.
@@ -103,3 +106,16 @@ class PluginManager:
                 level="WARNING",
             )
         return plugin
+
+    def shutdown(self: PluginManager) -> None:
+        """플러그인이 쓰는 자원(검색/상세 캐시, 제품 카탈로그)을 정리합니다.
+
+        작업 스레드가 캐시와 카탈로그를 쓰지 않도록 TaskRunner.shutdown() 이후에
+        호출합니다.
+        """
+        for plugin in self.plugins.values():
+            cache = getattr(plugin, "cache", None)
+            if cache is not None:
+                cache.close()
+        self.catalog = None
+        close_catalog()
@@ -0,0 +1,326 @@
+"""검색/상세 조회에서 본 제품을 로컬 SQLite 카탈로그에 모아 전문 검색합니다.
+
+검색 결과 카드와 상세 정보가 도착할 때마다 제품 ID 기준으로 갱신해 두고, 새 검색을
+시작하면 브라우저를 거치지 않고 이 카탈로그에서 먼저 찾아 바로 보여줍니다(실시간
+검색은 그 결과를 갱신/확장합니다). 이름/한글 이름/브랜드/모델번호는 FTS5 색인으로
+찾으며, SQLite에 FTS5가 없으면 LIKE 검색으로 대신합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional
+
+from src.core.config import get_cache_dir
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+DB_FILE_NAME = "catalog.sqlite3"
+
+# 검색 결과 카드에서 저장하는 열 (ProductRecord 필드와 같은 이름)
+RECORD_COLUMNS = (
+    "name",
+    "translated_name",
+    "brand",
+    "price",
+    "image_url",
+    "wish_figure",
+    "review_figure",
+    "is_brand_official",
+)
+# 상세 정보에서 저장하는 열
+DETAIL_COLUMNS = ("model_no", "release_date", "sizes")
+# 전문 검색 대상 열
+SEARCH_COLUMNS = ("brand", "name", "translated_name", "model_no")
+# 상세 정보에서 값이 없음을 뜻하는 표시
+_MISSING = (None, "", "N/A", "-")
+
+
+def _model_key(value: Optional[str]) -> str:
+    """모델번호 비교용 키를 만듭니다 ("DD1391-100" → "dd1391100")."""
+    return re.sub(r"[\W_]", "", (value or "").lower())
+
+
+def _column_value(record: Mapping[str, Any], column: str) -> Any:
+    """레코드 필드를 열 값으로 바꿉니다 (없는 문자열은 빈 문자열)."""
+    value = record.get(column)
+    if column == "is_brand_official":
+        return int(bool(value))
+    if column == "image_url":
+        return value or None
+    return value or ""
+
+
+class ProductCatalog:
+    """제품 ID → 제품 정보를 저장하고 이름/모델번호로 찾는 SQLite 카탈로그입니다."""
+
+    def __init__(self: "ProductCatalog", path: str, max_results: int = 50) -> None:
+        """ProductCatalog를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로입니다. ":memory:"이면 메모리에만 저장합니다.
+            max_results: search()가 반환하는 최대 제품 수입니다.
+        """
+        self.max_results = max(1, max_results)
+        self._lock = threading.Lock()
+        # 검색/상세/일괄 조회 스레드에서 함께 쓰므로 스레드 검사를 끄고 잠금으로 보호합니다.
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS products ("
+            "id INTEGER PRIMARY KEY, product_id TEXT NOT NULL UNIQUE, "
+            "name TEXT NOT NULL DEFAULT '', translated_name TEXT NOT NULL DEFAULT '', "
+            "brand TEXT NOT NULL DEFAULT '', price TEXT NOT NULL DEFAULT '', "
+            "image_url TEXT, wish_figure TEXT NOT NULL DEFAULT '', "
+            "review_figure TEXT NOT NULL DEFAULT '', "
+            "is_brand_official INTEGER NOT NULL DEFAULT 0, "
+            "model_no TEXT NOT NULL DEFAULT '', model_key TEXT NOT NULL DEFAULT '', "
+            "release_date TEXT NOT NULL DEFAULT '', sizes TEXT NOT NULL DEFAULT '[]', "
+            "updated_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS products_model_key ON products(model_key)"
+        )
+        try:
+            # 색인 행의 rowid는 products.id와 같습니다.
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5("
+                f"{', '.join(SEARCH_COLUMNS)}, tokenize='unicode61 remove_diacritics 2')"
+            )
+            self._fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5를 사용할 수 없어 LIKE 검색을 사용합니다: {e}")
+            self._fts = False
+        self._db.commit()
+
+    def add_products(
+        self: "ProductCatalog", records: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """검색 결과 카드 정보를 저장합니다. 상세 정보 열은 그대로 둡니다.
+
+        Args:
+            records: ProductRecord.to_dict() 형식의 제품 정보입니다.
+                임시 ID("temp_")인 제품은 건너뜁니다.
+
+        Returns:
+            저장한 제품 수입니다.
+        """
+        rows = [
+            (
+                record["id"],
+                *(_column_value(record, column) for column in RECORD_COLUMNS),
+            )
+            for record in records
+            if record.get("id") and not str(record["id"]).startswith("temp_")
+        ]
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" for _ in RECORD_COLUMNS)
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in RECORD_COLUMNS
+        )
+        with self._lock:
+            try:
+                now = time.time()
+                for row in rows:
+                    self._db.execute(
+                        f"INSERT INTO products (product_id, {', '.join(RECORD_COLUMNS)}, "
+                        f"updated_at) VALUES (?, {placeholders}, ?) "
+                        f"ON CONFLICT(product_id) DO UPDATE SET {updates}, "
+                        "updated_at = excluded.updated_at",
+                        (*row, now),
+                    )
+                    self._reindex(row[0])
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"카탈로그 저장 실패: {e}")
+                return 0
+        return len(rows)
+
+    def add_detail(
+        self: "ProductCatalog", product_id: str, detail: Mapping[str, Any]
+    ) -> None:
+        """상세 정보(모델번호, 출시일, 사이즈)를 저장합니다.
+
+        값이 없는 항목("N/A" 등)은 기존 값을 유지합니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+            detail: DetailPlugin.get_details() 형식의 결과입니다.
+        """
+        if "error" in detail:
+            return
+        values = {
+            "model_no": detail.get("model_no"),
+            "release_date": detail.get("release_date"),
+            "sizes": (
+                json.dumps(detail["sizes"], ensure_ascii=False)
+                if detail.get("sizes")
+                else None
+            ),
+        }
+        values = {k: v for k, v in values.items() if v not in _MISSING}
+        if not values:
+            return
+        if "model_no" in values:
+            values["model_key"] = _model_key(values["model_no"])
+        columns = list(values)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        with self._lock:
+            try:
+                self._db.execute(
+                    f"INSERT INTO products (product_id, {', '.join(columns)}, "
+                    f"updated_at) VALUES (?, {', '.join('?' for _ in columns)}, ?) "
+                    f"ON CONFLICT(product_id) DO UPDATE SET {updates}, "
+                    "updated_at = excluded.updated_at",
+                    (product_id, *values.values(), time.time()),
+                )
+                self._reindex(product_id)
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"카탈로그 상세 정보 저장 실패 ({product_id}): {e}")
+
+    def search(
+        self: "ProductCatalog", query: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """이름/한글 이름/브랜드/모델번호로 제품을 찾습니다.
+
+        검색어의 모든 단어가 (앞부분 일치로) 포함된 제품과, 기호를 빼고 비교한
+        모델번호가 검색어와 같은 제품을 찾고, 모델번호가 같은 제품을 맨 앞에 둡니다.
+        검색 결과 카드 정보가 없는 제품(상세 정보만 저장된 제품)은 제외합니다.
+
+        Args:
+            query: 검색어 또는 모델번호입니다.
+            limit: 최대 제품 수입니다. None이면 max_results입니다.
+
+        Returns:
+            ProductRecord 필드(id, name, ...)와 model_no/release_date/sizes를 담은
+            딕셔너리 목록입니다.
+        """
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            return []
+        limit = limit or self.max_results
+        columns = ", ".join(f"p.{column}" for column in RECORD_COLUMNS + DETAIL_COLUMNS)
+        model_key = _model_key(query)
+        if self._fts:
+            # 하이픈 없이 입력한 모델번호("DD1391100")는 색인 단어와 맞지 않으므로
+            # model_key가 같은 제품도 함께 찾습니다.
+            sql = (
+                "WITH fts AS (SELECT rowid AS id, bm25(products_fts) AS rank "
+                "FROM products_fts WHERE products_fts MATCH ?) "
+                f"SELECT p.product_id, {columns} FROM products p "
+                "LEFT JOIN fts ON fts.id = p.id "
+                "WHERE p.name != '' AND p.id IN ("
+                "SELECT id FROM fts UNION SELECT id FROM products WHERE model_key = ?) "
+                "ORDER BY p.model_key = ? DESC, fts.rank LIMIT ?"
+            )
+            params: tuple[Any, ...] = (
+                " ".join(f'"{term}"*' for term in terms),
+                model_key,
+                model_key,
+                limit,
+            )
+        else:
+            text = "(p.brand || ' ' || p.name || ' ' || p.translated_name || ' ' || p.model_no)"
+            sql = (
+                f"SELECT p.product_id, {columns} FROM products p WHERE p.name != '' "
+                "AND (("
+                + " AND ".join(f"lower({text}) LIKE ?" for _ in terms)
+                + ") OR p.model_key = ?) "
+                "ORDER BY p.model_key = ? DESC, p.updated_at DESC LIMIT ?"
+            )
+            params = (*(f"%{term}%" for term in terms), model_key, model_key, limit)
+
+        with self._lock:
+            try:
+                rows = self._db.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"카탈로그 검색 실패 ('{query}'): {e}")
+                return []
+
+        results = []
+        for row in rows:
+            item = dict(zip(("id",) + RECORD_COLUMNS + DETAIL_COLUMNS, row))
+            item["is_brand_official"] = bool(item["is_brand_official"])
+            item["sizes"] = json.loads(item["sizes"] or "[]")
+            results.append(item)
+        return results
+
+    def count(self: "ProductCatalog") -> int:
+        """저장된 제품 수를 반환합니다."""
+        with self._lock:
+            return int(self._db.execute("SELECT COUNT(*) FROM products").fetchone()[0])
+
+    def close(self: "ProductCatalog") -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._db.close()
+
+    def _reindex(self: "ProductCatalog", product_id: str) -> None:
+        """제품의 전문 검색 색인 행을 갱신합니다. 잠금을 잡은 상태에서 호출합니다."""
+        if not self._fts:
+            return
+        row = self._db.execute(
+            f"SELECT id, {', '.join(SEARCH_COLUMNS)} FROM products WHERE product_id = ?",
+            (product_id,),
+        ).fetchone()
+        if row is None:
+            return
+        self._db.execute("DELETE FROM products_fts WHERE rowid = ?", (row[0],))
+        self._db.execute(
+            f"INSERT INTO products_fts (rowid, {', '.join(SEARCH_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in SEARCH_COLUMNS)})",
+            row,
+        )
+
+
+_catalog: Optional[ProductCatalog] = None
+
+
+def init_catalog(config: ConfigParser) -> Optional[ProductCatalog]:
+    """설정에 따라 전역 카탈로그를 초기화합니다.
+
+    Args:
+        config: 설정 파서 인스턴스입니다.
+
+    Returns:
+        ProductCatalog 인스턴스이거나, `[Catalog] enabled`가 꺼져 있거나 DB를 열 수
+        없으면 None입니다.
+    """
+    global _catalog
+    if not config.getboolean("Catalog", "enabled", fallback=True):
+        _catalog = None
+        return None
+    try:
+        _catalog = ProductCatalog(
+            os.path.join(get_cache_dir(config), DB_FILE_NAME),
+            max_results=config.getint("Catalog", "max_results", fallback=50),
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"제품 카탈로그 DB를 열 수 없습니다: {e}")
+        _catalog = None
+    return _catalog
+
+
+def get_catalog() -> Optional[ProductCatalog]:
+    """전역 카탈로그를 반환합니다. 초기화 전이거나 꺼져 있으면 None입니다."""
+    return _catalog
+
+
+def close_catalog() -> None:
+    """전역 카탈로그를 닫고 비웁니다. 이후 get_catalog()는 None을 반환합니다."""
+    global _catalog
+    catalog, _catalog = _catalog, None
+    if catalog is not None:
+        logger.info(f"제품 카탈로그: {catalog.count()}개 제품")
+        catalog.close()
@@ -0,0 +1,154 @@
+"""WebDriver의 자주 반복되는 조회 명령 결과를 다음 상태 변경 명령까지 재사용합니다.
+
+`current_url`, `window_handles`, `current_window_handle`, `title`은 매크로 반복 한 번
+안에서도 여러 함수가 따로 호출하지만, 그 사이에 탐색/클릭/스크립트 실행이 없으면 값이
+바뀌지 않습니다. 드라이버 인스턴스의 `execute`를 감싸 이 조회들의 응답을 기억해 두고,
+조회 전용이 아닌 명령(get, click, execute_script, switch_to 등)이 실행되면 즉시 버립니다.
+
+페이지가 스스로(타이머, 리디렉션 스크립트 등) 이동하는 경우에 대비해 기억한 값은
+`[Browser] read_cache_ttl`초가 지나면 만료됩니다. 0이면 이 기능을 끕니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from selenium.webdriver.remote.command import Command
+
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+# 응답을 기억할 조회 명령
+CACHED_COMMANDS = frozenset(
+    {
+        Command.GET_CURRENT_URL,
+        Command.GET_TITLE,
+        Command.W3C_GET_WINDOW_HANDLES,
+        Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    }
+)
+
+# 페이지 상태를 바꾸지 않으므로 기억한 값을 버리지 않아도 되는 명령
+# (execute_script를 거치는 is_displayed/get_attribute 등은 여기에 포함되지 않습니다)
+READ_ONLY_COMMANDS = frozenset(
+    {
+        Command.FIND_ELEMENT,
+        Command.FIND_ELEMENTS,
+        Command.FIND_CHILD_ELEMENT,
+        Command.FIND_CHILD_ELEMENTS,
+        Command.GET_ELEMENT_TEXT,
+        Command.GET_ELEMENT_ATTRIBUTE,
+        Command.GET_ELEMENT_PROPERTY,
+        Command.GET_ELEMENT_TAG_NAME,
+        Command.GET_ELEMENT_RECT,
+        Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+        Command.IS_ELEMENT_ENABLED,
+        Command.IS_ELEMENT_SELECTED,
+        Command.GET_ALL_COOKIES,
+        Command.GET_COOKIE,
+        Command.GET_LOG,
+        Command.GET_WINDOW_RECT,
+    }
+)
+
+_bypass = threading.local()
+_stats_lock = threading.Lock()
+# hits: 기억한 값으로 응답한 횟수, misses: 실제로 보낸 조회 횟수, miss_ms: 그 소요 시간
+_stats: dict[str, float] = {"hits": 0, "misses": 0, "miss_ms": 0.0}
+
+
+@contextmanager
+def uncached() -> Iterator[None]:
+    """이 블록 안에서 현재 스레드의 조회는 기억한 값을 쓰지 않고 드라이버에 보냅니다.
+
+    드라이버 응답 여부를 확인하는 용도(워치독 등)의 조회에 사용합니다.
+    """
+    previous = getattr(_bypass, "active", False)
+    _bypass.active = True
+    try:
+        yield
+    finally:
+        _bypass.active = previous
+
+
+def enable(driver: WebDriver, ttl: float) -> WebDriver:
+    """드라이버의 조회 명령 응답을 기억하도록 `execute`를 감쌉니다.
+
+    Args:
+        driver: 대상 WebDriver 인스턴스입니다.
+        ttl: 기억한 값의 최대 수명(초)입니다. 0 이하이면 아무것도 하지 않습니다.
+
+    Returns:
+        같은 드라이버 인스턴스입니다.
+    """
+    if ttl <= 0 or getattr(driver, "_read_cache_enabled", False):
+        return driver
+    original = driver.execute
+    lock = threading.Lock()
+    # 명령 → (저장 시각, 응답)
+    cache: dict[str, tuple[float, dict[str, Any]]] = {}
+    # 상태 변경 명령마다 증가합니다. 조회 도중 다른 스레드가 상태를 바꿨다면
+    # 그 조회 결과는 저장하지 않습니다.
+    generation = [0]
+
+    def execute(driver_command: str, params: Optional[dict] = None) -> Any:
+        if driver_command in CACHED_COMMANDS:
+            now = time.monotonic()
+            with lock:
+                started_generation = generation[0]
+                entry = cache.get(driver_command)
+            if not getattr(_bypass, "active", False):
+                if entry is not None and now - entry[0] < ttl:
+                    with _stats_lock:
+                        _stats["hits"] += 1
+                    return _copy(entry[1])
+            response = original(driver_command, params)
+            elapsed_ms = (time.monotonic() - now) * 1000
+            with lock:
+                if generation[0] == started_generation:
+                    cache[driver_command] = (now, response)
+            with _stats_lock:
+                _stats["misses"] += 1
+                _stats["miss_ms"] += elapsed_ms
+            return _copy(response)
+
+        if driver_command not in READ_ONLY_COMMANDS:
+            # 명령이 실패해도 상태가 바뀌었을 수 있으므로 보내기 전에 버립니다.
+            with lock:
+                generation[0] += 1
+                cache.clear()
+        return original(driver_command, params)
+
+    # 명령 계측(command_stats)보다 바깥에 설치되어 실제 왕복만 계측되도록 합니다.
+    setattr(driver, "execute", execute)
+    setattr(driver, "_read_cache_enabled", True)
+    return driver
+
+
+def _copy(response: dict[str, Any]) -> dict[str, Any]:
+    """호출자가 목록 값(window_handles)을 바꿔도 기억한 값이 변하지 않도록 복사합니다."""
+    value = response.get("value")
+    if isinstance(value, list):
+        return {**response, "value": list(value)}
+    return response
+
+
+def summary() -> dict[str, float]:
+    """기억한 값으로 응답한 횟수와 절약한 시간 추정치(ms)를 반환합니다."""
+    with _stats_lock:
+        hits, misses, miss_ms = _stats["hits"], _stats["misses"], _stats["miss_ms"]
+    average = miss_ms / misses if misses else 0.0
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        "saved_ms": round(hits * average, 1),
+    }
@@ -0,0 +1,141 @@
+"""CDP를 사용해 페이지 리소스 요청을 차단하고 페이지 로드 시간을 측정합니다.
+
+검색/상세/인벤토리 페이지에서 필요한 것은 일부 DOM 요소뿐이므로, 이미지·폰트·동영상·
+트래킹 스크립트 요청을 `Network.setBlockedURLs`로 차단해 대역폭과 렌더러 CPU를
+아낍니다. 차단 프로필별 페이지 로드 시간을 누적해 로그로 남기므로, 설정을 바꿔 가며
+페이지 유형별 개선 폭을 비교할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+_IMAGES = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.ico*"]
+_FONTS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+_MEDIA = ["*.mp4*", "*.webm*", "*.m3u8*", "*.ts?*", "*.mp3*"]
+_TRACKERS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*analytics.tiktok.com*",
+    "*criteo.*",
+    "*amplitude.com*",
+    "*braze.com*",
+    "*appsflyer.com*",
+    "*clarity.ms*",
+    "*hotjar.com*",
+    "*sentry.io*",
+]
+
+# 프로필 이름 → 차단할 URL 패턴 목록
+BLOCKING_PROFILES: dict[str, list[str]] = {
+    "none": [],
+    # 매크로/결제 흐름용: 화면 구성에 영향이 없는 요청만 차단
+    "light": _TRACKERS + _MEDIA,
+    # 스크래핑용: 텍스트와 속성만 읽으므로 이미지·폰트까지 차단
+    "scraping": _TRACKERS + _MEDIA + _FONTS + _IMAGES,
+}
+
+_applied_profiles: dict[int, str] = {}
+_load_stats: dict[tuple[str, str], list[float]] = {}
+_stats_lock = threading.Lock()
+
+_NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+return {
+  dcl: nav.domContentLoadedEventEnd,
+  load: nav.loadEventEnd,
+  resources: performance.getEntriesByType('resource').length,
+};
+"""
+
+
+def apply_blocking_profile(driver: WebDriver, profile: str) -> bool:
+    """드라이버에 리소스 차단 프로필을 적용합니다.
+
+    Args:
+        driver: Chrome WebDriver 인스턴스입니다.
+        profile: BLOCKING_PROFILES의 키입니다 (알 수 없는 이름은 "none"으로 처리).
+
+    Returns:
+        적용에 성공하면 True, CDP 명령이 실패하면 False입니다.
+    """
+    if profile not in BLOCKING_PROFILES:
+        logger.warning(f"알 수 없는 리소스 차단 프로필 '{profile}', 차단하지 않습니다.")
+        profile = "none"
+
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return False
+    try:
+        execute_cdp_cmd("Network.enable", {})
+        execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKING_PROFILES[profile]})
+    except WebDriverException as e:
+        logger.warning(f"리소스 차단 프로필 '{profile}' 적용 실패: {e}")
+        return False
+
+    _applied_profiles[id(driver)] = profile
+    logger.info(
+        f"리소스 차단 프로필 '{profile}' 적용 ({len(BLOCKING_PROFILES[profile])}개 패턴)"
+    )
+    return True
+
+
+def record_page_load(driver: WebDriver, page_type: str) -> dict[str, Any] | None:
+    """현재 페이지의 Navigation Timing을 읽어 프로필별 통계에 누적하고 로그로 남깁니다.
+
+    Args:
+        driver: WebDriver 인스턴스입니다.
+        page_type: 페이지 유형입니다 (예: "search", "detail", "inventory").
+
+    Returns:
+        측정값 딕셔너리(dcl, load, resources) 또는 측정에 실패한 경우 None입니다.
+    """
+    try:
+        timing = driver.execute_script(_NAVIGATION_TIMING_SCRIPT)
+    except WebDriverException:
+        return None
+    if not timing or not timing.get("dcl"):
+        # pageLoadStrategy가 'none'이면 DOMContentLoaded 이전일 수 있습니다.
+        return None
+
+    profile = _applied_profiles.get(id(driver), "none")
+    with _stats_lock:
+        samples = _load_stats.setdefault((page_type, profile), [])
+        samples.append(float(timing.get("dcl") or 0))
+        average = sum(samples) / len(samples)
+        count = len(samples)
+
+    logger.info(
+        f"페이지 로드 [{page_type}/{profile}] DOMContentLoaded {timing.get('dcl', 0):.0f}ms, "
+        f"load {timing.get('load', 0):.0f}ms, 리소스 {timing.get('resources')}개 "
+        f"(평균 DCL {average:.0f}ms, n={count})"
+    )
+    return timing
+
+
+def page_load_summary() -> dict[str, dict[str, float]]:
+    """페이지 유형/프로필별 평균 DOMContentLoaded 시간(ms)을 반환합니다."""
+    with _stats_lock:
+        return {
+            f"{page_type}/{profile}": {
+                "avg_dcl_ms": sum(samples) / len(samples),
+                "count": float(len(samples)),
+            }
+            for (page_type, profile), samples in _load_stats.items()
+            if samples
+        }
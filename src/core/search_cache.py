@@ -0,0 +1,272 @@
+"""검색어별 검색 결과를 메모리와 SQLite에 캐시합니다.
+
+같은 검색어를 다시 검색하면 페이지 이동/대기/스크래핑 없이 저장된 결과를 바로
+돌려줍니다. 저장한 지 `ttl`초가 지난 결과도 `max_age`초까지는 그대로 돌려주되
+호출자가 백그라운드에서 다시 검색해 갱신하도록(stale-while-revalidate) 표시합니다.
+디스크 저장소는 마지막 사용 시각 기준으로 최대 `max_entries`개까지만 유지합니다(LRU).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from src.core.config import get_cache_dir
+from src.core.logger_setup import setup_logger
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+DB_FILE_NAME = "search.sqlite3"
+# 메모리에 함께 둘 최대 항목 수 (디스크 항목 수와 별개)
+MEMORY_ENTRIES = 32
+# 마지막 사용 시각 갱신을 모아서 한 번에 기록하는 단위
+TOUCH_BATCH = 20
+# 누적 적중률을 INFO로 남기는 조회 횟수 간격 (조회마다의 결과는 DEBUG)
+RATIO_LOG_INTERVAL = 50
+
+
+class CachedResult(NamedTuple):
+    """캐시 조회 결과입니다."""
+
+    payload: Any
+    age: float
+    stale: bool
+
+
+class SearchCache:
+    """검색어 → JSON 직렬화 가능한 결과를 저장하는 2단계(메모리/SQLite) LRU 캐시입니다."""
+
+    def __init__(
+        self: "SearchCache",
+        path: Optional[str],
+        ttl: float = 600,
+        max_age: float = 86400,
+        max_entries: int = 200,
+    ) -> None:
+        """SearchCache를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로입니다. None이면 메모리에만 저장합니다.
+            ttl: 결과를 새것으로 보는 시간(초)입니다.
+            max_age: 오래된 결과라도 돌려주는 최대 시간(초)입니다.
+            max_entries: 디스크에 유지할 최대 검색어 수입니다.
+        """
+        self.ttl = ttl
+        self.max_age = max(max_age, ttl)
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0}
+        # 아직 디스크에 기록하지 않은 검색어 → 마지막 사용 시각
+        self._touched: dict[str, float] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                # 백그라운드 갱신 스레드에서도 쓰므로 스레드 검사를 끄고 잠금으로 보호합니다.
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "keyword TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                    "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS results_used_at ON results(used_at)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"검색 캐시 DB를 열 수 없어 메모리만 사용합니다: {e}")
+                self._db = None
+
+    @staticmethod
+    def normalize(keyword: str) -> str:
+        """검색어를 캐시 키로 바꿉니다 (앞뒤 공백 제거, 연속 공백 정리, 소문자)."""
+        return " ".join(keyword.split()).lower()
+
+    def get(self: "SearchCache", keyword: str) -> Optional[CachedResult]:
+        """검색어의 캐시된 결과를 반환합니다.
+
+        Args:
+            keyword: 검색어입니다.
+
+        Returns:
+            CachedResult이거나, 없거나 max_age를 넘었으면 None입니다.
+        """
+        key = self.normalize(keyword)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+
+            if entry is None or now - entry[0] > self.max_age:
+                self._stats["misses"] += 1
+                self._log_ratio("miss", key)
+                return None
+
+            age = now - entry[0]
+            stale = age > self.ttl
+            self._stats["stale_hits" if stale else "hits"] += 1
+            self._touch(key, now)
+            self._log_ratio("stale" if stale else "hit", key)
+            return CachedResult(entry[1], age, stale)
+
+    def put(self: "SearchCache", keyword: str, payload: Any) -> None:
+        """검색어의 결과를 저장하고 LRU 한도를 넘는 항목을 지웁니다.
+
+        Args:
+            keyword: 검색어입니다.
+            payload: JSON으로 직렬화할 수 있는 결과입니다.
+        """
+        key = self.normalize(keyword)
+        now = time.time()
+        with self._lock:
+            self._remember(key, (now, payload))
+            self._touched.pop(key, None)
+            if self._db is None:
+                return
+            try:
+                # LRU 정리가 최신 사용 시각을 보도록 밀린 갱신을 먼저 기록합니다.
+                self._flush_touches()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(payload, ensure_ascii=False), now, now),
+                )
+                self._db.execute(
+                    "DELETE FROM results WHERE keyword NOT IN ("
+                    "SELECT keyword FROM results ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"검색 캐시 저장 실패 ({key}): {e}")
+
+    def invalidate(self: "SearchCache", keyword: str) -> None:
+        """검색어의 캐시를 지웁니다."""
+        key = self.normalize(keyword)
+        with self._lock:
+            self._memory.pop(key, None)
+            self._touched.pop(key, None)
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM results WHERE keyword = ?", (key,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"검색 캐시 삭제 실패 ({key}): {e}")
+
+    def stats(self: "SearchCache") -> dict[str, float]:
+        """적중/오래된 적중/실패 횟수와 적중률을 반환합니다."""
+        with self._lock:
+            return self._ratio()
+
+    def close(self: "SearchCache") -> None:
+        """밀린 사용 시각을 기록하고 DB 연결을 닫습니다."""
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._flush_touches()
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"검색 캐시 사용 시각 기록 실패: {e}")
+                self._db.close()
+                self._db = None
+
+    def _load(self: "SearchCache", key: str) -> Optional[tuple[float, Any]]:
+        """디스크에서 항목을 읽습니다. 잠금을 잡은 상태에서 호출합니다."""
+        assert self._db is not None
+        try:
+            row = self._db.execute(
+                "SELECT stored_at, payload FROM results WHERE keyword = ?", (key,)
+            ).fetchone()
+            return (row[0], json.loads(row[1])) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"검색 캐시 읽기 실패 ({key}): {e}")
+            return None
+
+    def _remember(self: "SearchCache", key: str, entry: tuple[float, Any]) -> None:
+        """메모리 LRU에 항목을 넣습니다. 잠금을 잡은 상태에서 호출합니다."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def _touch(self: "SearchCache", key: str, now: float) -> None:
+        """디스크 항목의 마지막 사용 시각 갱신을 예약합니다.
+
+        적중할 때마다 커밋하지 않도록 TOUCH_BATCH개씩 모아서 기록합니다(다음 put()이나
+        close()에서도 기록). 잠금을 잡은 상태에서 호출합니다.
+        """
+        if self._db is None:
+            return
+        self._touched[key] = now
+        if len(self._touched) < TOUCH_BATCH:
+            return
+        try:
+            self._flush_touches()
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"검색 캐시 사용 시각 기록 실패: {e}")
+
+    def _flush_touches(self: "SearchCache") -> None:
+        """예약된 사용 시각을 기록합니다(커밋은 호출자). 잠금을 잡은 상태에서 호출합니다."""
+        if self._db is None or not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        self._db.executemany(
+            "UPDATE results SET used_at = ? WHERE keyword = ?",
+            [(used_at, key) for key, used_at in touched.items()],
+        )
+
+    def _ratio(self: "SearchCache") -> dict[str, float]:
+        """현재 통계를 계산합니다. 잠금을 잡은 상태에서 호출합니다."""
+        total = sum(self._stats.values())
+        hits = self._stats["hits"] + self._stats["stale_hits"]
+        return {
+            **self._stats,
+            "hit_ratio": round(hits / total, 3) if total else 0.0,
+        }
+
+    def _log_ratio(self: "SearchCache", outcome: str, key: str) -> None:
+        """조회 결과는 DEBUG로, 누적 적중률은 RATIO_LOG_INTERVAL번마다 INFO로 남깁니다.
+
+        잠금을 잡은 상태에서 호출합니다.
+        """
+        ratio = self._ratio()
+        summary = (
+            f"적중률 {ratio['hit_ratio']:.0%}, 적중 {ratio['hits']}, "
+            f"갱신 필요 {ratio['stale_hits']}, 실패 {ratio['misses']}"
+        )
+        logger.debug(f"검색 캐시 {outcome} '{key}' ({summary})")
+        if sum(self._stats.values()) % RATIO_LOG_INTERVAL == 0:
+            logger.info(f"검색 캐시 통계: {summary}")
+
+
+def create_search_cache(config: ConfigParser) -> Optional[SearchCache]:
+    """설정에 따라 SearchCache를 만듭니다.
+
+    Args:
+        config: 설정 파서 인스턴스입니다.
+
+    Returns:
+        SearchCache 인스턴스이거나, `[Cache] search_enabled`가 꺼져 있으면 None입니다.
+    """
+    if not config.getboolean("Cache", "search_enabled", fallback=True):
+        return None
+    return SearchCache(
+        os.path.join(get_cache_dir(config), DB_FILE_NAME),
+        ttl=config.getfloat("Cache", "search_ttl", fallback=600),
+        max_age=config.getfloat("Cache", "search_max_age", fallback=86400),
+        max_entries=config.getint("Cache", "search_max_entries", fallback=200),
+    )
@@ -0,0 +1,206 @@
+"""논리 필드별 대체 선택자의 적중률을 기록해 사이트 구조 변경을 알립니다.
+
+검색 결과/제품 카드/토스트처럼 사이트 구조 변경에 대비해 여러 선택자를 순서대로
+시도하는 곳에서, 선택자별 적중/실패 횟수와 평균 소요 시간을 캐시 디렉토리에 저장해
+다음 실행에도 이어서 사용합니다. 시도 순서는 코드에 적힌 순서(구체적인 선택자가
+먼저)를 그대로 따르며, 통계는 보고용으로만 씁니다. 일반적인 대체 선택자("img",
+"h3" 등)가 우연히 한 번 일치했다고 앞으로 올라가면 잘못된 요소를 읽을 수 있고,
+`extract_fields`는 모든 후보를 한 번의 왕복으로 평가하므로 순서를 바꿔도 빨라지지
+않기 때문입니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Iterable, Mapping, Optional
+
+from src.core.logger_setup import setup_logger
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+REGISTRY_FILE_NAME = "selectors.json"
+# 일치하던 선택자가(또는 첫 번째 선택자가) 이 횟수만큼 연속으로 일치하지 않고 뒤쪽
+# 선택자만 일치하면 죽은 선택자로 봅니다.
+DEAD_SELECTOR_LOOKUPS = 20
+
+
+class SelectorRegistry:
+    """필드별 선택자 통계와 마지막 성공 선택자를 관리합니다."""
+
+    def __init__(self: "SelectorRegistry", path: Optional[str] = None) -> None:
+        """SelectorRegistry를 초기화하고 저장된 통계를 읽습니다.
+
+        Args:
+            path: 통계를 저장할 JSON 파일 경로입니다. None이면 저장하지 않습니다.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        # field -> {"last": selector, "primary": 첫 번째 선택자,
+        #           "selectors": {selector: {hits, misses, ms, streak}}}
+        # streak는 마지막 적중 이후 연속 실패 횟수입니다.
+        self._fields: dict[str, dict[str, Any]] = {}
+        if path:
+            self._load()
+
+    def _load(self: "SelectorRegistry") -> None:
+        """저장된 통계를 읽습니다. 없거나 손상된 경우 빈 통계로 시작합니다."""
+        try:
+            with open(str(self.path), encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._fields = data
+        except (OSError, ValueError):
+            self._fields = {}
+
+    def save(self: "SelectorRegistry") -> None:
+        """변경된 통계를 파일에 저장합니다."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._fields, f, ensure_ascii=False, indent=2)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"선택자 통계 저장 실패: {e}")
+
+    def record(
+        self: "SelectorRegistry",
+        field: str,
+        tried: Iterable[str],
+        hit: Optional[str],
+        elapsed_ms: float = 0.0,
+    ) -> None:
+        """선택자 시도 결과를 기록합니다.
+
+        Args:
+            field: 논리 필드 이름입니다.
+            tried: 코드에 적힌 순서대로의 선택자 목록입니다 (hit 포함).
+                hit보다 앞에 있던 선택자만 실패로 셉니다.
+            hit: 일치한 선택자이거나, 모두 실패했으면 None입니다.
+            elapsed_ms: 조회에 걸린 시간(ms)입니다.
+        """
+        with self._lock:
+            entry = self._fields.setdefault(field, {"last": None, "selectors": {}})
+            self._dirty = True
+            tried = list(tried)
+            if tried:
+                entry["primary"] = tried[0]
+            if hit is None:
+                # 모두 실패한 경우는 요소가 원래 없는 페이지일 수 있으므로
+                # 선택자별 실패로 세지 않고 필드 단위로만 셉니다.
+                entry["empty"] = entry.get("empty", 0) + 1
+                return
+            stats = entry["selectors"]
+            for selector in tried:
+                s = stats.setdefault(selector, {"hits": 0, "misses": 0, "ms": 0.0})
+                if selector == hit:
+                    s["streak"] = 0
+                    # 적중한 조회의 평균 소요 시간 (지수 이동 평균)
+                    s["ms"] = (
+                        elapsed_ms
+                        if not s["hits"]
+                        else s["ms"] * 0.8 + (elapsed_ms * 0.2)
+                    )
+                    s["hits"] += 1
+                    break
+                s["misses"] += 1
+                s["streak"] = s.get("streak", 0) + 1
+            if entry["last"] != hit:
+                if entry["last"] is not None:
+                    logger.debug(f"선택자 변경 [{field}]: {entry['last']} → {hit}")
+                entry["last"] = hit
+
+    def record_matches(
+        self: "SelectorRegistry",
+        prefix: str,
+        spec: Mapping[str, Any],
+        matched: Mapping[str, tuple[Optional[str], float]],
+    ) -> None:
+        """extract_fields(matched=...)가 채운 필드별 적중 결과를 기록합니다.
+
+        Args:
+            prefix: 논리 필드 이름 앞에 붙일 접두사입니다 (예: "card").
+            spec: extract_fields에 실제로 전달한 명세입니다.
+            matched: 필드 이름 → (일치한 선택자 또는 None, 소요 시간 ms)입니다.
+        """
+        for name, (hit, elapsed_ms) in matched.items():
+            field = spec.get(name)
+            if field is None or isinstance(field, str):
+                continue
+            selectors = field["selectors"] if isinstance(field, Mapping) else field
+            self.record(f"{prefix}.{name}", selectors, hit, elapsed_ms)
+
+    def stats(self: "SelectorRegistry") -> dict[str, dict[str, Any]]:
+        """필드별 선택자 통계(적중률, 평균 소요 시간 포함)를 반환합니다."""
+        with self._lock:
+            result: dict[str, dict[str, Any]] = {}
+            for field, entry in self._fields.items():
+                selectors = {}
+                for selector, s in entry.get("selectors", {}).items():
+                    attempts = s.get("hits", 0) + s.get("misses", 0)
+                    # 일치하던 선택자가 멈췄거나, 첫 번째 선택자가 계속 실패하는 경우
+                    used = s.get("hits", 0) > 0 or selector == entry.get("primary")
+                    dead = used and s.get("streak", 0) >= DEAD_SELECTOR_LOOKUPS
+                    selectors[selector] = {
+                        **s,
+                        "hit_rate": s.get("hits", 0) / attempts if attempts else 0.0,
+                        "dead": dead,
+                        "unused": not dead
+                        and not s.get("hits")
+                        and s.get("misses", 0) >= DEAD_SELECTOR_LOOKUPS,
+                    }
+                result[field] = {
+                    "last": entry.get("last"),
+                    "empty": entry.get("empty", 0),
+                    "selectors": selectors,
+                }
+            return result
+
+    def dead_selectors(self: "SelectorRegistry") -> dict[str, list[str]]:
+        """일치하다가 멈췄거나, 첫 번째인데 계속 실패하는 선택자를 반환합니다.
+
+        뒤쪽 선택자만 일치하고 있다는 뜻이므로 사이트 구조 변경을 의심할 수 있습니다.
+        """
+        return self._selectors_where("dead")
+
+    def unused_selectors(self: "SelectorRegistry") -> dict[str, list[str]]:
+        """시도되었지만 한 번도 일치하지 않은 대체 선택자를 반환합니다.
+
+        앞쪽 선택자가 요소 없음으로 실패한 페이지에서도 시도되므로 정상일 수 있습니다.
+        """
+        return self._selectors_where("unused")
+
+    def _selectors_where(self: "SelectorRegistry", flag: str) -> dict[str, list[str]]:
+        """stats()에서 flag가 참인 선택자를 필드별로 모읍니다."""
+        return {
+            field: found
+            for field, entry in self.stats().items()
+            if (found := [s for s, v in entry["selectors"].items() if v[flag]])
+        }
+
+
+_registry: Optional[SelectorRegistry] = None
+
+
+def init_registry(cache_dir: str) -> SelectorRegistry:
+    """캐시 디렉토리의 통계 파일로 전역 레지스트리를 초기화합니다.
+
+    Args:
+        cache_dir: 통계 파일을 저장할 디렉토리입니다.
+    """
+    global _registry
+    _registry = SelectorRegistry(os.path.join(cache_dir, REGISTRY_FILE_NAME))
+    return _registry
+
+
+def get_registry() -> SelectorRegistry:
+    """전역 레지스트리를 반환합니다. 초기화 전이면 저장하지 않는 레지스트리를 만듭니다."""
+    global _registry
+    if _registry is None:
+        _registry = SelectorRegistry()
+    return _registry
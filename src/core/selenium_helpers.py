@@ -2,21 +2,273 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Pattern, Union
+import time
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Pattern, Union
 
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
+from src.core.cancellation import TaskCancelled
+
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
 
 
+# WebDriver 기본 스크립트 타임아웃(초). 이보다 긴 대기는 폴링으로 처리합니다.
+_SCRIPT_TIMEOUT = 30
+
+# 조건을 만족하는 요소가 생기는 즉시 콜백을 호출하는 비동기 스크립트입니다.
+# DOM 변경(MutationObserver)마다 조건을 검사하고, 스타일 변화처럼 DOM 변경 없이
+# 바뀌는 가시성은 50ms마다 한 번 더 확인합니다 (백그라운드 탭에서도 동작하도록
+# requestAnimationFrame 대신 setTimeout 사용).
+_OBSERVE_SCRIPT = """
+const [by, selector, condition, timeoutMs, done] = arguments;
+const find = () => {
+  if (by === 'xpath') {
+    const r = document.evaluate(selector, document, null,
+      XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: r.snapshotLength}, (_, i) => r.snapshotItem(i));
+  }
+  return Array.from(document.querySelectorAll(selector));
+};
+const visible = el => {
+  const style = getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none'
+    && el.getClientRects().length > 0;
+};
+const check = () => {
+  const nodes = find();
+  if (condition === 'all') { return nodes.length ? nodes : null; }
+  for (const el of nodes) {
+    if (condition === 'present') { return el; }
+    if (visible(el) && (condition === 'visible' || !el.disabled)) { return el; }
+  }
+  return null;
+};
+let finished = false;
+let observer = null;
+const finish = value => {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  done(value);
+};
+const tick = () => {
+  if (finished) { return; }
+  const found = check();
+  if (found) { finish(found); } else { setTimeout(tick, 50); }
+};
+const first = check();
+if (first) { finish(first); return; }
+observer = new MutationObserver(() => { const found = check(); if (found) { finish(found); } });
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+if (condition !== 'present' && condition !== 'all') { setTimeout(tick, 50); }
+setTimeout(() => finish(null), timeoutMs);
+"""
+
+# By 값 → 스크립트에서 사용할 (방식, 선택자) 변환
+_CSS_BY = {
+    "css selector": lambda s: s,
+    "id": lambda s: f'[id="{s}"]',
+    "name": lambda s: f'[name="{s}"]',
+    "class name": lambda s: f".{s}",
+    "tag name": lambda s: s,
+}
+
+# 조건 이름 → 동일한 의미의 WebDriverWait 조건 (폴링 대체 경로용)
+_POLLING_CONDITIONS: dict[str, Callable[[tuple[str, str]], Any]] = {
+    "present": ec.presence_of_element_located,
+    "all": ec.presence_of_all_elements_located,
+    "visible": ec.visibility_of_element_located,
+    "clickable": ec.element_to_be_clickable,
+}
+
+
+def wait_for_condition(
+    browser: WebDriver, by: str, selector: str, condition: str, timeout: float = 5
+) -> Any:
+    """요소가 조건을 만족하는 순간 반환하는 이벤트 기반 대기입니다.
+
+    WebDriverWait처럼 500ms마다 폴링하지 않고, 브라우저 안의 MutationObserver가
+    DOM 변경을 감지하자마자 결과를 돌려줍니다. 대기 중에 페이지가 이동해 스크립트가
+    중단되거나, 지원하지 않는 By 방식이거나, 대기 시간이 스크립트 타임아웃보다 길면
+    남은 시간 동안 기존 WebDriverWait 폴링으로 대기합니다.
+
+    Args:
+        browser: WebDriver 인스턴스입니다.
+        by: 요소를 찾는 방법입니다 (예: By.CSS_SELECTOR, By.XPATH).
+        selector: 요소의 선택자입니다.
+        condition: "present", "all", "visible", "clickable" 중 하나입니다.
+        timeout: 최대 대기 시간(초)입니다.
+
+    Returns:
+        조건을 만족한 WebElement ("all"이면 WebElement 목록)입니다.
+
+    Raises:
+        TimeoutException: 지정된 시간 내에 조건이 충족되지 않은 경우.
+    """
+    deadline = time.monotonic() + timeout
+    if by == "xpath":
+        mode, query = "xpath", selector
+    elif by in _CSS_BY:
+        mode, query = "css", _CSS_BY[by](selector)
+    else:
+        mode = ""
+
+    if mode and timeout < _SCRIPT_TIMEOUT:
+        try:
+            found = browser.execute_async_script(
+                _OBSERVE_SCRIPT, mode, query, condition, int(timeout * 1000)
+            )
+        except WebDriverException:
+            # 페이지 이동 등으로 스크립트가 중단되면 남은 시간 동안 폴링합니다.
+            found = None
+        else:
+            if found:
+                return found
+            raise TimeoutException(
+                f"{timeout}초 안에 '{selector}' 요소가 '{condition}' 상태가 되지 않았습니다."
+            )
+
+    remaining = max(0.0, deadline - time.monotonic())
+    return WebDriverWait(browser, remaining).until(
+        _POLLING_CONDITIONS[condition]((by, selector))
+    )
+
+
+# 이름 있는 조건 목록 중 처음으로 참이 되는 조건의 이름을 콜백으로 돌려주는 스크립트입니다.
+_ANY_OF_SCRIPT = """
+const [conditions, timeoutMs, done] = arguments;
+const visible = el => {
+  const style = getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none'
+    && el.getClientRects().length > 0;
+};
+const matches = (el, c) =>
+  (!c.text || (el.textContent || '').includes(c.text))
+  && (c.state !== 'visible' && c.state !== 'clickable' || visible(el))
+  && (c.state !== 'clickable' || !el.disabled);
+const holds = c => {
+  const url = location.href;
+  if (c.url && !url.includes(c.url)) { return false; }
+  if (c.url_regex && !new RegExp(c.url_regex).test(url)) { return false; }
+  if (c.selector) {
+    return Array.from(document.querySelectorAll(c.selector)).some(el => matches(el, c));
+  }
+  return !c.text || (document.body && document.body.textContent.includes(c.text));
+};
+const check = () => {
+  for (const [name, c] of conditions) { if (holds(c)) { return name; } }
+  return null;
+};
+let finished = false;
+let scheduled = false;
+let observer = null;
+const finish = value => {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  done(value);
+};
+const recheck = () => {
+  scheduled = false;
+  if (finished) { return; }
+  const name = check();
+  if (name !== null) { finish(name); }
+};
+const first = check();
+if (first !== null) { finish(first); return; }
+observer = new MutationObserver(() => {
+  if (!scheduled) { scheduled = true; setTimeout(recheck, 0); }
+});
+observer.observe(document, {childList: true, subtree: true, attributes: true,
+  characterData: true});
+// URL 변경(history API)과 스타일 변화는 DOM 변경 없이 일어날 수 있어 주기적으로도 확인
+const tick = () => { if (!finished) { recheck(); setTimeout(tick, 50); } };
+setTimeout(tick, 50);
+setTimeout(() => finish(null), timeoutMs);
+"""
+
+
+# 페이지 이동으로 비동기 스크립트가 중단되었을 때 ChromeDriver가 보내는 오류 메시지
+_NAVIGATION_ERRORS = (
+    "document unloaded",
+    "navigated or closed",
+    "execution context was destroyed",
+)
+
+
+def _interrupted_by_navigation(error: WebDriverException) -> bool:
+    """스크립트 실행 오류가 페이지 이동으로 인한 중단인지 여부입니다."""
+    message = (error.msg or "").lower()
+    return any(text in message for text in _NAVIGATION_ERRORS)
+
+
+def wait_for_any(
+    browser: WebDriver,
+    conditions: Mapping[str, Mapping[str, Any]],
+    timeout: float = 5,
+) -> Optional[str]:
+    """여러 이름 있는 조건을 동시에 기다려 처음 충족된 조건의 이름을 반환합니다.
+
+    각 조건을 차례로 기다리면 아무것도 충족되지 않을 때 모든 타임아웃을 합친 만큼
+    기다리게 되므로, 브라우저 안에서 모든 조건을 한꺼번에 감시합니다. 여러 조건이
+    동시에 참이면 conditions에 먼저 적힌 조건이 우선합니다.
+
+    조건은 다음 키를 조합한 딕셔너리이며, 적힌 키를 모두 만족해야 참입니다.
+
+    - ``url``: 현재 URL에 포함될 문자열 또는 컴파일된 정규식
+    - ``selector``: 존재해야 하는 CSS 선택자
+    - ``state``: selector 요소의 상태 ("present"(기본), "visible", "clickable")
+    - ``text``: selector 요소(없으면 body)의 텍스트에 포함될 문자열
+
+    Args:
+        browser: WebDriver 인스턴스입니다.
+        conditions: 조건 이름 → 조건 딕셔너리입니다 (순서가 우선순위).
+        timeout: 최대 대기 시간(초)입니다.
+
+    Returns:
+        처음 충족된 조건의 이름이거나, 시간 내에 아무것도 충족되지 않으면 None입니다.
+
+    Raises:
+        WebDriverException: 페이지 이동 외의 이유로 스크립트가 실패한 경우
+            (세션 종료, 잘못된 선택자 등).
+    """
+    payload = []
+    for name, condition in conditions.items():
+        condition = dict(condition)
+        url = condition.get("url")
+        if url is not None and not isinstance(url, str):
+            condition["url_regex"] = url.pattern
+            del condition["url"]
+        payload.append([name, condition])
+
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            result = browser.execute_async_script(
+                _ANY_OF_SCRIPT, payload, int(max(0.0, remaining) * 1000)
+            )
+            return result if isinstance(result, str) else None
+        except WebDriverException as e:
+            # 페이지 이동으로 스크립트가 중단되면 새 문서에서 다시 기다립니다.
+            # 세션 종료나 잘못된 선택자 같은 오류는 "충족된 조건 없음"과 구분되도록
+            # 그대로 전달합니다.
+            if not _interrupted_by_navigation(e):
+                raise
+            if remaining <= 0:
+                return None
+            time.sleep(0.05)
+
+
 def wait_for_element(
     browser: WebDriver, by: str, selector: str, timeout: int = 5
 ) -> WebElement:
@@ -34,9 +286,7 @@ def wait_for_element(
     Raises:
         TimeoutException: 지정된 시간 내에 요소를 찾지 못한 경우.
     """
-    return WebDriverWait(browser, timeout).until(
-        ec.presence_of_element_located((by, selector))
-    )
+    return wait_for_condition(browser, by, selector, "present", timeout)
 
 
 def wait_for_elements(
@@ -56,9 +306,7 @@ def wait_for_elements(
     Raises:
         TimeoutException: 지정된 시간 내에 요소를 찾지 못한 경우.
     """
-    return WebDriverWait(browser, timeout).until(
-        ec.presence_of_all_elements_located((by, selector))
-    )
+    return wait_for_condition(browser, by, selector, "all", timeout)
 
 
 def wait_for_element_if_visible(
@@ -76,8 +324,8 @@ def wait_for_element_if_visible(
         찾은 WebElement이거나, 보이지 않으면 None입니다.
     """
     try:
-        element = WebDriverWait(browser, timeout).until(
-            ec.visibility_of_element_located((by, selector))
+        element: WebElement = wait_for_condition(
+            browser, by, selector, "visible", timeout
         )
         return element
     except TimeoutException:
@@ -99,9 +347,10 @@ def wait_for_element_clickable(
         클릭 가능한 WebElement 또는 None (타임아웃 또는 예외 발생 시)입니다.
     """
     try:
-        return WebDriverWait(browser, timeout).until(
-            ec.element_to_be_clickable((by, selector))
+        element: WebElement = wait_for_condition(
+            browser, by, selector, "clickable", timeout
         )
+        return element
     except (TimeoutException, NoSuchElementException, StaleElementReferenceException):
         return None
 
@@ -140,3 +389,167 @@ def is_url_matching(browser: WebDriver, url_pattern: Union[str, Pattern[str]]) -
         return url_pattern in current_url
     else:  # 정규식 패턴인 경우
         return re.search(url_pattern, current_url) is not None
+
+
+def dom_interactive(browser: WebDriver) -> bool:
+    """문서 파싱이 끝났는지(readyState가 'loading'이 아닌지) 확인하는 대기 조건입니다.
+
+    Args:
+        browser: 웹드라이버 객체입니다.
+
+    Returns:
+        DOM을 읽을 수 있는 상태이면 True입니다.
+    """
+    return browser.execute_script("return document.readyState") != "loading"
+
+
+def stop_loading(browser: WebDriver) -> None:
+    """진행 중인 페이지 로드와 네트워크 요청을 중단합니다 (브라우저의 중지 버튼).
+
+    Args:
+        browser: 웹드라이버 객체입니다.
+    """
+    try:
+        browser.execute_script("window.stop();")
+    except WebDriverException:
+        pass
+
+
+def navigate(
+    browser: WebDriver,
+    url: str,
+    ready: Callable[[WebDriver], Any] = dom_interactive,
+    timeout: float = 15,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Any:
+    """URL로 이동한 뒤, 호출자가 지정한 준비 조건이 충족될 때까지 기다립니다.
+
+    드라이버의 pageLoadStrategy가 'eager' 또는 'none'이면 `get()`은 load 이벤트를
+    기다리지 않고 반환되므로, 실제로 필요한 DOM이 생기는 즉시 다음 단계로 진행할 수
+    있습니다. 'normal' 전략에서도 동일하게 동작합니다.
+
+    Args:
+        browser: 웹드라이버 객체입니다.
+        url: 이동할 URL입니다.
+        ready: WebDriverWait 조건 함수입니다 (예: `ec.presence_of_element_located(...)`).
+        timeout: 준비 조건을 기다릴 최대 시간(초)입니다.
+        cancelled: 지정하면 대기 중 폴링마다 확인하고, True를 반환하면 페이지 로드를
+            중단한 뒤 TaskCancelled를 발생시킵니다.
+
+    Returns:
+        준비 조건 함수가 반환한 값입니다.
+
+    Raises:
+        TimeoutException: 지정된 시간 내에 준비 조건이 충족되지 않은 경우.
+        TaskCancelled: 대기 중 취소된 경우.
+    """
+    browser.get(url)
+    if cancelled is None:
+        return WebDriverWait(browser, timeout).until(ready)
+
+    def ready_or_cancelled(driver: WebDriver) -> Any:
+        if cancelled():
+            # 아무도 보지 않을 결과를 끝까지 로드하지 않도록 요청을 끊습니다.
+            stop_loading(driver)
+            raise TaskCancelled()
+        return ready(driver)
+
+    return WebDriverWait(browser, timeout).until(ready_or_cancelled)
+
+
+# extract_fields()가 브라우저에서 실행하는 스크립트입니다.
+# 필드마다 선택자 목록을 순서대로 시도해 처음 일치한 요소의 값을 읽습니다.
+_EXTRACT_FIELDS_SCRIPT = """
+const read = (node, field, matched, prefix) => {
+  if (field.fields) { return extract(node, field.fields, matched, prefix); }
+  if (field.attr) {
+    return field.attr in node ? node[field.attr] : node.getAttribute(field.attr);
+  }
+  return (node.innerText || node.textContent || '').trim();
+};
+const extract = (base, spec, matched, prefix = '') => {
+  const out = {};
+  for (const [name, field] of Object.entries(spec)) {
+    const started = performance.now();
+    out[name] = field.exists ? false : (field.all ? [] : null);
+    let hit = null;
+    for (const selector of field.selectors) {
+      const nodes = base.querySelectorAll(selector);
+      if (!nodes.length) { continue; }
+      if (field.exists) { out[name] = true; }
+      // 하위 명세의 일치 기록은 첫 번째 요소 기준으로 남깁니다.
+      const sub = prefix + name + '.';
+      if (field.all) {
+        const rest = Array.from(nodes).slice(field.skip || 0);
+        out[name] = rest.map((n, i) => read(n, field, i ? null : matched, sub));
+      } else { out[name] = read(nodes[0], field, matched, sub); }
+      hit = selector;
+      break;
+    }
+    if (matched) { matched[prefix + name] = [hit, performance.now() - started]; }
+  }
+  return out;
+};
+if (!arguments[2]) { return extract(arguments[1] || document, arguments[0]); }
+const matched = {};
+const values = extract(arguments[1] || document, arguments[0], matched);
+return {values: values, matched: matched};
+"""
+
+
+def _normalize_spec(spec: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+    """선택자 목록만 준 필드를 {"selectors": [...]} 형태로 바꿉니다."""
+    normalized: dict[str, dict[str, Any]] = {}
+    for name, field in spec.items():
+        if isinstance(field, str):
+            field = {"selectors": [field]}
+        elif not isinstance(field, Mapping):
+            field = {"selectors": list(field)}
+        else:
+            field = dict(field)
+            if "fields" in field:
+                field["fields"] = _normalize_spec(field["fields"])
+        normalized[name] = field
+    return normalized
+
+
+def extract_fields(
+    browser: WebDriver,
+    spec: Mapping[str, Any],
+    root: Optional[WebElement] = None,
+    matched: Optional[dict[str, tuple[Optional[str], float]]] = None,
+) -> dict[str, Any]:
+    """선언적 필드 명세로 여러 값을 `execute_script` 한 번에 읽습니다.
+
+    요소마다 `find_elements`/`.text`를 호출하는 대신 브라우저 안에서 모든 선택자를
+    시도하므로, 필드 수와 선택자 수에 상관없이 WebDriver 왕복이 한 번입니다.
+
+    명세의 값은 선택자 목록이거나 다음 키를 가진 딕셔너리입니다.
+
+    - ``selectors``: 순서대로 시도할 CSS 선택자 목록 (처음 일치한 선택자를 사용)
+    - ``attr``: 텍스트 대신 읽을 속성/프로퍼티 이름 (예: "src", "href", "class")
+    - ``all``: True이면 일치한 모든 요소의 값을 목록으로 반환
+    - ``skip``: ``all``과 함께 쓰며, 앞의 N개 요소는 읽지 않음 (이미 읽은 요소)
+    - ``exists``: True이면 일치하는 요소가 있는지만 반환
+    - ``fields``: 일치한 요소마다 다시 적용할 하위 명세 (``all``과 함께 사용)
+
+    Args:
+        browser: WebDriver 인스턴스입니다.
+        spec: 필드 이름 → 선택자 목록 또는 필드 명세 딕셔너리입니다.
+        root: 지정하면 이 요소 안에서만 찾습니다.
+        matched: 지정하면 필드마다 (일치한 선택자 또는 None, 소요 시간 ms)를
+            채웁니다. 하위 명세의 필드는 "상위.하위" 이름으로, 첫 번째로 일치한 요소
+            기준으로 채웁니다. SelectorRegistry에 적중 기록을 남길 때 사용합니다.
+
+    Returns:
+        필드 이름 → 값(JSON) 딕셔너리입니다. 일치하는 요소가 없으면 None,
+        ``all``은 빈 목록, ``exists``는 False입니다.
+    """
+    result = browser.execute_script(
+        _EXTRACT_FIELDS_SCRIPT, _normalize_spec(spec), root, matched is not None
+    )
+    if matched is not None and isinstance(result, dict):
+        for name, (selector, elapsed_ms) in (result.get("matched") or {}).items():
+            matched[name] = (selector, float(elapsed_ms))
+        result = result.get("values")
+    return result if isinstance(result, dict) else {}
@@ -0,0 +1,130 @@
+"""WebDriver의 이름 있는 탭을 재사용하도록 관리합니다."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from selenium.common.exceptions import NoSuchWindowException
+
+from src.core.logger_setup import setup_logger
+from src.core.selenium_helpers import dom_interactive, navigate
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+
+class TabManager:
+    """하나의 드라이버에서 용도별("detail", "macro", "login" 등) 탭을 재사용합니다.
+
+    요청마다 `window.open`으로 탭을 만들고 닫는 대신, 처음 요청할 때 만든 탭을 이름으로
+    기억해 두고 같은 탭에서 다시 탐색합니다. 탭 핸들과 현재 탭을 직접 추적하므로
+    `window_handles`/`current_window_handle` 조회 없이 전환할 수 있습니다.
+    따라서 이 드라이버의 탭 전환은 TabManager를 통해서만 해야 합니다.
+    """
+
+    HOME = "home"
+
+    def __init__(self: "TabManager", driver: WebDriver) -> None:
+        """TabManager를 초기화합니다.
+
+        Args:
+            driver: 탭을 관리할 WebDriver 인스턴스입니다.
+        """
+        self.driver = driver
+        self._tabs: dict[str, str] = {}
+        self._current: Optional[str] = None
+
+    @property
+    def current_handle(self: "TabManager") -> str:
+        """현재 탭의 핸들입니다. 처음 접근할 때 한 번만 드라이버에 묻습니다."""
+        if self._current is None:
+            self._current = self.driver.current_window_handle
+            self._tabs.setdefault(self.HOME, self._current)
+        return self._current
+
+    def switch(self: "TabManager", target: str) -> bool:
+        """이름 또는 핸들로 지정한 탭으로 전환합니다.
+
+        Args:
+            target: 탭 이름이거나 탭 핸들입니다.
+
+        Returns:
+            전환에 성공하면 True, 탭이 닫혀 있으면 False입니다.
+        """
+        if self.HOME not in self._tabs:
+            _ = self.current_handle
+        handle = self._tabs.get(target, target)
+        if handle == self._current:
+            return True
+        try:
+            self.driver.switch_to.window(handle)
+        except NoSuchWindowException:
+            self._forget(handle)
+            return False
+        self._current = handle
+        return True
+
+    def home(self: "TabManager") -> bool:
+        """처음 사용하던 탭으로 돌아갑니다."""
+        return self.switch(self.HOME)
+
+    def open(
+        self: "TabManager",
+        name: str,
+        url: Optional[str] = None,
+        ready: Callable[[WebDriver], Any] = dom_interactive,
+        timeout: float = 15,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> str:
+        """이름 있는 탭으로 전환하고(없으면 만들고) url로 이동합니다.
+
+        Args:
+            name: 탭 이름입니다.
+            url: 이동할 URL입니다. None이면 전환만 합니다.
+            ready: 페이지 준비 조건입니다 (navigate 참조).
+            timeout: 준비 조건을 기다릴 최대 시간(초)입니다.
+            cancelled: 페이지 로드 취소 여부를 확인하는 함수입니다 (navigate 참조).
+
+        Returns:
+            탭 핸들입니다.
+
+        Raises:
+            TimeoutException: url로 이동한 뒤 준비 조건이 충족되지 않은 경우.
+            TaskCancelled: 페이지 로드를 기다리는 중 취소된 경우.
+        """
+        if not (name in self._tabs and self.switch(name)):
+            try:
+                _ = self.current_handle
+            except NoSuchWindowException:
+                # 현재 탭이 밖에서 닫힌 경우에도 새 탭은 만들 수 있습니다.
+                pass
+            self.driver.switch_to.new_window("tab")
+            self._current = self.driver.current_window_handle
+            self._tabs[name] = self._current
+            logger.debug(f"'{name}' 탭 생성: {self._current}")
+        if url:
+            navigate(self.driver, url, ready, timeout, cancelled)
+        return self.current_handle
+
+    def close(self: "TabManager", name: str) -> None:
+        """이름 있는 탭을 닫고 처음 탭으로 돌아갑니다."""
+        handle = self._tabs.get(name)
+        if handle is None or name == self.HOME:
+            return
+        if self.switch(handle):
+            try:
+                self.driver.close()
+            except NoSuchWindowException:
+                pass
+            self._forget(handle)
+        self.home()
+
+    def _forget(self: "TabManager", handle: str) -> None:
+        """닫힌 탭 핸들을 기록에서 지웁니다."""
+        for name in [n for n, h in self._tabs.items() if h == handle]:
+            del self._tabs[name]
+        if self._current == handle:
+            self._current = None
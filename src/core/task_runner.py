@@ -0,0 +1,177 @@
+"""검색/상세 조회/로그인처럼 오래 걸리는 작업을 GUI 스레드 밖에서 실행합니다.
+
+각 작업은 `QThreadPool`에서 실행되고 `CancellationToken`(`cancellation` 모듈)을
+인자로 받습니다. 작업은 그룹 단위로 묶이며, 같은 그룹의 작업은 한 번에 하나씩
+순서대로 실행됩니다(같은 드라이버를 쓰는 작업이 겹치지 않도록). 그룹마다 대기열을
+두고 실행 중인 작업이 끝날 때 다음 작업을 스레드 풀에 넣으므로, 차례를 기다리는
+작업이 풀 스레드를 차지하지 않습니다. `submit(..., cancel_previous=True)`로 제출하면
+같은 그룹에서 아직 끝나지 않은 이전 작업을 모두 취소하고(새 검색이 진행 중인 검색을
+대체하는 경우), 취소된 대기 작업은 실행하지 않고 버립니다.
+
+취소는 협조적입니다. 작업이 토큰을 확인하는 지점에서만 멈추며, 이미 보낸 WebDriver
+명령은 끝까지 실행됩니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.core.cancellation import CancellationToken, TaskCancelled
+from src.core.logger_setup import setup_logger
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+
+class _Task(QRunnable):
+    """TaskRunner가 스레드 풀에 넣는 작업 래퍼입니다."""
+
+    def __init__(
+        self: "_Task",
+        runner: "TaskRunner",
+        group: str,
+        fn: Callable[[CancellationToken], Any],
+        token: CancellationToken,
+        priority: int = 0,
+    ) -> None:
+        """작업 래퍼를 초기화합니다."""
+        super().__init__()
+        self.runner = runner
+        self.group = group
+        self.fn = fn
+        self.token = token
+        self.priority = priority
+
+    def run(self: "_Task") -> None:
+        """작업을 실행하고 끝나면 그룹의 다음 작업을 시작합니다."""
+        try:
+            if self.token.cancelled:
+                logger.debug(f"작업 '{self.group}' 시작 전에 취소되었습니다.")
+                return
+            self.fn(self.token)
+        except TaskCancelled:
+            logger.debug(f"작업 '{self.group}'이(가) 취소되었습니다.")
+        except Exception as e:
+            logger.error(f"작업 '{self.group}' 실행 중 오류: {e}", exc_info=True)
+            self.runner.task_failed.emit(self.group, str(e))
+        finally:
+            self.runner._finish(self)
+
+
+class TaskRunner(QObject):
+    """그룹별 취소 토큰을 관리하며 작업을 QThreadPool에서 실행합니다."""
+
+    # (그룹, 오류 메시지). 작업이 예외로 끝나면 발생합니다.
+    task_failed = pyqtSignal(str, str)
+
+    def __init__(self: "TaskRunner", max_threads: int = 4) -> None:
+        """TaskRunner를 초기화합니다.
+
+        Args:
+            max_threads: 동시에 실행할 최대 작업 수입니다.
+        """
+        super().__init__()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max(1, max_threads))
+        self._lock = threading.Lock()
+        # 그룹 → 가장 최근에 제출한 작업의 토큰
+        self._tokens: Dict[str, CancellationToken] = {}
+        # 그룹 → 차례를 기다리는 작업
+        self._queues: Dict[str, Deque[_Task]] = {}
+        # 그룹 → 스레드 풀에 넣은(실행 중인) 작업
+        self._active: Dict[str, _Task] = {}
+
+    def submit(
+        self: "TaskRunner",
+        group: str,
+        fn: Callable[[CancellationToken], Any],
+        cancel_previous: bool = False,
+        priority: int = 0,
+    ) -> CancellationToken:
+        """작업을 스레드 풀에 제출합니다.
+
+        Args:
+            group: 작업 그룹 이름입니다. 같은 그룹의 작업은 순서대로 하나씩 실행됩니다.
+            fn: 취소 토큰을 받아 실행할 함수입니다.
+            cancel_previous: True이면 같은 그룹에서 실행 중이거나 대기 중인 이전
+                작업을 모두 취소합니다.
+            priority: 스레드 풀 대기열에서의 우선순위입니다. 작을수록 나중에
+                실행됩니다 (예: 백그라운드 갱신은 -1).
+
+        Returns:
+            이 작업의 취소 토큰입니다.
+        """
+        token = CancellationToken()
+        task = _Task(self, group, fn, token, priority)
+        with self._lock:
+            queue = self._queues.setdefault(group, deque())
+            if cancel_previous:
+                for previous in queue:
+                    previous.token.cancel()
+                # 취소된 대기 작업은 풀에 넣지 않고 바로 버립니다.
+                queue.clear()
+                if group in self._active:
+                    self._active[group].token.cancel()
+            self._tokens[group] = token
+            queue.append(task)
+            start = self._next_locked(group)
+        if start is not None:
+            self._pool.start(start, start.priority)
+        return token
+
+    def cancel(self: "TaskRunner", group: str) -> None:
+        """그룹의 가장 최근 작업을 취소합니다."""
+        with self._lock:
+            token = self._tokens.get(group)
+        if token is not None:
+            token.cancel()
+
+    def shutdown(self: "TaskRunner", timeout_ms: int = 3000) -> None:
+        """모든 작업을 취소하고 timeout_ms까지 실행 중인 작업이 끝나기를 기다립니다."""
+        with self._lock:
+            tasks = list(self._active.values())
+            for queue in self._queues.values():
+                tasks.extend(queue)
+                queue.clear()
+        for task in tasks:
+            task.token.cancel()
+        self._pool.clear()
+        if not self._pool.waitForDone(timeout_ms):
+            logger.warning("일부 백그라운드 작업이 종료 시간 안에 끝나지 않았습니다.")
+
+    def _next_locked(self: "TaskRunner", group: str) -> Optional[_Task]:
+        """그룹에 실행 중인 작업이 없으면 다음 대기 작업을 꺼내 반환합니다.
+
+        취소된 대기 작업은 건너뜁니다. `self._lock`을 잡은 상태에서 호출합니다.
+        """
+        if group in self._active:
+            return None
+        queue = self._queues.get(group)
+        while queue:
+            task = queue.popleft()
+            if task.token.cancelled:
+                logger.debug(f"작업 '{group}' 시작 전에 취소되었습니다.")
+                self._forget_locked(task)
+                continue
+            self._active[group] = task
+            return task
+        return None
+
+    def _forget_locked(self: "TaskRunner", task: _Task) -> None:
+        """작업이 그룹의 최근 작업이면 토큰을 정리합니다."""
+        if self._tokens.get(task.group) is task.token:
+            del self._tokens[task.group]
+
+    def _finish(self: "TaskRunner", task: _Task) -> None:
+        """끝난 작업을 정리하고 그룹의 다음 작업을 시작합니다."""
+        with self._lock:
+            if self._active.get(task.group) is task:
+                del self._active[task.group]
+            self._forget_locked(task)
+            start = self._next_locked(task.group)
+        if start is not None:
+            self._pool.start(start, start.priority)
@@ -101,6 +101,11 @@ def main() -> None:
 
         # 컨트롤러 초기화 (이미 로드된 플러그인이 있는 plugin_manager를 사용)
         main_controller = MainController(plugin_manager)
+        # 작업과 미리 받기를 먼저 멈춘 뒤 캐시를 닫고, 드라이버는 마지막에 종료합니다.
+        app.aboutToQuit.connect(main_controller.tasks.shutdown)
+        app.aboutToQuit.connect(main_controller.thumbnails.shutdown)
+        app.aboutToQuit.connect(plugin_manager.shutdown)
+        app.aboutToQuit.connect(browser_manager.quit)
 
         # 플러그인 매니저에 컨트롤러 설정
         plugin_manager.main_controller = main_controller
@@ -110,6 +115,9 @@ def main() -> None:
         main_controller.main_window = window
         window.show()
 
+        # 창이 표시된 직후 브라우저 예열 및 저장된 세션 복원 시작
+        main_controller.start_browser()
+
         sys.exit(app.exec())
     except Exception as e:
         # 오류 로깅
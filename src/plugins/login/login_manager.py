@@ -12,7 +12,11 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
-from src.core.selenium_helpers import wait_for_element, wait_for_element_clickable
+from src.core.selenium_helpers import (
+    navigate,
+    wait_for_element,
+    wait_for_element_clickable,
+)
 
 
 class LoginManager:
@@ -54,6 +58,27 @@ class LoginManager:
         except Exception:
             return False
 
+    def has_saved_session(self: "LoginManager", timeout: int = 2) -> bool:
+        """브라우저 프로필에 남아 있는 세션으로 로그인되어 있는지 확인합니다.
+
+        로그인이 필요한 마이페이지를 열어 로그인 페이지로 리디렉션되는지 확인합니다.
+
+        Args:
+            timeout: 리디렉션을 기다릴 최대 시간(초)입니다.
+
+        Returns:
+            로그인 페이지로 이동하지 않으면 True, 이동하거나 오류가 발생하면 False입니다.
+        """
+        try:
+            navigate(self.browser, "https://kream.co.kr/my", timeout=10)
+            try:
+                WebDriverWait(self.browser, timeout).until(ec.url_contains("/login"))
+                return False
+            except TimeoutException:
+                return self.is_logged_in()
+        except Exception:
+            return False
+
     def login(self: "LoginManager", email: str, password: str) -> bool:
         """현재 페이지에서 로그인을 시도합니다.
 
@@ -112,11 +137,9 @@ class LoginManager:
         logout_url = "https://kream.co.kr/logout"
         landing_url = "https://kream.co.kr/"
         try:
-            self.browser.get(logout_url)
-
             # 로그아웃 후 랜딩 페이지로 이동하는지 확인
             try:
-                WebDriverWait(self.browser, 5).until(ec.url_to_be(landing_url))
+                navigate(self.browser, logout_url, ec.url_to_be(landing_url), timeout=5)
                 return True
             except TimeoutException:
                 return False
@@ -5,13 +5,20 @@
 
 from __future__ import annotations
 
+import json
+import os
 from typing import TYPE_CHECKING, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as ec
 
+from src.core.config import get_cache_dir
+from src.core.logger_setup import setup_logger
 from src.core.plugin_base import PluginBase
+from src.core.selenium_helpers import navigate
 from src.plugins.login.login_manager import LoginManager
 from src.plugins.macro.macro_toast_handler import MacroToastHandler  # noqa: E501, F401
 
@@ -21,6 +28,9 @@ if TYPE_CHECKING:
     from src.core.browser import BrowserManager
     from src.core.plugin_manager import PluginManager
 
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
 
 class LoginPlugin(PluginBase, QObject):
     """크림 웹사이트의 로그인 작업을 처리합니다."""
@@ -43,27 +53,112 @@ class LoginPlugin(PluginBase, QObject):
             plugin_manager=plugin_manager,
         )
         QObject.__init__(self)
-        actual_browser_driver: WebDriver = browser.get_driver()
-        # LoginManager 인스턴스 생성
-        self.login_manager = LoginManager(actual_browser_driver)
+        # 드라이버는 백그라운드 예열 또는 첫 사용 시점에 실행되므로,
+        # LoginManager/MacroToastHandler는 처음 접근할 때 생성합니다.
+        self._login_manager: Optional[LoginManager] = None
+        self._toast_handler: Optional[MacroToastHandler] = None
         # click_term 기본값 설정
         default_click_term = 8
-        click_term = config.getint("Macro", "min_interval", fallback=default_click_term)
-        self.toast_handler = MacroToastHandler(
-            browser=actual_browser_driver, click_term=click_term
+        self.click_term = config.getint(
+            "Macro", "min_interval", fallback=default_click_term
+        )
+        # 영구 프로필을 쓰는 경우, 마지막으로 로그인한 계정 정보를 함께 보관합니다.
+        self.persistent_profile = config.getboolean(
+            "Browser", "persistent_profile", fallback=True
         )
+        self.saved_email: Optional[str] = self._load_saved_email()
+
+    @property
+    def login_manager(self: "LoginPlugin") -> LoginManager:
+        """기본 드라이버에 연결된 LoginManager를 반환합니다."""
+        driver: WebDriver = self.browser.get_driver()
+        if self._login_manager is None or self._login_manager.browser is not driver:
+            self._login_manager = LoginManager(driver)
+        return self._login_manager
+
+    @property
+    def toast_handler(self: "LoginPlugin") -> MacroToastHandler:
+        """기본 드라이버에 연결된 MacroToastHandler를 반환합니다."""
+        driver: WebDriver = self.browser.get_driver()
+        if self._toast_handler is None or self._toast_handler.browser is not driver:
+            self._toast_handler = MacroToastHandler(
+                browser=driver, click_term=self.click_term
+            )
+        return self._toast_handler
+
+    def _session_file(self: "LoginPlugin") -> str:
+        """저장된 세션의 계정 정보를 기록하는 파일 경로를 반환합니다."""
+        return os.path.join(get_cache_dir(self.config, "profiles"), "session.json")
+
+    def _load_saved_email(self: "LoginPlugin") -> Optional[str]:
+        """마지막으로 로그인한 이메일을 읽습니다. 없으면 None을 반환합니다."""
+        if not self.persistent_profile:
+            return None
+        try:
+            with open(self._session_file(), encoding="utf-8") as f:
+                email = json.load(f).get("email")
+            return email if isinstance(email, str) else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _save_email(self: "LoginPlugin", email: Optional[str]) -> None:
+        """로그인한 이메일을 기록하거나, None이면 기록을 삭제합니다."""
+        self.saved_email = email
+        if not self.persistent_profile:
+            return
+        try:
+            if email is None:
+                if os.path.exists(self._session_file()):
+                    os.remove(self._session_file())
+                return
+            with open(self._session_file(), "w", encoding="utf-8") as f:
+                json.dump({"email": email}, f)
+        except OSError as e:
+            logger.warning(f"세션 계정 정보 저장 실패: {e}")
+
+    def restore_session(self: "LoginPlugin") -> bool:
+        """영구 프로필에 저장된 세션으로 로그인 상태를 복원합니다.
+
+        Returns:
+            저장된 세션이 유효하면 True를 반환하고 login_status 시그널을 발생시킵니다.
+        """
+        if not self.persistent_profile or self.saved_email is None:
+            return False
+        # HTTP로 먼저 확인하고, 판단할 수 없을 때만 브라우저로 마이페이지를 엽니다.
+        logged_in = self.browser.http.is_logged_in()
+        if logged_in is None:
+            logged_in = self.login_manager.has_saved_session()
+        if not logged_in:
+            logger.info("저장된 세션이 만료되어 로그인이 필요합니다.")
+            self._save_email(None)
+            return False
+        logger.info("저장된 세션으로 로그인 상태를 복원했습니다.")
+        self.login_status.emit(True, "저장된 세션으로 로그인되었습니다.")
+        return True
 
     def login(self: "LoginPlugin", email: str, password: str) -> None:
         """크림 웹사이트에 로그인을 시도합니다."""
         # 로그인 페이지로 이동
         login_url = "https://kream.co.kr/login"
-        self.browser.get_driver().get(login_url)
+        try:
+            navigate(
+                self.browser.get_driver(),
+                login_url,
+                ec.presence_of_element_located(
+                    (By.CSS_SELECTOR, "input[type='email']")
+                ),
+                timeout=10,
+            )
+        except TimeoutException:
+            logger.warning("로그인 입력란이 시간 내에 나타나지 않았습니다.")
 
         # LoginManager를 사용하여 로그인 수행
         login_success = self.login_manager.login(email, password)
 
         # 로그인 결과 처리
         if login_success:
+            self._save_email(email)
+            self.browser.http.sync_cookies(force=True)
             self.login_status.emit(True, "로그인 성공")
         else:
             self.login_status.emit(False, "로그인 실패")
@@ -71,7 +166,9 @@ class LoginPlugin(PluginBase, QObject):
     def logout(self: "LoginPlugin") -> None:
         """크림 웹사이트에서 로그아웃을 시도합니다."""
         try:
+            self._save_email(None)
             logout_success = self.login_manager.logout()
+            self.browser.http.invalidate()
             if not logout_success:
                 raise TimeoutException(
                     "로그아웃 실패: 로그아웃 처리가 완료되지 않았습니다."
@@ -13,10 +13,12 @@ from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.ui import WebDriverWait
 
+from src.core.resource_blocking import record_page_load
 from src.core.selenium_helpers import (
+    navigate,
     safe_click,
+    wait_for_condition,
     wait_for_element,
     wait_for_element_clickable,
     wait_for_elements,
@@ -38,16 +40,20 @@ def open_inventory_page(
     """
     inventory_url = f"https://kream.co.kr/inventory/{product_id}"
     try:
-        browser.get(inventory_url)
-
-        # 인벤토리 페이지 로딩 대기
-        inventory_list = wait_for_element(
-            browser, By.CSS_SELECTOR, "div.inventory_size_list", timeout=15
+        # 인벤토리 페이지 이동 후 사이즈 목록이 생기는 즉시 진행
+        inventory_list = navigate(
+            browser,
+            inventory_url,
+            ec.presence_of_element_located(
+                (By.CSS_SELECTOR, "div.inventory_size_list")
+            ),
+            timeout=15,
         )
 
         if inventory_list:
             if logger:
                 logger.info(f"인벤토리 페이지 로드 성공: {inventory_url}")
+            record_page_load(browser, "inventory")
             return True
         else:
             if logger:
@@ -420,12 +426,9 @@ def handle_payment_process(
             )
 
         try:
-            final_purchase_button = WebDriverWait(
-                browser, 5
-            ).until(  # 20초에서 5초로 단축
-                ec.element_to_be_clickable(
-                    (By.CSS_SELECTOR, final_payment_button_selector)
-                )
+            # 버튼이 활성화되는 즉시 진행 (폴링 간격 없이 DOM 변경 감지)
+            final_purchase_button = wait_for_condition(
+                browser, By.CSS_SELECTOR, final_payment_button_selector, "clickable", 5
             )
             if logger:
                 logger.info("팝업 내 최종 '보증금 결제하기' 버튼이 활성화되었습니다.")
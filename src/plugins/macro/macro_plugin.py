@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, List, Optional
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from PyQt6.QtWidgets import QComboBox, QDialog, QDialogButtonBox, QLabel, QVBoxLayout
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
@@ -21,9 +21,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from src.core.logger_setup import setup_logger
 from src.core.plugin_base import PluginBase
 from src.core.selenium_helpers import (
+    extract_fields,
     is_url_matching,
+    wait_for_any,
     wait_for_element,
-    wait_for_elements,
 )
 from src.plugins.login.login_manager import LoginManager
 from src.plugins.macro.macro_actions import (
@@ -31,7 +32,7 @@ from src.plugins.macro.macro_actions import (
     handle_payment_process,
     submit_inventory_form,
 )
-from src.plugins.macro.macro_toast_handler import MacroToastHandler
+from src.plugins.macro.macro_toast_handler import TOAST_SELECTOR, MacroToastHandler
 
 if TYPE_CHECKING:
     from src.core.browser import BrowserManager
@@ -39,6 +40,19 @@ if TYPE_CHECKING:
     from src.ui.main_window import MainWindow
 
 
+# 매크로 루프가 구분하는 페이지 상태 (앞에 적힌 상태가 우선, wait_for_any 조건)
+MACRO_PAGE_STATES = {
+    "toast": {"selector": TOAST_SELECTOR},
+    "login": {"url": "login"},
+    "payment": {"selector": "span.title_txt", "text": "신청 내역"},
+    "inner_label": {"selector": "div.layer_container", "text": "안쪽 라벨 사이즈"},
+    "inventory": {"url": "inventory"},
+}
+MACRO_PAGE_STATES_NO_TOAST = {
+    name: condition for name, condition in MACRO_PAGE_STATES.items() if name != "toast"
+}
+
+
 class MacroWorker(QObject):
     """매크로 작업을 별도의 스레드에서 처리하는 클래스입니다."""
 
@@ -78,6 +92,21 @@ class MacroWorker(QObject):
         )
         self.toast_handler.log_message_signal.connect(self.log_message)
 
+    def replace_browser(self: "MacroWorker", browser_driver: WebDriver) -> None:
+        """재생성된 드라이버로 작업 대상을 교체합니다 (감시 스레드에서 호출)."""
+        self.browser = browser_driver
+        self.login_manager.browser = browser_driver
+        self.toast_handler.browser = browser_driver
+        self.log_message.emit("브라우저가 복구되어 매크로를 계속합니다.")
+
+    def _refresh_after_error(self: "MacroWorker") -> None:
+        """오류 후 새로고침합니다. 브라우저가 죽었으면 감시 스레드의 복구를 기다립니다."""
+        try:
+            self.browser.refresh()
+        except Exception:
+            self.logger.warning("새로고침 실패. 브라우저 복구를 기다립니다.")
+            time.sleep(2)
+
     def _handle_toast(self) -> bool:
         """토스트 메시지 처리 후 루프를 즉시 재시작할지 여부를 반환합니다."""
         return self.toast_handler.handle_toast()
@@ -129,10 +158,8 @@ class MacroWorker(QObject):
 
     def _handle_inventory_submit(self) -> bool:
         """인벤토리 폼 제출 및 처리 후 루프 재시작 여부 반환."""
-        if (
-            "inventory" in self.browser.current_url
-            and title_text_check(self.browser) != "신청 내역"
-        ):
+        # 신청 내역(결제) 페이지 여부는 run()의 상태 판별에서 먼저 확인합니다.
+        if "inventory" in self.browser.current_url:
             old_form = None
             try:
                 old_form = wait_for_element(
@@ -184,29 +211,37 @@ class MacroWorker(QObject):
 
         while self.is_running:
             try:
-                if self._handle_toast():
-                    continue
+                # 페이지 상태를 한 번에 기다려, 해당 상태의 처리기만 실행합니다.
+                state = wait_for_any(self.browser, MACRO_PAGE_STATES, timeout=2)
 
-                if self._handle_login():
+                if state == "toast":
+                    if self._handle_toast():
+                        continue
+                    # 처리할 필요 없는 토스트이면 나머지 상태를 즉시 다시 판별합니다.
+                    state = wait_for_any(self.browser, MACRO_PAGE_STATES_NO_TOAST, 0)
+
+                if state == "login" and self._handle_login():
                     continue
 
-                if self._handle_payment_page():
+                if state == "payment" and self._handle_payment_page():
                     continue
 
-                if self._handle_inventory_submit():
+                if state == "inner_label":
+                    self._handle_inner_label()
                     continue
 
-                self._handle_inner_label()
+                if state == "inventory" and self._handle_inventory_submit():
+                    continue
 
             except TimeoutException:
                 self.log_message.emit("오류 발생 (타임아웃). 새로고침 후 재시도합니다.")
-                self.browser.refresh()
+                self._refresh_after_error()
                 self._count = 0
             except Exception:
                 self.log_message.emit(
                     "예상치 못한 오류 발생. 새로고침 후 재시도합니다."
                 )
-                self.browser.refresh()
+                self._refresh_after_error()
                 self._count = 0
 
         if not self._final_log_emitted:
@@ -253,47 +288,46 @@ class MacroPlugin(PluginBase):
         self.macro_worker: Optional[MacroWorker] = None
         self.main_window: Optional["MainWindow"] = None
 
+        # 매크로 탭으로 전환하기 전에 보던 탭 (매크로 종료 시 돌아갈 탭)
         self.original_tab_handle: Optional[str] = None
-        self.macro_tab_handle: Optional[str] = None
         self.new_tab_opened_by_macro: bool = False
+        self.browser.add_recovery_listener(self._on_driver_recovered)
+
+    def _on_driver_recovered(
+        self: "MacroPlugin", dead: WebDriver, new: WebDriver
+    ) -> None:
+        """기본 드라이버가 재생성되면 실행 중인 매크로가 새 드라이버를 쓰게 합니다.
+
+        새 드라이버에는 복원된 탭 하나만 있으므로 이전 탭 핸들은 버립니다.
+        """
+        if self.macro_worker is None or self.macro_worker.browser is not dead:
+            return
+        self.original_tab_handle = None
+        self.new_tab_opened_by_macro = False
+        self.macro_worker.replace_browser(new)
 
     def _open_new_tab_and_go_to_url(
         self: "MacroPlugin", url: str
     ) -> Optional[WebDriver]:
-        """Opens a new browser tab and navigates to the given URL."""
+        """매크로 전용 탭으로 전환하고(없으면 만들고) 주어진 URL로 이동합니다."""
         driver = self.browser.get_driver()
         if not driver:
             self.main_controller_log("WebDriver가 초기화되지 않았습니다.")
             return None
 
-        self.original_tab_handle = driver.current_window_handle
-        existing_handles = set(driver.window_handles)
-
-        driver.execute_script("window.open('', '_blank');")
-
-        new_handle_found = None
-        for handle in driver.window_handles:
-            if handle not in existing_handles:
-                new_handle_found = handle
-                break
-
-        if new_handle_found:
-            driver.switch_to.window(new_handle_found)
-            self.macro_tab_handle = new_handle_found
-            self.new_tab_opened_by_macro = True
-            if url:
-                driver.get(url)
-            return driver
-        else:
-            self.main_controller_log(
-                "새 탭을 열지 못했습니다. 팝업 차단 등을 확인해주세요."
-            )
-            if (
-                self.original_tab_handle
-                and self.original_tab_handle in driver.window_handles
-            ):
-                driver.switch_to.window(self.original_tab_handle)
+        tabs = self.browser.tabs(driver)
+        self.original_tab_handle = tabs.current_handle
+        try:
+            tabs.open("macro", url)
+        except TimeoutException:
+            # 페이지 준비 여부는 호출자가 사이즈 목록을 기다리며 확인합니다.
+            pass
+        except WebDriverException as e:
+            self.main_controller_log(f"매크로 탭을 열지 못했습니다: {e}")
+            tabs.switch(self.original_tab_handle)
             return None
+        self.new_tab_opened_by_macro = True
+        return driver
 
     def start_macro_dialog(self: "MacroPlugin") -> None:
         """Shows a dialog to configure and start the macro."""
@@ -315,7 +349,6 @@ class MacroPlugin(PluginBase):
             return
 
         current_url = driver.current_url
-        self.original_tab_handle = driver.current_window_handle
 
         if "inventory" not in current_url or product_id not in current_url:
             target_url = f"https://kream.co.kr/inventory/{product_id}/"
@@ -325,32 +358,31 @@ class MacroPlugin(PluginBase):
                 )
                 return
         else:
-            self.macro_tab_handle = driver.current_window_handle
             self.new_tab_opened_by_macro = False
 
         try:
-            size_elements = wait_for_elements(
-                driver,
-                By.CSS_SELECTOR,
-                "div.inventory_size_item",
-                timeout=10,
+            wait_for_element(
+                driver, By.CSS_SELECTOR, "div.inventory_size_item", timeout=10
             )
-            size_options = [
-                elem.text.strip() for elem in size_elements if elem.text.strip()
-            ]
+            # 사이즈 이름을 요소마다 읽지 않고 한 번의 execute_script로 가져옵니다.
+            size_texts = extract_fields(
+                driver,
+                {"sizes": {"selectors": ["div.inventory_size_item"], "all": True}},
+            ).get("sizes", [])
+            size_options = [text for text in size_texts if text]
             if not size_options:
                 self.log_signal.emit(
                     "현재 페이지에서 사이즈 옵션을 찾을 수 없습니다. 상품 상세 페이지로 이동해주세요."
                 )
-                self._close_macro_tab_if_opened()
+                self._leave_macro_tab()
                 return
         except TimeoutException:
             self.log_signal.emit("사이즈 옵션을 가져오는 데 실패했습니다.")
-            self._close_macro_tab_if_opened()
+            self._leave_macro_tab()
             return
         except Exception as e:
             self.log_signal.emit(f"사이즈 옵션 가져오기 오류: {str(e)}")
-            self._close_macro_tab_if_opened()
+            self._leave_macro_tab()
             return
 
         self._show_settings_dialog_and_start(size_options, product_id, driver)
@@ -367,7 +399,7 @@ class MacroPlugin(PluginBase):
         """Shows the settings dialog and starts the macro worker if confirmed."""
         if not driver:
             self.log_signal.emit("브라우저 드라이버가 유효하지 않습니다.")
-            self._close_macro_tab_if_opened()
+            self._leave_macro_tab()
             return
 
         if self.worker_thread and self.worker_thread.isRunning():
@@ -382,7 +414,7 @@ class MacroPlugin(PluginBase):
 
             if not email_cfg or not password_cfg:
                 self.log_signal.emit("설정에서 KREAM 이메일과 비밀번호를 입력해주세요.")
-                self._close_macro_tab_if_opened(driver)
+                self._leave_macro_tab(driver)
                 return
 
             if is_url_matching(driver, "kream.co.kr/login"):
@@ -395,55 +427,43 @@ class MacroPlugin(PluginBase):
                     self.log_signal.emit(
                         "로그인 실패. 설정을 확인하거나 수동으로 로그인해주세요."
                     )
-                    self._close_macro_tab_if_opened(driver)
+                    self._leave_macro_tab(driver)
                     return
             else:
                 self.log_signal.emit("로그인 페이지로 이동하여 로그인을 시도합니다.")
-                original_handle_for_login = driver.current_window_handle
-                login_attempt_tab_handle: Optional[str] = None
-                existing_handles_before_login_tab = set(driver.window_handles)
+                tabs = self.browser.tabs(driver)
+                macro_handle = tabs.current_handle
 
                 try:
-                    driver.execute_script("window.open('', '_blank');")
-                    for handle in driver.window_handles:
-                        if handle not in existing_handles_before_login_tab:
-                            login_attempt_tab_handle = handle
-                            break
-
-                    if login_attempt_tab_handle:
-                        driver.switch_to.window(login_attempt_tab_handle)
-                        driver.get("https://kream.co.kr/login")
-                        time.sleep(1)
-
-                        if login_manager.login(email_cfg, password_cfg):
-                            self.log_signal.emit("로그인 성공.")
-                            driver.close()
-                            driver.switch_to.window(original_handle_for_login)
-                            self.macro_tab_handle = original_handle_for_login
-                            email = "current_session"
-                            password = "current_session"
-                        else:
-                            self.log_signal.emit(
-                                "로그인 실패. 설정을 확인하거나 수동으로 로그인해주세요."
-                            )
-                            driver.close()
-                            driver.switch_to.window(original_handle_for_login)
-                            self._close_macro_tab_if_opened(driver)
-                            return
+                    # 로그인 전용 탭을 재사용하고, 끝나면 매크로 탭으로 돌아옵니다.
+                    try:
+                        tabs.open(
+                            "login",
+                            "https://kream.co.kr/login",
+                            ec.presence_of_element_located(
+                                (By.CSS_SELECTOR, "input[type='email']")
+                            ),
+                            timeout=10,
+                        )
+                    except TimeoutException:
+                        pass
+
+                    login_success = login_manager.login(email_cfg, password_cfg)
+                    tabs.switch(macro_handle)
+                    if login_success:
+                        self.log_signal.emit("로그인 성공.")
+                        email = "current_session"
+                        password = "current_session"
                     else:
-                        self.log_signal.emit("로그인을 위한 새 탭을 열지 못했습니다.")
-                        self._close_macro_tab_if_opened(driver)
+                        self.log_signal.emit(
+                            "로그인 실패. 설정을 확인하거나 수동으로 로그인해주세요."
+                        )
+                        self._leave_macro_tab(driver)
                         return
                 except Exception as e_login_tab:
                     self.log_signal.emit(f"로그인 탭 처리 중 오류: {e_login_tab}")
-                    if (
-                        login_attempt_tab_handle
-                        and login_attempt_tab_handle in driver.window_handles
-                    ):
-                        driver.close()
-                    if original_handle_for_login in driver.window_handles:
-                        driver.switch_to.window(original_handle_for_login)
-                    self._close_macro_tab_if_opened(driver)
+                    tabs.switch(macro_handle)
+                    self._leave_macro_tab(driver)
                     return
         else:
             email = "current_session"
@@ -460,7 +480,7 @@ class MacroPlugin(PluginBase):
             self.log_signal.emit(
                 "메인 윈도우를 찾을 수 없어 매크로 설정을 표시할 수 없습니다."
             )
-            self._close_macro_tab_if_opened()
+            self._leave_macro_tab()
             return
 
         dialog = QDialog(self.main_window)
@@ -547,102 +567,40 @@ class MacroPlugin(PluginBase):
             self.macro_status_signal.emit(True)
 
         else:
-            self._close_macro_tab_if_opened(driver)
+            self._leave_macro_tab(driver)
 
-    def _close_macro_tab_if_opened(
+    def _leave_macro_tab(
         self: "MacroPlugin", driver_arg: Optional[WebDriver] = None
     ) -> None:
-        """매크로가 새 탭을 열었다면 해당 탭을 닫고, 원래 탭으로 돌아갑니다."""
-        driver = driver_arg if driver_arg else self.browser.get_driver()
+        """매크로 탭에서 매크로 시작 전에 보던 탭으로 돌아갑니다.
 
-        if not driver:
-            if self.new_tab_opened_by_macro:
-                self.main_controller_log(
-                    "정보: 매크로 탭을 닫으려 했으나, WebDriver가 유효하지 않습니다."
-                )
-            self.new_tab_opened_by_macro = False
-            self.macro_tab_handle = None
-            return
-
-        if not self.new_tab_opened_by_macro or not self.macro_tab_handle:
-            self.new_tab_opened_by_macro = False
-            self.macro_tab_handle = None
+        매크로 탭은 닫지 않고 다음 실행에서 같은 탭을 다시 사용합니다.
+        """
+        driver = driver_arg if driver_arg else self.browser.get_driver()
+        target = self.original_tab_handle
+        opened = self.new_tab_opened_by_macro
+        self.original_tab_handle = None
+        self.new_tab_opened_by_macro = False
+        if not driver or not opened:
             return
 
-        original_macro_tab_handle = self.macro_tab_handle
-
         try:
-            current_handles_before_close = driver.window_handles
-            if original_macro_tab_handle in current_handles_before_close:
-                if driver.current_window_handle == original_macro_tab_handle:
-                    driver.close()
-                else:
-                    if original_macro_tab_handle in driver.window_handles:
-                        driver.switch_to.window(original_macro_tab_handle)
-                        driver.close()
-                    else:
-                        self.main_controller_log(
-                            f"정보: 매크로 탭({original_macro_tab_handle})이 전환 직전에 닫혔습니다."
-                        )
-                        return
-            else:
-                self.main_controller_log(
-                    f"정보: 매크로 탭({original_macro_tab_handle})은 이미 닫혀있었습니다."
-                )
-        except Exception as e:
-            self.main_controller_log(
-                f"오류: 매크로 탭({original_macro_tab_handle}) 닫기 실패 - {type(e).__name__}: {e}"
-            )
-        finally:
-            self.macro_tab_handle = None
-            self.new_tab_opened_by_macro = False
-
-        try:
-            try:
-                remaining_handles = driver.window_handles
-            except Exception as e_get_handles:
-                self.main_controller_log(
-                    f"정보: 브라우저 세션이 유효하지 않아 탭 전환을 스킵합니다 - {type(e_get_handles).__name__}"
-                )
-                return
-
-            if not remaining_handles:
-                self.main_controller_log("정보: 모든 브라우저 탭이 닫혔습니다.")
-                return
-
-            target_switch_handle = None
-            if (
-                self.original_tab_handle
-                and self.original_tab_handle in remaining_handles
-            ):
-                target_switch_handle = self.original_tab_handle
-            elif remaining_handles:
-                target_switch_handle = remaining_handles[0]
-
-            if target_switch_handle:
-                try:
-                    current_active_handle = driver.current_window_handle
-                    needs_switch = current_active_handle != target_switch_handle
-                except Exception:
-                    needs_switch = True
-
-                if needs_switch:
-                    driver.switch_to.window(target_switch_handle)
-
+            tabs = self.browser.tabs(driver)
+            if not (target and tabs.switch(target)):
+                tabs.home()
         except Exception as e_switch:
             if (
                 "no such window" not in str(e_switch).lower()
-                and "target window already closed" not in str(e_switch).lower()
                 and "invalid session id" not in str(e_switch).lower()
             ):
                 self.main_controller_log(
-                    f"오류: 탭 전환 중 예기치 않은 문제 발생 후 - {type(e_switch).__name__}: {e_switch}"
+                    f"오류: 원래 탭으로 돌아가는 중 문제 발생 - {type(e_switch).__name__}: {e_switch}"
                 )
 
     def _on_macro_finished(self: "MacroPlugin") -> None:
         """매크로 종료 시 탭 닫기 및 스레드 종료 처리 로직입니다."""
         driver = self.browser.get_driver()
-        self._close_macro_tab_if_opened(driver)
+        self._leave_macro_tab(driver)
 
         if self.worker_thread:
             self.worker_thread.quit()
@@ -657,7 +615,7 @@ class MacroPlugin(PluginBase):
             self.macro_worker.stop()
 
         driver = self.browser.get_driver()
-        self._close_macro_tab_if_opened(driver)
+        self._leave_macro_tab(driver)
 
         if self.worker_thread:
             self.worker_thread.quit()
@@ -2,7 +2,7 @@
 
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from selenium.common.exceptions import TimeoutException
@@ -14,6 +14,29 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 # logger_setup 임포트
 from src.core.logger_setup import setup_logger
+from src.core.selector_registry import get_registry
+from src.core.selenium_helpers import wait_for_condition
+
+# 표시 중인 토스트 요소 선택자 (앞의 것부터 텍스트를 확인)
+TOAST_SELECTORS = [
+    "div#toast.toast.lg.show",
+    "div#toast.toast.mo.show",
+    "div.toast.lg.show",
+    "div.toast.mo.show",
+    "div.toast.show",
+]
+# 위 선택자 중 하나라도 나타나기를 기다릴 때 쓰는 합친 선택자
+TOAST_SELECTOR = ", ".join(TOAST_SELECTORS)
+
+# 토스트 요소 안에서 메시지 텍스트를 찾을 선택자 (적힌 순서대로 시도)
+TOAST_TEXT_SELECTORS = [
+    "div.toast-content p",
+    ".toast-content",
+    "p",
+    ".toast-message",
+    "span",
+    "div",
+]
 
 
 class MacroToastHandler(QObject):
@@ -54,35 +77,29 @@ class MacroToastHandler(QObject):
             bool: 토스트 메시지 처리 후 매크로를 즉시 반환(중단 또는 재시작 결정)해야 하면 True,
                   그렇지 않으면 False를 반환합니다.
         """
-        toast_selectors: List[str] = [
-            "div#toast.toast.lg.show",
-            "div#toast.toast.mo.show",
-            "div.toast.lg.show",
-            "div.toast.mo.show",
-            "div.toast.show",
-        ]
-
-        for selector in toast_selectors:
-            try:
-                popup = WebDriverWait(self.browser, 0.5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                popup_text = self._get_toast_text(popup)
-
-                if popup_text:
-                    self.logger.debug(
-                        f"토스트 감지됨: '{popup_text}' (선택자: {selector})"
-                    )
-                    return self._process_toast_message(popup_text)
-
-            except TimeoutException:
-                continue
-            except Exception as e:
-                # UI 및 파일 로깅
-                error_msg = f"토스트 메시지 처리 중 오류: {str(e)}"
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.log_message_signal.emit(f"[{timestamp}] {error_msg}")
-                self.logger.error(error_msg, exc_info=True)
+        # 선택자마다 0.5초씩 기다리지 않고, 어느 하나라도 나타나는 즉시 반환합니다.
+        try:
+            wait_for_condition(
+                self.browser, By.CSS_SELECTOR, TOAST_SELECTOR, "present", 0.5
+            )
+            # 처음 일치한 토스트의 텍스트가 비어 있으면 다음 후보를 확인합니다.
+            for selector in TOAST_SELECTORS:
+                for popup in self.browser.find_elements(By.CSS_SELECTOR, selector):
+                    popup_text = self._get_toast_text(popup)
+                    if popup_text:
+                        self.logger.debug(
+                            f"토스트 감지됨: '{popup_text}' (선택자: {selector})"
+                        )
+                        return self._process_toast_message(popup_text)
+
+        except TimeoutException:
+            pass
+        except Exception as e:
+            # UI 및 파일 로깅
+            error_msg = f"토스트 메시지 처리 중 오류: {str(e)}"
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.log_message_signal.emit(f"[{timestamp}] {error_msg}")
+            self.logger.error(error_msg, exc_info=True)
 
         return False
 
@@ -100,24 +117,26 @@ class MacroToastHandler(QObject):
         text = toast_element.text.strip()
         if text:
             return text
+        registry = get_registry()
+        content_selectors = TOAST_TEXT_SELECTORS
+        started = time.perf_counter()
         try:
-            content_selectors = [
-                "div.toast-content p",
-                ".toast-content",
-                "p",
-                ".toast-message",
-                "span",
-                "div",
-            ]
             for selector in content_selectors:
                 try:
                     elements = toast_element.find_elements(By.CSS_SELECTOR, selector)
                     for el in elements:
                         el_text = el.text.strip()
                         if el_text:
+                            registry.record(
+                                "toast.text",
+                                content_selectors,
+                                selector,
+                                (time.perf_counter() - started) * 1000,
+                            )
                             return el_text
                 except Exception:
                     continue
+            registry.record("toast.text", content_selectors, None)
         except Exception as e:
             self.logger.warning(
                 f"토스트 내부 텍스트 추출 중 오류: {str(e)}", exc_info=True
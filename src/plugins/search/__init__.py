@@ -3,7 +3,9 @@
 이 모듈은 상품 검색과 관련된 기능을 제공합니다.
 """
 
+from src.plugins.search.batch_lookup import BatchLookup
 from src.plugins.search.detail_plugin import DetailPlugin
+from src.plugins.search.product_record import ProductRecord
 from src.plugins.search.search_plugin import SearchPlugin
 
-__all__ = ["SearchPlugin", "DetailPlugin"]
+__all__ = ["SearchPlugin", "DetailPlugin", "ProductRecord", "BatchLookup"]
@@ -0,0 +1,269 @@
+"""검색어/모델번호 목록 파일을 여러 브라우저에서 동시에 조회해 CSV로 저장합니다.
+
+입력은 한 줄에 하나씩 적은 텍스트 파일이나 첫 번째 열에 검색어가 있는 CSV입니다.
+작업자마다 전용 SearchPlugin/DetailPlugin과 풀 드라이버를 사용하므로 화면의 검색
+결과나 매크로 탭에 영향을 주지 않습니다. 동시에 실행하는 작업자 수는
+`[Batch] workers`와 시작할 때 대여되지 않은 풀 드라이버 수 중 작은 값이며(최소 1),
+풀 드라이버가 모자라면 작업자는 다른 owner가 반납할 때까지 기다립니다.
+
+결과는 끝나는 순서대로 한 행씩 출력 CSV에 기록하므로(입력 순서는 index 열),
+도중에 중단해도 그때까지의 결과가 남습니다.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.core.browser import BrowserManager
+from src.core.cancellation import CancellationToken
+from src.core.logger_setup import setup_logger
+from src.plugins.search.detail_plugin import DetailPlugin
+from src.plugins.search.search_plugin import SearchPlugin
+
+if TYPE_CHECKING:
+    from configparser import ConfigParser
+
+    from src.core.detail_cache import DetailCache
+    from src.core.search_cache import SearchCache
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+OUTPUT_COLUMNS = (
+    "index",
+    "keyword",
+    "product_id",
+    "name",
+    "model_no",
+    "price",
+    "sizes",
+    "error",
+)
+# CSV 첫 행이 이 값 중 하나이면 머리글로 보고 건너뜁니다.
+HEADER_CELLS = frozenset(
+    {
+        "keyword",
+        "keywords",
+        "query",
+        "model",
+        "model_no",
+        "검색어",
+        "키워드",
+        "모델번호",
+    }
+)
+
+
+def read_keywords(path: str) -> List[str]:
+    """입력 파일에서 검색어 목록을 읽습니다.
+
+    CSV는 첫 번째 열만 사용하고, 텍스트 파일은 한 줄을 하나의 검색어로 봅니다.
+    빈 줄, '#'으로 시작하는 줄, 중복 검색어는 건너뜁니다.
+
+    Args:
+        path: 입력 파일 경로입니다.
+
+    Returns:
+        입력 순서대로의 검색어 목록입니다.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith(".csv"):
+            cells = [row[0] if row else "" for row in csv.reader(f)]
+            if cells and cells[0].strip().lower() in HEADER_CELLS:
+                cells = cells[1:]
+        else:
+            cells = f.read().splitlines()
+
+    keywords: List[str] = []
+    seen: set[str] = set()
+    for cell in cells:
+        keyword = " ".join(cell.split())
+        if not keyword or keyword.startswith("#") or keyword.lower() in seen:
+            continue
+        seen.add(keyword.lower())
+        keywords.append(keyword)
+    return keywords
+
+
+class BatchLookup(QObject):
+    """검색어 목록을 제한된 수의 작업자로 동시에 조회합니다."""
+
+    # (완료 수, 전체 수, 분당 처리 수)
+    progress = pyqtSignal(int, int, float)
+    # (출력 파일 경로, 성공 수, 실패 수)
+    finished = pyqtSignal(str, int, int)
+
+    def __init__(
+        self: "BatchLookup",
+        browser: BrowserManager,
+        config: ConfigParser,
+        cache: Optional[SearchCache] = None,
+        detail_cache: Optional[DetailCache] = None,
+    ) -> None:
+        """BatchLookup을 초기화합니다.
+
+        Args:
+            browser: BrowserManager 인스턴스입니다.
+            config: 설정 파서 인스턴스입니다.
+            cache: 작업자들이 함께 쓸 검색 캐시입니다 (보통 SearchPlugin의 캐시).
+            detail_cache: 작업자들이 함께 쓸 상세 정보 캐시입니다
+                (보통 DetailPlugin의 캐시).
+        """
+        super().__init__()
+        self.browser = browser
+        self.config = config
+        self.cache = cache
+        self.detail_cache = detail_cache
+        self.max_workers = max(1, config.getint("Batch", "workers", fallback=2))
+        # 실행마다 새로 만들지 않고 다음 실행에서도 다시 사용합니다.
+        self._workers: List[Tuple[SearchPlugin, DetailPlugin]] = []
+
+    def _worker_count(self: "BatchLookup", total: int) -> int:
+        """이번 실행의 작업자 수를 정합니다.
+
+        기본 드라이버는 로그인/매크로가 쓰고, 검색 플러그인은 풀 드라이버 하나를 계속
+        들고 있으므로 지금 대여되지 않은 풀 드라이버 수만큼만 동시에 실행합니다.
+        """
+        return max(1, min(self.max_workers, total, self.browser.free_pool_drivers()))
+
+    def _worker(self: "BatchLookup", index: int) -> Tuple[SearchPlugin, DetailPlugin]:
+        """index번째 작업자의 플러그인 쌍을 반환합니다. 없으면 만듭니다.
+
+        두 플러그인은 같은 이름("batch_<번호>")으로 같은 풀 드라이버를 대여하고,
+        화면의 플러그인과 같은 검색/상세 캐시를 사용합니다.
+        """
+        while len(self._workers) <= index:
+            name = f"batch_{len(self._workers)}"
+            search = SearchPlugin(name, self.browser, self.config, cache=self.cache)
+            # 첫 화면의 결과만 필요하므로 스크롤하며 더 읽지 않습니다.
+            search.stream_results = False
+            detail = DetailPlugin(
+                name, self.browser, self.config, cache=self.detail_cache
+            )
+            self._workers.append((search, detail))
+        return self._workers[index]
+
+    def run(
+        self: "BatchLookup",
+        input_path: str,
+        output_path: str,
+        token: Optional[CancellationToken] = None,
+    ) -> Tuple[int, int]:
+        """입력 파일의 검색어를 모두 조회해 출력 CSV에 기록합니다.
+
+        모든 작업자가 끝날 때까지 반환하지 않으므로 작업 스레드에서 호출합니다.
+
+        Args:
+            input_path: 검색어 목록 파일 경로입니다.
+            output_path: 결과를 기록할 CSV 경로입니다.
+            token: 취소 토큰입니다. 취소되면 진행 중인 항목까지만 기록합니다.
+
+        Returns:
+            (성공 수, 실패 수) 튜플입니다.
+        """
+        keywords = read_keywords(input_path)
+        total = len(keywords)
+        pending = deque(enumerate(keywords, start=1))
+        lock = threading.Lock()
+        counts = {"done": 0, "ok": 0}
+        started = time.monotonic()
+
+        def cancelled() -> bool:
+            return bool(token and token.cancelled)
+
+        worker_count = self._worker_count(total) if total else 0
+        workers = [self._worker(i) for i in range(worker_count)]
+        logger.info(
+            f"일괄 조회 시작: {total}개 검색어, 작업자 {worker_count}개 "
+            f"({input_path} → {output_path})"
+        )
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        # Excel에서 한글이 깨지지 않도록 BOM을 붙입니다.
+        with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS)
+            writer.writeheader()
+            f.flush()
+
+            def work(plugins: Tuple[SearchPlugin, DetailPlugin]) -> None:
+                search, detail = plugins
+                try:
+                    while not cancelled():
+                        with lock:
+                            if not pending:
+                                return
+                            index, keyword = pending.popleft()
+                        row = self._lookup(search, detail, keyword, cancelled)
+                        row["index"] = index
+                        # 상세 조회가 대여를 반납했을 수 있으므로 다음 검색에서 다시 대여합니다.
+                        search.driver = None
+                        with lock:
+                            writer.writerow(row)
+                            f.flush()
+                            counts["done"] += 1
+                            counts["ok"] += not row["error"]
+                            done = counts["done"]
+                        elapsed = time.monotonic() - started
+                        self.progress.emit(
+                            done, total, done * 60 / elapsed if elapsed else 0.0
+                        )
+                finally:
+                    # 다음 실행에서 드라이버를 다시 대여하도록 참조를 버리고 반납합니다.
+                    search.driver = None
+                    self.browser.release_driver(search.name)
+
+            if workers:
+                with ThreadPoolExecutor(
+                    max_workers=worker_count, thread_name_prefix="batch"
+                ) as executor:
+                    # 작업자 예외를 호출자에게 전달합니다.
+                    list(executor.map(work, workers))
+
+        ok, failed = counts["ok"], counts["done"] - counts["ok"]
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"일괄 조회 {'취소' if cancelled() else '완료'}: 성공 {ok}개, "
+            f"실패 {failed}개, 미처리 {total - counts['done']}개 ({elapsed:.1f}초)"
+        )
+        self.finished.emit(output_path, ok, failed)
+        return ok, failed
+
+    @staticmethod
+    def _lookup(
+        search: SearchPlugin,
+        detail: DetailPlugin,
+        keyword: str,
+        cancelled: Callable[[], bool],
+    ) -> Dict[str, Any]:
+        """검색어 하나를 검색하고 첫 번째 결과의 상세 정보를 조회합니다."""
+        row: Dict[str, Any] = {column: "" for column in OUTPUT_COLUMNS}
+        row["keyword"] = keyword
+        try:
+            products, error = search.lookup(keyword, cancelled)
+            if not products:
+                row["error"] = error or "검색 결과가 없습니다."
+                return row
+            record = products[0]
+            row.update(product_id=record.id, name=record.name, price=record.price)
+
+            details = detail.get_details(record.id, refresh_in_background=False)
+            if "error" in details:
+                row["error"] = f"상세 정보 조회 실패: {details['error']}"
+                return row
+            if details.get("recent_price") not in (None, "", "N/A"):
+                row["price"] = details["recent_price"]
+            if details.get("model_no") not in (None, "N/A"):
+                row["model_no"] = details["model_no"]
+            row["sizes"] = "|".join(details.get("sizes") or [])
+        except Exception as e:
+            logger.warning(f"일괄 조회 실패 ('{keyword}'): {e}", exc_info=True)
+            row["error"] = str(e)
+        return row
@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from src.core import network_capture
 from src.core.browser import BrowserManager
+from src.core.cancellation import CancellationToken, TaskCancelled
+from src.core.detail_cache import (
+    PRICE_FIELDS,
+    STATIC_FIELDS,
+    DetailCache,
+    create_detail_cache,
+)
+from src.core.logger_setup import setup_logger
 from src.core.plugin_base import PluginBase
+from src.core.product_catalog import get_catalog
+from src.core.resource_blocking import record_page_load
+from src.core.selenium_helpers import extract_fields
 
 if TYPE_CHECKING:
     from configparser import ConfigParser
@@ -20,6 +33,43 @@ if TYPE_CHECKING:
     from src.core.plugin_manager import (
         PluginManager as CorePluginManager,
     )
+    from src.core.task_runner import TaskRunner
+
+# 전역 로거 설정
+logger = setup_logger(__name__)
+
+# 상세 페이지 필드 → CSS 선택자 (extract_fields 명세)
+DETAIL_PAGE_FIELDS: Dict[str, Any] = {
+    "recent_price": ["div.detail-price div.amount span.price-info"],
+    "fluctuation": ["div.detail-price div.fluctuation"],
+    "fluctuation_class": {
+        "selectors": ["div.detail-price div.fluctuation"],
+        "attr": "class",
+    },
+    "detail_boxes": {
+        "selectors": ["div.detail-box"],
+        "all": True,
+        "fields": {"title": ["div.product_title"], "info": ["div.product_info"]},
+    },
+}
+
+# 판매 레이어의 사이즈 필드
+SIZE_LAYER_FIELDS: Dict[str, Any] = {
+    "sizes": {"selectors": ["div.select_item p.text-lookup"], "all": True},
+    "current_size": ["div.detail-size span.text"],
+}
+
+# HTTP 응답만으로 상세 정보를 채우려면 있어야 하는 값
+# (등락이 없으면 "" 대신 상세 페이지의 값을 보여주고 캐시에도 그 값을 저장합니다)
+HTTP_REQUIRED_FIELDS = (
+    "recent_price",
+    "fluctuation",
+    "release_price",
+    "model_no",
+    "release_date",
+    "color",
+    "sizes",
+)
 
 
 class DetailPlugin(PluginBase, QObject):
@@ -34,6 +84,7 @@ class DetailPlugin(PluginBase, QObject):
         browser: BrowserManager,
         config: "ConfigParser",
         plugin_manager: Optional[CorePluginManager] = None,
+        cache: Optional[DetailCache] = None,
     ) -> None:
         """DetailPlugin을 초기화합니다.
 
@@ -42,6 +93,7 @@ class DetailPlugin(PluginBase, QObject):
             browser: BrowserManager 인스턴스입니다.
             config: 설정 파서 인스턴스입니다.
             plugin_manager: CorePluginManager 인스턴스입니다.
+            cache: 함께 쓸 상세 정보 캐시입니다. None이면 설정에 따라 새로 엽니다.
         """
         PluginBase.__init__(
             self,
@@ -51,6 +103,17 @@ class DetailPlugin(PluginBase, QObject):
             plugin_manager=plugin_manager,
         )
         QObject.__init__(self)
+        self.cache: Optional[DetailCache] = (
+            cache if cache is not None else create_detail_cache(config)
+        )
+        # 가격 갱신을 백그라운드로 실행할 작업 실행기 (MainController가 설정합니다).
+        # 없으면 오래된 가격 필드를 그 자리에서 다시 조회합니다.
+        self.tasks: Optional[TaskRunner] = None
+        # 마지막으로 요청받은 제품 ID (다른 제품의 가격 갱신을 중단하기 위함)
+        self._current_product_id: Optional[str] = None
+        self._fetch_lock = threading.Lock()
+        # 진행 중인 가격 갱신 (제품 ID, 취소 토큰)
+        self._refresh: Optional[Tuple[str, CancellationToken]] = None
 
     def get_days_difference(self: "DetailPlugin", release_date_str: str) -> str:
         """출시일로부터 경과일/남은일을 D-day 형식으로 계산합니다.
@@ -94,70 +157,233 @@ class DetailPlugin(PluginBase, QObject):
         except Exception:
             return ""
 
-    def get_details(self: "DetailPlugin", product_id: str) -> Dict[str, Any]:
+    def _get_details_via_http(
+        self: "DetailPlugin", product_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """HTTP 클라이언트로 상세 정보를 가져옵니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+
+        Returns:
+            get_details() 형식의 결과이거나, 필요한 값이 하나라도 없으면 None입니다.
+        """
+        detail = self.browser.http.product_detail(product_id)
+        if not all(detail.get(key) for key in HTTP_REQUIRED_FIELDS):
+            return None
+        logger.debug(f"HTTP로 제품 상세 정보 조회: {product_id}")
+        return {
+            "recent_price": detail["recent_price"],
+            "fluctuation": detail["fluctuation"],
+            "fluctuation_type": detail.get("fluctuation_type", ""),
+            "release_price": detail["release_price"],
+            "model_no": detail["model_no"],
+            "release_date": detail["release_date"],
+            "d_day": self.get_days_difference(detail["release_date"]),
+            "color": detail["color"],
+            "sizes": detail["sizes"],
+        }
+
+    def get_details(
+        self: "DetailPlugin", product_id: str, refresh_in_background: bool = True
+    ) -> Dict[str, Any]:
         """주어진 제품 ID에 대한 상세 정보와 사용 가능한 사이즈를 가져옵니다.
 
-        새 탭에서 제품 상세 페이지를 열고 정보를 파싱한 후, 결과를 시그널로 보내고 반환합니다.
+        상세 정보 캐시에 고정 필드(모델번호, 출시일, 색상, 발매가, 사이즈)가 유효하면
+        페이지를 열지 않고 바로 반환합니다. 가격 필드만 오래되었으면 저장된 값으로 먼저
+        응답하고, 작업 실행기(`tasks`)에서 낮은 우선순위로 다시 조회해 details_ready
+        시그널을 한 번 더 보냅니다. 다른 제품을 요청하면 진행 중인 가격 갱신은
+        중단되므로 새 조회가 그 뒤에서 기다리지 않습니다.
+        캐시가 없거나 고정 필드가 만료되었으면 새 탭에서 제품 상세 페이지를 열고 정보를
+        파싱합니다. 결과는 시그널로 보내고 반환하며, 로컬 제품 카탈로그에도 저장합니다.
 
         Args:
             product_id: 상세 정보를 가져올 제품의 ID입니다.
+            refresh_in_background: False이면(또는 `tasks`가 없으면) 가격 필드가
+                오래되었을 때 백그라운드로 미루지 않고 다시 조회한 결과를 반환합니다
+                (일괄 조회용).
 
         Returns:
             제품 상세 정보와 사이즈를 포함하는 딕셔너리입니다. 오류 발생 시 오류 메시지를 포함합니다.
         """
-        detail_url = f"https://kream.co.kr/products/{product_id}"
-        driver = self.browser.get_driver()
+        self._current_product_id = product_id
+        cached = self.cache.get(product_id) if self.cache else None
+        if cached is not None and not cached.stale.intersection(STATIC_FIELDS):
+            stale_prices = cached.stale.intersection(PRICE_FIELDS)
+            if not stale_prices or (refresh_in_background and self.tasks is not None):
+                result = self._from_cache(cached.values)
+                logger.debug(
+                    f"캐시된 상세 정보 사용: {product_id} "
+                    f"(다시 조회할 가격 필드: {sorted(stale_prices)})"
+                )
+                self._emit(result)
+                if stale_prices:
+                    self._refresh_prices(product_id)
+                return result
+
+        result = self._fetch_and_store(product_id)
+        self._emit(result)
+        return result
+
+    def _from_cache(self: "DetailPlugin", values: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시된 필드로 get_details() 형식의 결과를 만듭니다. D-day는 다시 계산합니다."""
+        result: Dict[str, Any] = {
+            field: "N/A" for field in STATIC_FIELDS + PRICE_FIELDS
+        }
+        result.update(fluctuation_type="", sizes=[])
+        result.update(values)
+        release_date = result["release_date"]
+        result["d_day"] = (
+            self.get_days_difference(release_date)
+            if release_date not in ("N/A", "-")
+            else ""
+        )
+        return result
+
+    def _emit(self: "DetailPlugin", result: Dict[str, Any]) -> None:
+        """결과를 sizes_ready/details_ready 시그널로 보냅니다."""
+        if "error" not in result:
+            self.sizes_ready.emit(result.get("sizes", []))
+        self.details_ready.emit(result)
+
+    def _fetch_and_store(
+        self: "DetailPlugin",
+        product_id: str,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """상세 정보를 조회해 상세 정보 캐시와 제품 카탈로그에 저장합니다.
+
+        Raises:
+            TaskCancelled: cancelled가 True를 반환해 조회를 중단한 경우.
+        """
+        # 전경 조회와 백그라운드 가격 갱신이 같은 드라이버를 동시에 쓰지 않도록 합니다.
+        # 다른 제품을 요청하면 가격 갱신이 곧 중단되므로 오래 기다리지 않습니다.
+        with self._fetch_lock:
+            result = self._fetch_details(product_id, cancelled)
+        if self.cache is not None:
+            self.cache.put(product_id, result)
+        catalog = get_catalog()
+        if catalog is not None:
+            catalog.add_detail(product_id, result)
+        return result
+
+    def _refresh_prices(self: "DetailPlugin", product_id: str) -> None:
+        """작업 실행기에서 상세 정보를 다시 조회해 가격 필드를 갱신합니다.
+
+        갱신은 낮은 우선순위의 "detail_refresh" 그룹에서 실행되며, 사용자가 다른
+        제품을 요청하면 시작 전이든 페이지 로드 중이든 중단합니다. 조회가 끝났을 때
+        사용자가 여전히 같은 제품을 보고 있으면 details_ready 시그널을 다시 보냅니다.
+        """
+        if self.tasks is None:
+            return
+        refresh = self._refresh
+        if refresh is not None and refresh[0] == product_id:
+            if not refresh[1].cancelled:
+                return
+
+        def run(token: CancellationToken) -> None:
+            def cancelled() -> bool:
+                return token.cancelled or self._current_product_id != product_id
+
+            try:
+                if cancelled():
+                    raise TaskCancelled()
+                result = self._fetch_and_store(product_id, cancelled)
+                if "error" in result:
+                    logger.warning(
+                        f"상세 정보 가격 갱신 실패 ({product_id}): {result['error']}"
+                    )
+                elif not cancelled():
+                    logger.debug(f"상세 정보 가격 갱신 완료: {product_id}")
+                    self.details_ready.emit(result)
+            finally:
+                if self._refresh is not None and self._refresh[1] is token:
+                    # 끝난 갱신은 같은 제품의 다음 갱신을 막지 않도록 취소로 표시합니다.
+                    token.cancel()
+
+        token = self.tasks.submit(
+            "detail_refresh", run, cancel_previous=True, priority=-1
+        )
+        self._refresh = (product_id, token)
 
-        main_handle = driver.current_window_handle
-        driver.execute_script("window.open(arguments[0], '_blank');", detail_url)
+    def _fetch_details(
+        self: "DetailPlugin",
+        product_id: str,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """상세 정보를 조회합니다. HTTP로 먼저 조회하고, 안 되면 상세 페이지를 엽니다.
+
+        Args:
+            product_id: 제품 ID입니다.
+            cancelled: 지정하면 페이지를 열기 전과 페이지 로드 중에 확인하고,
+                True를 반환하면 조회를 중단합니다.
+
+        Raises:
+            TaskCancelled: 조회를 중단한 경우.
+        """
+        fast_result = self._get_details_via_http(product_id)
+        if fast_result is not None:
+            return fast_result
+        if cancelled is not None and cancelled():
+            raise TaskCancelled()
 
-        new_handle = driver.window_handles[-1]
-        driver.switch_to.window(new_handle)
+        detail_url = f"https://kream.co.kr/products/{product_id}"
+        # 상세 조회는 풀 드라이버를 대여해 검색 결과 탭이나 매크로 탭을 건드리지 않습니다.
+        try:
+            driver = self.browser.lease_driver(self.name)
+        except TimeoutException as e:
+            return {"error": str(e)}
+
+        # 이 상세 페이지가 요청한 API 응답만 수집하도록 이전 로그를 비웁니다.
+        network_capture.clear(driver)
+        tabs = self.browser.tabs(driver)
 
         try:
-            WebDriverWait(driver, 10).until(
+            # 상세 전용 탭을 재사용해 같은 탭에서 다음 제품으로 이동합니다.
+            tabs.open(
+                "detail",
+                detail_url,
                 EC.presence_of_element_located(
                     (By.CSS_SELECTOR, "dl.detail-product-container")
-                )
+                ),
+                timeout=10,
+                cancelled=cancelled,
             )
+            record_page_load(driver, "detail")
 
-            # Get recent price and fluctuation
-            try:
-                recent_price = driver.find_element(
-                    By.CSS_SELECTOR, "div.detail-price div.amount span.price-info"
-                ).text
-                fluctuation = driver.find_element(
-                    By.CSS_SELECTOR, "div.detail-price div.fluctuation"
-                ).text
-                fluctuation_class = driver.find_element(
-                    By.CSS_SELECTOR, "div.detail-price div.fluctuation"
-                ).get_attribute("class")
+            # 상세 API 응답에서 찾은 값이 있으면 DOM 조회보다 우선합니다.
+            api_detail = network_capture.parse_product_detail(
+                network_capture.collect_json_responses(driver), product_id
+            )
+
+            # 가격/등락/상세 항목을 한 번의 execute_script로 읽습니다.
+            fields = extract_fields(driver, DETAIL_PAGE_FIELDS)
+            recent_price = api_detail.get("recent_price") or fields.get("recent_price")
+            if api_detail.get("fluctuation"):
+                fluctuation = api_detail["fluctuation"]
+                fluctuation_type = api_detail.get("fluctuation_type", "")
+            else:
+                fluctuation = fields.get("fluctuation")
+                fluctuation_class = fields.get("fluctuation_class")
                 fluctuation_type = (
                     fluctuation_class.split()[-1] if fluctuation_class else ""
                 )
-            except NoSuchElementException:
+            if recent_price is None or fluctuation is None:
                 recent_price = "N/A"
                 fluctuation = "N/A"
                 fluctuation_type = ""
 
             # Get product details
-            details = driver.find_elements(By.CSS_SELECTOR, "div.detail-box")
-            detail_info: Dict[str, str] = {}
-
-            for detail in details:
-                try:
-                    title = detail.find_element(
-                        By.CSS_SELECTOR, "div.product_title"
-                    ).text.strip()
-                    info = detail.find_element(
-                        By.CSS_SELECTOR, "div.product_info"
-                    ).text.strip()
-                    detail_info[title] = info
-                except Exception:
-                    continue
+            detail_info: Dict[str, str] = {
+                box["title"]: box["info"]
+                for box in fields.get("detail_boxes", [])
+                if box.get("title") is not None and box.get("info") is not None
+            }
 
             # 출시일 정보 추출 및 D-day 계산
-            release_date_str_val = detail_info.get("출시일", "N/A")
+            release_date_str_val = api_detail.get("release_date") or detail_info.get(
+                "출시일", "N/A"
+            )
             d_day_text = ""
             if release_date_str_val != "N/A" and release_date_str_val != "-":
                 d_day_text = self.get_days_difference(release_date_str_val)
@@ -166,13 +392,20 @@ class DetailPlugin(PluginBase, QObject):
                 "recent_price": recent_price,
                 "fluctuation": fluctuation,
                 "fluctuation_type": fluctuation_type,
-                "release_price": detail_info.get("발매가", "N/A"),
-                "model_no": detail_info.get("모델번호", "N/A"),
+                "release_price": api_detail.get("release_price")
+                or detail_info.get("발매가", "N/A"),
+                "model_no": api_detail.get("model_no")
+                or detail_info.get("모델번호", "N/A"),
                 "release_date": release_date_str_val,
                 "d_day": d_day_text,  # D-day 정보 추가
-                "color": detail_info.get("대표 색상", "N/A"),
+                "color": api_detail.get("color") or detail_info.get("대표 색상", "N/A"),
             }
 
+            # 사이즈 목록이 API 응답에 있으면 판매 레이어를 열지 않습니다.
+            if api_detail.get("sizes"):
+                result["sizes"] = api_detail["sizes"]
+                return result
+
             # Get available sizes
             try:
                 # Click the sell button to open the layer container
@@ -187,32 +420,16 @@ class DetailPlugin(PluginBase, QObject):
                     )
                 )
 
-                # Get all size options from the layer container
-                size_elements = driver.find_elements(By.CSS_SELECTOR, "div.select_item")
-                sizes: List[str] = []
-
-                for element in size_elements:
-                    try:
-                        # Get the size text from the text-lookup element
-                        size_text = element.find_element(
-                            By.CSS_SELECTOR, "p.text-lookup"
-                        ).text.strip()
-                        if size_text:
-                            sizes.append(size_text)
-                    except Exception:
-                        continue
+                # 레이어의 사이즈 옵션과 현재 선택 사이즈를 한 번에 읽습니다.
+                size_fields = extract_fields(driver, SIZE_LAYER_FIELDS)
+                sizes: List[str] = [
+                    size for size in size_fields.get("sizes", []) if size
+                ]
 
                 # If no sizes found in dropdown, check if it's ONE SIZE
-                if not sizes:
-                    try:
-                        # Check the current selected size text
-                        current_size = driver.find_element(
-                            By.CSS_SELECTOR, "div.detail-size span.text"
-                        ).text.strip()
-                        if current_size and current_size.upper() == "ONE SIZE":
-                            sizes = ["ONE SIZE"]
-                    except Exception:
-                        pass
+                current_size = size_fields.get("current_size") or ""
+                if not sizes and current_size.upper() == "ONE SIZE":
+                    sizes = ["ONE SIZE"]
 
                 # Close the layer container
                 try:
@@ -231,19 +448,20 @@ class DetailPlugin(PluginBase, QObject):
                     sizes.sort(key=lambda x: float(x.split("(")[0].strip()))
 
                 result["sizes"] = sizes
-                self.sizes_ready.emit(sizes)
-            except Exception:
-                result["sizes"] = []
-                self.sizes_ready.emit([])
+            except Exception as e:
+                # 읽지 못한 사이즈는 빈 목록(사이즈 없음)과 구분해 캐시에 저장하지
+                # 않습니다. 결과를 받는 쪽은 sizes가 없으면 빈 목록으로 다룹니다.
+                logger.debug(f"사이즈 목록을 읽지 못했습니다 ({product_id}): {e}")
 
-            self.details_ready.emit(result)
             return result
 
+        except TaskCancelled:
+            raise
         except Exception as e_main:
-            result = {"error": str(e_main)}
-            self.details_ready.emit(result)
-            return result
+            return {"error": str(e_main)}
 
         finally:
-            driver.close()
-            driver.switch_to.window(main_handle)
+            if driver is self.browser.driver:
+                # 기본 드라이버를 공유한 경우에만 원래 탭으로 돌려놓습니다.
+                tabs.home()
+            self.browser.release_driver(self.name)
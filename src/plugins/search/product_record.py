@@ -0,0 +1,91 @@
+"""검색 결과 제품 한 건을 나타내는 불변 레코드입니다."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Mapping, Optional
+
+
+def product_id_from_url(url: Optional[str]) -> Optional[str]:
+    """제품 URL("/products/12345?...")에서 제품 ID를 추출합니다."""
+    if not url or "/products/" not in url:
+        return None
+    return url.split("/products/")[1].split("/")[0].split("?")[0] or None
+
+
+def _strip_label(value: Optional[str], label: str) -> str:
+    """라벨이 붙은 값("관심 1,087", "리뷰 76")에서 숫자 부분만 남깁니다."""
+    value = value or ""
+    if label in value:
+        value = value.split(label)[-1].strip()
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ProductRecord:
+    """검색 결과 카드에서 추출한 제품 정보입니다.
+
+    검색 결과가 로드될 때 모든 카드를 한 번에 읽어 만들며, 이후 결과 이동은
+    브라우저를 거치지 않고 레코드만 사용합니다.
+    """
+
+    id: str
+    name: str = "이름 없음"
+    translated_name: str = ""
+    brand: str = "브랜드 없음"
+    price: str = "가격 없음"
+    image_url: Optional[str] = None
+    wish_figure: str = ""
+    review_figure: str = ""
+    is_brand_official: bool = False
+    product_url: Optional[str] = None
+
+    @classmethod
+    def from_card(
+        cls: type["ProductRecord"],
+        fields: Mapping[str, Any],
+        index: int,
+        api_info: Optional[Mapping[str, Any]] = None,
+    ) -> "ProductRecord":
+        """extract_fields로 읽은 카드 필드와 검색 API 정보로 레코드를 만듭니다.
+
+        Args:
+            fields: PRODUCT_CARD_FIELDS 명세로 읽은 카드 한 장의 값입니다.
+            index: 검색 결과 인덱스입니다. 제품 ID를 찾지 못하면 임시 ID에 사용합니다.
+            api_info: 같은 제품 ID의 검색 API 정보입니다. 있으면 DOM 값보다 우선합니다.
+
+        Returns:
+            ProductRecord 인스턴스입니다.
+        """
+        product_url = fields.get("product_url")
+        values: Dict[str, Any] = {
+            "id": product_id_from_url(product_url) or f"temp_{index}",
+            "name": fields.get("name") or "이름 없음",
+            "translated_name": fields.get("translated_name") or "",
+            "brand": fields.get("brand") or "브랜드 없음",
+            "price": fields.get("price") or "가격 없음",
+            "image_url": fields.get("image_url"),
+            "wish_figure": _strip_label(fields.get("wish_figure"), "관심"),
+            "review_figure": _strip_label(fields.get("review_figure"), "리뷰"),
+            "is_brand_official": bool(fields.get("is_brand_official")),
+            "product_url": product_url,
+        }
+        if api_info:
+            values.update(
+                {
+                    k: v
+                    for k, v in api_info.items()
+                    if k in values and v not in (None, "")
+                }
+            )
+        return cls(**values)
+
+    def to_dict(self: "ProductRecord") -> Dict[str, Any]:
+        """search_result 시그널로 보낼 딕셔너리를 반환합니다."""
+        info = asdict(self)
+        info.pop("product_url")
+        return info
+
+
+# ProductRecord의 필드 이름 (카탈로그/캐시 행에서 레코드를 만들 때 사용)
+RECORD_FIELDS = frozenset(ProductRecord.__dataclass_fields__)
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import logging  # noqa: F401 # 로깅 모듈 임포트
+import threading
 import time
 import urllib.parse
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from selenium.common.exceptions import (
-    NoSuchElementException,
-    StaleElementReferenceException,
     TimeoutException,
     WebDriverException,
 )
@@ -19,25 +19,126 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from src.core import network_capture, read_cache
 from src.core.browser import BrowserManager
+from src.core.cancellation import CancellationToken, TaskCancelled
 
 # logger_setup 임포트
 from src.core.logger_setup import setup_logger
 from src.core.plugin_base import PluginBase
+from src.core.product_catalog import get_catalog
+from src.core.resource_blocking import record_page_load
+from src.core.search_cache import SearchCache, create_search_cache
+from src.core.selector_registry import get_registry
+from src.core.selenium_helpers import extract_fields, navigate, stop_loading
+from src.plugins.search.product_record import (
+    RECORD_FIELDS,
+    ProductRecord,
+    product_id_from_url,
+)
 
 if TYPE_CHECKING:
     from configparser import ConfigParser
 
     from src.core.plugin_manager import PluginManager as CorePluginManager
+    from src.core.task_runner import TaskRunner
 
 # 전역 로거 설정
 logger = setup_logger(__name__)
 
+# 가능한 여러 선택자를 시도하여 검색 결과나 결과 없음 메시지 확인
+SEARCH_RESULT_SELECTORS = [
+    "div.search_result_item.product",
+    ".search_result_item",
+    ".product_card",
+    "div.product_card",
+    ".product_item",
+    "div.product_item",
+]
+
+# 결과가 없을 때 나타나는 메시지 선택자
+NO_RESULT_SELECTORS = [
+    "div.search_content p.nodata_main",
+    ".nodata_main",
+    ".search_no_result",
+    ".no_result",
+]
+
+# 페이지 끝으로 스크롤해 다음 결과 로드를 유도하고, 그 시점의 카드 수를 반환합니다.
+_SCROLL_SCRIPT = """
+window.scrollTo(0, document.documentElement.scrollHeight);
+return document.querySelectorAll(arguments[0]).length;
+"""
+_COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+# 검색 결과 카드 필드 → 시도할 CSS 선택자 목록 (extract_fields 명세)
+PRODUCT_CARD_FIELDS: Dict[str, Any] = {
+    "name": [
+        "p.item_title",
+        ".item_title",
+        ".product_title",
+        ".name",
+        "h3",
+        ".product_name",
+        "div.product_info_product_name p.name",
+    ],
+    "translated_name": [
+        ".translated_name",
+        "div.product_info_product_name p.translated_name",
+        "p.translated_name",
+    ],
+    "brand": [
+        "p.item_brand",
+        ".item_brand",
+        ".product_brand",
+        ".brand",
+        ".brand_name",
+        "span.brand-name",
+        "p.product_info_brand span.brand-name",
+    ],
+    # 브랜드 공식 배송 아이콘
+    "is_brand_official": {
+        "selectors": [
+            ".ico-brand-official",
+            "svg.ico-brand-official",
+            ".product_info_brand svg",
+        ],
+        "exists": True,
+    },
+    "price": [
+        "div.price_area .amount",
+        ".amount",
+        ".price",
+        ".product_price",
+        ".product_amount",
+    ],
+    "image_url": {
+        "selectors": [
+            "img.product_img",
+            "img",
+            ".product_img",
+            ".thumbnail img",
+            ".product_image img",
+        ],
+        "attr": "src",
+    },
+    # 관심수 및 리뷰수
+    "wish_figure": [".wish_figure", "span.wish_figure", "span.wish_figure span"],
+    "review_figure": [
+        ".review_figure",
+        "span.review_figure span:last-child",
+        "span.review_figure span",
+    ],
+    "product_url": {"selectors": ["a"], "attr": "href"},
+}
+
 
 class SearchPlugin(PluginBase, QObject):
     """제품 검색 및 결과 표시를 처리하는 플러그인입니다."""
 
     search_result = pyqtSignal(dict)
+    # (지금까지 로드된 결과 수, 로드 완료 여부)
+    search_progress = pyqtSignal(int, bool)
 
     def __init__(
         self: "SearchPlugin",
@@ -45,6 +146,7 @@ class SearchPlugin(PluginBase, QObject):
         browser: BrowserManager,
         config: "ConfigParser",
         plugin_manager: Optional[CorePluginManager] = None,
+        cache: Optional[SearchCache] = None,
     ) -> None:
         """SearchPlugin을 초기화합니다.
 
@@ -53,6 +155,7 @@ class SearchPlugin(PluginBase, QObject):
             browser: 브라우저 관리자 인스턴스입니다.
             config: 설정 파서 인스턴스입니다.
             plugin_manager: 플러그인 관리자 인스턴스입니다.
+            cache: 함께 쓸 검색 캐시입니다. None이면 설정에 따라 새로 엽니다.
         """
         PluginBase.__init__(
             self,
@@ -62,12 +165,44 @@ class SearchPlugin(PluginBase, QObject):
             plugin_manager=plugin_manager,
         )
         QObject.__init__(self)
-        self.products: List[WebElement] = []
+        self.products: List[ProductRecord] = []
+        # 검색 API 응답에서 파싱한 제품 정보 (카드 링크의 제품 ID로 대응)
+        self.api_products: List[Dict[str, Any]] = []
+        self._no_result_text: str = ""
+        # show_offline()로 카탈로그 결과를 표시한 검색어
+        self._offline_keyword: str = ""
+        self.cache: Optional[SearchCache] = (
+            cache if cache is not None else create_search_cache(config)
+        )
+        # 검색 드라이버 사용(전경 검색/백그라운드 갱신)과 결과 목록 교체를 보호합니다.
+        self._fetch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        # 오래된 캐시 결과를 다시 검색할 작업 실행기 (MainController가 설정합니다).
+        # 없으면 오래된 결과를 그대로 사용합니다.
+        self.tasks: Optional[TaskRunner] = None
+        # 새 검색마다 증가하며, 이전 검색의 스트리밍/갱신은 이 값이 바뀌면 멈춥니다.
+        self._generation = 0
+        self.stream_results = config.getboolean(
+            "Search", "stream_results", fallback=True
+        )
+        self.max_results = max(1, config.getint("Search", "max_results", fallback=200))
+        self.stream_timeout = config.getfloat("Search", "stream_timeout", fallback=30)
+        self.scroll_wait = config.getfloat("Search", "scroll_wait", fallback=3)
         self.current_index: int = 0
         self.max_retries: int = 3
         self.timeout: int = 15
         self.last_keyword: str = ""
         self.driver: Optional[WebDriver] = None
+        if isinstance(self.browser, BrowserManager):
+            self.browser.add_recovery_listener(self._on_driver_recovered)
+
+    def _on_driver_recovered(
+        self: "SearchPlugin", dead: WebDriver, new: WebDriver
+    ) -> None:
+        """감시 스레드가 드라이버를 재생성하면 참조를 새 드라이버로 바꿉니다."""
+        if self.driver is dead:
+            logger.info("검색 드라이버가 재생성되어 새 드라이버를 사용합니다.")
+            self.driver = new
 
     def _get_driver(self: "SearchPlugin") -> WebDriver:
         """Webdriver 인스턴스를 가져오거나, 없으면 초기화합니다.
@@ -76,23 +211,37 @@ class SearchPlugin(PluginBase, QObject):
             Webdriver 인스턴스입니다.
         """
         if self.driver is not None:
+            if (
+                isinstance(self.browser, BrowserManager)
+                and self.browser.watchdog_active
+                and not self.browser.is_leased(self.driver)
+            ):
+                # 감시 스레드가 상태를 확인하고 교체해 주므로 매번 확인하지 않습니다.
+                # 대여한 드라이버는 계속 들고 있으므로 사용 전에 직접 확인합니다.
+                return self.driver
             try:
-                _ = self.driver.current_url  # Check if driver is still responsive
+                # Check if driver is still responsive (기억한 URL이 아닌 실제 응답으로)
+                with read_cache.uncached():
+                    _ = self.driver.current_url
                 return self.driver
             except WebDriverException:
                 logger.warning("기존 WebDriver 세션이 유효하지 않아 새로 초기화합니다.")
+                if isinstance(self.browser, BrowserManager):
+                    self.browser.discard_driver(self.driver)
                 self.driver = None
 
         if isinstance(self.browser, BrowserManager):
             try:
-                active_driver = self.browser.get_driver()
+                # 검색은 전용 풀 드라이버를 사용해 매크로/상세 조회와 탭을 다투지 않습니다.
+                active_driver = self.browser.lease_driver(self.name)
                 if active_driver:
                     self.driver = active_driver
                     return self.driver
-                logger.error("BrowserManager.get_driver()가 None을 반환했습니다.")
+                logger.error("BrowserManager.lease_driver()가 None을 반환했습니다.")
             except Exception as e:
                 logger.error(
-                    f"BrowserManager.get_driver() 호출 중 오류 발생: {e}", exc_info=True
+                    f"BrowserManager.lease_driver() 호출 중 오류 발생: {e}",
+                    exc_info=True,
                 )
 
         if (
@@ -105,16 +254,16 @@ class SearchPlugin(PluginBase, QObject):
             if isinstance(self.plugin_manager.browser, BrowserManager):
                 self.browser = self.plugin_manager.browser  # self.browser 업데이트
                 try:
-                    active_driver = self.browser.get_driver()
+                    active_driver = self.browser.lease_driver(self.name)
                     if active_driver:
                         self.driver = active_driver
                         return self.driver
                     logger.error(
-                        "플러그인 매니저 통해 BrowserManager.get_driver() 호출 시 None 반환"
+                        "플러그인 매니저 통해 BrowserManager.lease_driver() 호출 시 None 반환"
                     )
                 except Exception as e:
                     logger.error(
-                        f"플러그인 매니저 통해 BrowserManager.get_driver() 호출 중 오류: {e}",
+                        f"플러그인 매니저 통해 BrowserManager.lease_driver() 호출 중 오류: {e}",
                         exc_info=True,
                     )
             else:
@@ -166,15 +315,364 @@ class SearchPlugin(PluginBase, QObject):
             EC.presence_of_all_elements_located((by, selector))
         )
 
-    def search(self: "SearchPlugin", keyword: str) -> None:
-        """주어진 키워드로 제품을 검색하고 첫 번째 결과를 반환합니다."""
+    def search(
+        self: "SearchPlugin",
+        keyword: str,
+        token: Optional[CancellationToken] = None,
+    ) -> None:
+        """주어진 키워드로 제품을 검색하고 첫 번째 결과를 반환합니다.
+
+        캐시된 결과가 있으면 브라우저 없이 바로 표시하고, 저장한 지 오래된 결과이면
+        백그라운드에서 다시 검색해 캐시와 화면을 갱신합니다. 캐시에 없으면 결과를
+        모두 불러올 때까지 반환하지 않으므로 GUI 스레드가 아닌 작업 스레드
+        (MainController의 TaskRunner)에서 호출합니다. 첫 결과는 나오는 즉시
+        search_result 시그널로 표시됩니다.
+
+        Args:
+            keyword: 검색어입니다.
+            token: 취소 토큰입니다. 취소되면 검색/스트리밍을 멈추고 결과를 버립니다.
+        """
         if not keyword.strip():
             self.search_result.emit({"error": "검색어를 입력해주세요."})
             return
 
         logger.debug(f"검색 시작: 키워드 '{keyword}'")
-        self.last_keyword = keyword.strip()
-        encoded_keyword = urllib.parse.quote(self.last_keyword)
+        with self._state_lock:
+            self.last_keyword = keyword.strip()
+            # 카탈로그 결과를 표시 중이면 첫 결과로 목록을 바꾸되 보던 위치를 유지합니다.
+            offline = self._offline_keyword == self.last_keyword
+            self._offline_keyword = ""
+            # 이전 검색의 스트리밍/백그라운드 갱신을 중단시킵니다.
+            self._generation += 1
+            generation = self._generation
+        show = self._replace if offline else self._show
+
+        products, stale = self._load_cached(self.last_keyword)
+        if products:
+            show(products)
+            if stale:
+                self._revalidate(self.last_keyword)
+            return
+
+        keyword = self.last_keyword
+
+        def cancelled() -> bool:
+            # 새 검색이 시작되었거나 작업이 취소되었습니다.
+            return generation != self._generation or bool(token and token.cancelled)
+
+        def on_batch(batch: List[ProductRecord], first: bool) -> None:
+            if cancelled():
+                return
+            if first:
+                logger.debug(f"검색 결과 찾음: {len(batch)}개 제품")
+                show(batch)
+            else:
+                self._append(batch)
+
+        try:
+            products, error = self._fetch(keyword, on_batch, cancelled)
+            if cancelled():
+                logger.debug(f"검색이 취소되었습니다: '{keyword}'")
+                return
+            if products:
+                self.search_progress.emit(len(products), True)
+            elif offline:
+                # 실시간 검색에 실패해도 카탈로그 결과는 그대로 둡니다.
+                logger.warning(f"실시간 검색 실패, 카탈로그 결과 유지: {error}")
+            else:
+                self.search_result.emit({"error": error})
+        except Exception as e:
+            logger.error(f"검색 중 오류: {str(e)}", exc_info=True)
+            self.search_result.emit(
+                {"error": f"검색 중 예상치 못한 오류가 발생했습니다: {str(e)}"}
+            )
+
+    def show_offline(self: "SearchPlugin", keyword: str) -> bool:
+        """로컬 제품 카탈로그에서 검색어를 찾아 브라우저 없이 바로 표시합니다.
+
+        GUI 스레드에서 search()를 제출하기 전에 호출하며, 이어지는 search()가
+        실시간 결과로 이 목록을 갱신/확장합니다.
+
+        Args:
+            keyword: 검색어 또는 모델번호입니다.
+
+        Returns:
+            카탈로그에서 찾은 제품을 표시했으면 True입니다.
+        """
+        catalog = get_catalog()
+        keyword = keyword.strip()
+        if catalog is None or not keyword:
+            return False
+        products = [
+            ProductRecord(**{k: v for k, v in item.items() if k in RECORD_FIELDS})
+            for item in catalog.search(keyword)
+        ]
+        if not products:
+            return False
+        logger.debug(f"카탈로그 검색 결과 표시: '{keyword}' {len(products)}개 제품")
+        with self._state_lock:
+            # 이전 검색의 스트리밍/백그라운드 갱신이 이 목록을 덮어쓰지 않도록 합니다.
+            self._generation += 1
+            self._offline_keyword = keyword
+        self._show(products)
+        return True
+
+    def lookup(
+        self: "SearchPlugin",
+        keyword: str,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[List[ProductRecord], Optional[str]]:
+        """화면에 표시하지 않고 검색 결과만 가져옵니다 (일괄 조회용).
+
+        캐시된 결과가 있으면 오래된 결과라도 그대로 사용합니다.
+
+        Args:
+            keyword: 검색어입니다.
+            cancelled: 검색이 취소되었는지 확인하는 함수입니다.
+
+        Returns:
+            (제품 레코드 목록, 오류 메시지) 튜플입니다.
+        """
+        products, _stale = self._load_cached(keyword.strip())
+        if products:
+            return products, None
+        return self._fetch(keyword.strip(), cancelled=cancelled)
+
+    def _load_cached(
+        self: "SearchPlugin", keyword: str
+    ) -> Tuple[List[ProductRecord], bool]:
+        """캐시에서 검색어의 결과를 읽습니다.
+
+        Returns:
+            (제품 레코드 목록, 갱신 필요 여부) 튜플입니다. 캐시에 없으면 빈 목록입니다.
+        """
+        cached = self.cache.get(keyword) if self.cache else None
+        if cached is None:
+            return [], False
+        try:
+            products = [ProductRecord(**item) for item in cached.payload]
+        except TypeError as e:
+            # 레코드 형식이 바뀐 이전 버전의 캐시는 버리고 다시 검색합니다.
+            logger.warning(f"검색 캐시 항목 형식 오류, 다시 검색합니다: {e}")
+            return [], False
+        logger.debug(
+            f"캐시된 검색 결과 사용: {len(products)}개 제품 "
+            f"({cached.age:.0f}초 전, 갱신 필요: {cached.stale})"
+        )
+        return products, cached.stale
+
+    def _show(self: "SearchPlugin", products: List[ProductRecord]) -> None:
+        """결과 목록을 바꾸고 첫 번째 제품을 표시합니다."""
+        with self._state_lock:
+            self.products = products
+            self.current_index = 0
+        self._emit_current_product()
+
+    def _replace(
+        self: "SearchPlugin",
+        products: List[ProductRecord],
+        generation: Optional[int] = None,
+    ) -> bool:
+        """보고 있던 제품의 위치를 유지하며 결과 목록을 바꿉니다.
+
+        보고 있던 제품이나 결과 수가 바뀌었으면 현재 제품을 다시 표시합니다.
+
+        Args:
+            products: 새 결과 목록입니다 (비어 있지 않아야 합니다).
+            generation: 지정하면 그 사이 새 검색이 시작된 경우 바꾸지 않습니다.
+
+        Returns:
+            목록을 바꿨으면 True입니다.
+        """
+        with self._state_lock:
+            if generation is not None and generation != self._generation:
+                return False
+            current = (
+                self.products[self.current_index]
+                if 0 <= self.current_index < len(self.products)
+                else None
+            )
+            index = next(
+                (
+                    i
+                    for i, record in enumerate(products)
+                    if current is not None and record.id == current.id
+                ),
+                min(self.current_index, len(products) - 1),
+            )
+            changed = current != products[index] or len(products) != len(self.products)
+            self.products = products
+            self.current_index = index
+        if changed:
+            self._emit_current_product()
+        return True
+
+    def _append(self: "SearchPlugin", batch: List[ProductRecord]) -> None:
+        """스트리밍으로 도착한 결과를 목록 끝에 붙입니다."""
+        with self._state_lock:
+            was_last = self.current_index >= len(self.products) - 1
+            self.products = self.products + batch
+            total = len(self.products)
+        logger.debug(f"검색 결과 {len(batch)}개 추가 (총 {total}개)")
+        self.search_progress.emit(total, False)
+        if was_last:
+            # 마지막 제품을 보고 있었다면 '다음' 버튼 상태를 갱신합니다.
+            self._emit_current_product()
+
+    def _revalidate(self: "SearchPlugin", keyword: str) -> None:
+        """작업 실행기에서 다시 검색해 캐시를 갱신하고, 보고 있는 결과이면 화면도 갱신합니다.
+
+        갱신은 "search" 그룹에 낮은 우선순위로 제출되므로 검색 드라이버를 쓰는 다른
+        검색과 겹치지 않고, 새 검색이 시작되거나(cancel_previous) 앱이 종료되면
+        (TaskRunner.shutdown) 취소됩니다.
+
+        Args:
+            keyword: 다시 검색할 검색어입니다.
+        """
+        if self.tasks is None:
+            return
+        with self._state_lock:
+            generation = self._generation
+
+        def run(token: CancellationToken) -> None:
+            def cancelled() -> bool:
+                return token.cancelled or generation != self._generation
+
+            try:
+                products, _error = self._fetch(keyword, cancelled=cancelled)
+                if not products:
+                    return
+                if not self._replace(products, generation):
+                    return
+                logger.debug(f"검색 결과 백그라운드 갱신 완료: '{keyword}'")
+            except TaskCancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"검색 결과 백그라운드 갱신 실패 ('{keyword}'): {e}")
+
+        self.tasks.submit("search", run, priority=-1)
+
+    def _fetch(
+        self: "SearchPlugin",
+        keyword: str,
+        on_batch: Optional[Callable[[List[ProductRecord], bool], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[List[ProductRecord], Optional[str]]:
+        """브라우저로 검색 결과를 추출하고 캐시에 저장합니다.
+
+        첫 화면의 결과를 읽은 뒤 스트리밍이 켜져 있으면 스크롤하며 다음 결과를
+        `[Search] max_results`개 또는 `stream_timeout`초까지 이어서 읽습니다.
+        검색 드라이버를 쓰는 동안 잠금을 잡으므로 백그라운드 갱신과 겹치지 않습니다.
+
+        Args:
+            keyword: 검색어입니다.
+            on_batch: 결과 묶음이 도착할 때마다 (묶음, 첫 묶음 여부)로 호출됩니다.
+            cancelled: 검색이 취소되었는지 확인하는 함수입니다. True를 반환하면
+                재시도/스트리밍을 멈추고 부분 결과는 캐시와 카탈로그에 저장하지 않습니다.
+
+        Returns:
+            (제품 레코드 목록, 오류 메시지) 튜플입니다. 결과가 있으면 오류 메시지는
+            None이고, 없으면 빈 목록과 사용자에게 보여줄 메시지입니다.
+        """
+        is_cancelled: Callable[[], bool] = cancelled or (lambda: False)
+        with self._fetch_lock:
+            if is_cancelled():
+                return [], "검색이 취소되었습니다."
+            products, error = self._fetch_locked(keyword, is_cancelled)
+            products = products[: self.max_results]
+            if products and on_batch is not None:
+                on_batch(products, True)
+            if products and self.stream_results:
+                deadline = time.monotonic() + self.stream_timeout
+                try:
+                    for batch in self._stream_more(products, deadline, is_cancelled):
+                        products = products + batch
+                        if on_batch is not None:
+                            on_batch(batch, False)
+                except WebDriverException as e:
+                    # 이미 읽은 결과는 그대로 사용합니다.
+                    logger.warning(f"검색 결과 추가 로드 중 브라우저 오류: {e}")
+        # 취소로 중간에 멈춘 결과는 캐시와 카탈로그 모두에 저장하지 않습니다.
+        if products and not is_cancelled():
+            if self.cache:
+                self.cache.put(keyword, [asdict(record) for record in products])
+            catalog = get_catalog()
+            if catalog is not None:
+                catalog.add_products(record.to_dict() for record in products)
+        return products, error
+
+    def _stream_more(
+        self: "SearchPlugin",
+        products: List[ProductRecord],
+        deadline: float,
+        cancelled: Callable[[], bool],
+    ) -> Iterator[List[ProductRecord]]:
+        """검색 결과 페이지를 스크롤하며 새로 로드된 제품 묶음을 차례로 반환합니다.
+
+        카드가 더 늘어나지 않거나, 총 개수/시간 한도에 닿거나, 새 검색이 시작되면
+        멈춥니다. 검색 드라이버 잠금을 잡은 상태에서 호출합니다.
+
+        Args:
+            products: 이미 읽은 제품 레코드입니다.
+            deadline: 스트리밍을 멈출 time.monotonic() 시각입니다.
+            cancelled: 검색이 취소되었는지 확인하는 함수입니다.
+
+        Yields:
+            새로 로드된 제품 레코드 목록입니다.
+        """
+        driver = self._get_driver()
+        card_selector = ", ".join(SEARCH_RESULT_SELECTORS)
+        seen = {record.id for record in products}
+        total = len(products)
+        # 페이지에서 이미 읽은 카드 수 (첫 화면은 카드마다 레코드 하나)
+        read = len(products)
+
+        while total < self.max_results and not cancelled():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.debug(f"검색 결과 스트리밍 시간 한도 도달 ({total}개)")
+                return
+            count = driver.execute_script(_SCROLL_SCRIPT, card_selector) or 0
+
+            def more_loaded(d: WebDriver, count: int = count) -> bool:
+                if cancelled():
+                    return True
+                return bool(d.execute_script(_COUNT_SCRIPT, card_selector) > count)
+
+            try:
+                WebDriverWait(
+                    driver, min(self.scroll_wait, remaining), poll_frequency=0.2
+                ).until(more_loaded)
+            except TimeoutException:
+                logger.debug(f"더 로드되는 검색 결과 없음 (총 {total}개)")
+                return
+            if cancelled():
+                # 진행 중인 다음 페이지 요청은 새 검색과 무관하므로 끊습니다.
+                stop_loading(driver)
+                return
+
+            self.api_products.extend(
+                network_capture.parse_search_products(
+                    network_capture.collect_json_responses(driver)
+                )
+            )
+            # 이미 읽은 카드는 브라우저 안에서 건너뛰고 새로 로드된 카드만 읽습니다.
+            records = self._extract_products(driver, skip=read)
+            read += len(records)
+            batch = [record for record in records if record.id not in seen][
+                : self.max_results - total
+            ]
+            if not batch:
+                continue
+            seen.update(record.id for record in batch)
+            total += len(batch)
+            yield batch
+
+    def _fetch_locked(
+        self: "SearchPlugin", keyword: str, cancelled: Callable[[], bool]
+    ) -> Tuple[List[ProductRecord], Optional[str]]:
+        """_fetch()의 본문입니다. 검색 드라이버 잠금을 잡은 상태에서 호출합니다."""
+        encoded_keyword = urllib.parse.quote(keyword)
         search_url = f"https://kream.co.kr/search?keyword={encoded_keyword}&tab=products&sort=popular_score"
         driver = self._get_driver()
 
@@ -182,89 +680,61 @@ class SearchPlugin(PluginBase, QObject):
         logger.debug(f"현재 URL: {driver.current_url}")
 
         for attempt in range(self.max_retries):
+            if cancelled():
+                return [], "검색이 취소되었습니다."
             try:
                 logger.debug(
                     f"검색 URL 접속 시도 ({attempt + 1} / {self.max_retries}): {search_url}"
                 )
-                driver.get(search_url)
-
-                # 페이지 로딩 확인
-                logger.debug(f"페이지 로딩 완료: {driver.current_url}")
-
-                # 가능한 여러 선택자를 시도하여 검색 결과나 결과 없음 메시지 확인
-                selectors_to_try = [
-                    "div.search_result_item.product",
-                    ".search_result_item",
-                    ".product_card",
-                    "div.product_card",
-                    ".product_item",
-                    "div.product_item",
-                ]
-
-                # 결과가 없을 때 나타나는 메시지 선택자
-                no_result_selectors = [
-                    "div.search_content p.nodata_main",
-                    ".nodata_main",
-                    ".search_no_result",
-                    ".no_result",
-                ]
 
                 # 페이지 로딩을 기다림 (제품 카드 또는 "결과 없음" 메시지 중 하나가 나타날 때까지)
                 logger.debug("검색 결과 또는 결과 없음 메시지 대기 중...")
 
+                # 모든 후보를 하나의 선택자로 묶어 폴링마다 왕복 1회로 확인합니다.
+                any_selector = ", ".join(SEARCH_RESULT_SELECTORS + NO_RESULT_SELECTORS)
+
+                # lambda를 명명된 함수로 변경하여 타입 추론 문제 해결
+                def check_elements_exist(driver: WebDriver) -> bool:
+                    return bool(driver.find_elements("css selector", any_selector))
+
+                # 이전 페이지의 네트워크 로그를 비워 이번 검색 응답만 수집합니다.
+                network_capture.clear(driver)
+                self.api_products = []
                 try:
-                    # lambda를 명명된 함수로 변경하여 타입 추론 문제 해결
-                    def check_elements_exist(driver: WebDriver) -> bool:
-                        for selector in selectors_to_try + no_result_selectors:
-                            logger.debug(f"요소 존재 확인: {selector}")
-                            elements = driver.find_elements("css selector", selector)
-                            if len(elements) > 0:
-                                return True
-                        return False
-
-                    WebDriverWait(driver, self.timeout).until(check_elements_exist)
+                    # load 이벤트가 아니라 결과 카드/결과 없음 메시지가 준비 조건입니다.
+                    navigate(
+                        driver,
+                        search_url,
+                        check_elements_exist,
+                        self.timeout,
+                        cancelled=cancelled,
+                    )
+                    record_page_load(driver, "search")
                 except TimeoutException:
                     logger.warning("요소 대기 시간 초과. 페이지 구조 확인 필요")
+                except TaskCancelled:
+                    logger.debug(f"새 검색으로 페이지 로드를 중단했습니다: '{keyword}'")
+                    return [], "검색이 취소되었습니다."
+
+                self.api_products = network_capture.parse_search_products(
+                    network_capture.collect_json_responses(driver)
+                )
+                logger.debug(f"검색 API 응답에서 {len(self.api_products)}개 제품 파싱")
+
+                # 페이지 로딩 확인
+                logger.debug(f"페이지 로딩 완료: {driver.current_url}")
 
                 # 웹페이지 HTML 구조 확인 (디버깅용)
                 logger.debug(f"HTML 제목: {driver.title}")
 
-                # 검색 결과 선택자를 순차적으로 시도
-                products = []
-                for selector in selectors_to_try:
-                    products = driver.find_elements("css selector", selector)
-                    if products:
-                        logger.debug(
-                            f"검색 결과 찾음: 선택자 '{selector}'로 {len(products)}개 제품"
-                        )
-                        break
-
+                # 모든 결과 카드와 결과 없음 메시지를 한 번의 execute_script로 읽습니다.
+                products = self._extract_products(driver)
                 if products:
-                    logger.debug(f"검색 결과 찾음: {len(products)}개 제품")
-                    self.products = products
-                    self.current_index = 0
-                    self._emit_current_product()
-                    return
-
-                # 결과 없음 메시지 선택자를 순차적으로 시도
-                no_data_elements = []
-                for selector in no_result_selectors:
-                    no_data_elements = driver.find_elements("css selector", selector)
-                    if no_data_elements:
-                        logger.debug(f"검색 결과 없음 메시지 발견: 선택자 '{selector}'")
-                        break
+                    return products, None
 
-                if no_data_elements and len(no_data_elements) > 0:
+                if self._no_result_text:
                     logger.debug("검색 결과 없음 메시지 발견")
-                    try:
-                        no_data_text = no_data_elements[0].text.strip()
-                        if not no_data_text:
-                            no_data_text = "검색 결과가 없습니다."
-                    except Exception:
-                        no_data_text = "검색 결과가 없습니다."
-
-                    self.search_result.emit({"error": no_data_text})
-                    return
+                    return [], self._no_result_text
 
                 # 페이지 소스 출력 (디버깅용)
                 logger.debug("검색 결과를 찾을 수 없음, 페이지 소스 일부:")
@@ -274,99 +744,56 @@ class SearchPlugin(PluginBase, QObject):
                 )
 
                 # 페이지가 로드되었지만 제품을 찾을 수 없는 경우
-                self.search_result.emit(
-                    {
-                        "error": "검색 결과를 찾을 수 없습니다. 웹사이트 구조가 변경되었을 수 있습니다."
-                    }
+                return (
+                    [],
+                    "검색 결과를 찾을 수 없습니다. 웹사이트 구조가 변경되었을 수 있습니다.",
                 )
-                return
             except TimeoutException:
                 logger.warning(f"검색 시간 초과 ({attempt + 1}/{self.max_retries})")
                 if attempt == self.max_retries - 1:
-                    self.search_result.emit(
-                        {"error": "검색 시간이 초과되었습니다. 다시 시도해주세요."}
-                    )
-                else:
-                    time.sleep(1)
+                    return [], "검색 시간이 초과되었습니다. 다시 시도해주세요."
+                time.sleep(1)
             except WebDriverException as e:
                 logger.warning(
                     f"브라우저 오류 ({attempt + 1}/{self.max_retries}): {str(e)}"
                 )
                 if attempt == self.max_retries - 1:
-                    self.search_result.emit(
-                        {"error": f"브라우저 오류로 검색에 실패했습니다: {str(e)}"}
-                    )
-                else:
-                    time.sleep(1)
+                    return [], f"브라우저 오류로 검색에 실패했습니다: {str(e)}"
+                time.sleep(1)
+                # 그 사이 드라이버가 재생성되었을 수 있으므로 다시 가져옵니다.
+                driver = self._get_driver()
             except Exception as e:
                 logger.error(f"예상치 못한 오류: {str(e)}", exc_info=True)
-                self.search_result.emit(
-                    {"error": f"검색 중 예상치 못한 오류가 발생했습니다: {str(e)}"}
-                )
-                return
+                return [], f"검색 중 예상치 못한 오류가 발생했습니다: {str(e)}"
+        return [], "검색에 실패했습니다."
 
     def _emit_current_product(self: "SearchPlugin") -> None:
         """현재 제품 정보를 추출하여 신호로 방출합니다."""
+        # 작업 스레드가 목록을 바꿀 수 있으므로 목록과 위치를 함께 읽습니다.
+        with self._state_lock:
+            products, current_index = self.products, self.current_index
         logger.debug(
-            f"_emit_current_product 호출: 인덱스 {self.current_index}, 총 {len(self.products)}개 제품"
+            f"_emit_current_product 호출: 인덱스 {current_index}, 총 {len(products)}개 제품"
         )
 
-        if not self.products:
+        if not products:
             logger.debug("제품 목록이 비어 있음")
             self.search_result.emit({"error": "검색 결과가 없습니다."})
             return
 
         try:
-            if self.current_index < 0 or self.current_index >= len(self.products):
-                logger.warning(f"인덱스가 범위를 벗어남: {self.current_index}")
+            if current_index < 0 or current_index >= len(products):
+                logger.warning(f"인덱스가 범위를 벗어남: {current_index}")
                 self.search_result.emit({"error": "유효하지 않은 제품 인덱스입니다."})
                 return
 
-            current_product = self.products[self.current_index]
-
-            # 현재 제품이 아직 DOM에 존재하는지 확인
-            try:
-                # ID나 클래스 속성을 확인하여 DOM에 여전히 존재하는지 검증
-                _ = current_product.get_attribute("class")
-            except Exception as e:
-                logger.warning(f"DOM 참조 오류 발생, 제품 목록 새로고침 시도: {str(e)}")
-                # 탐색을 다시 실행하려 시도
-                self.search(self.last_keyword)
-                return
-
-            # 현재 제품 정보 가져오기
-            product_info = self.get_product_info(current_product)
-
-            if not product_info:
-                logger.warning("제품 정보를 가져올 수 없음")
-                self.search_result.emit({"error": "제품 정보를 가져올 수 없습니다."})
-                return
-
+            # 결과 로드 시 만든 레코드를 사용하므로 브라우저 왕복이 없습니다.
+            product_info = products[current_index].to_dict()
             logger.debug(f"가져온 제품 정보: {product_info}")
 
-            # 제품의 링크를 가져오려고 시도
-            try:
-                product_link_element = current_product.find_element("css selector", "a")
-                product_url = product_link_element.get_attribute("href")
-
-                # /products/ URL에서 제품 ID 추출
-                if product_url and "/products/" in product_url:
-                    product_id = (
-                        product_url.split("/products/")[1].split("/")[0].split("?")[0]
-                    )
-                    logger.debug(f"추출된 제품 ID: {product_id}")
-                    product_info["id"] = product_id
-                else:
-                    logger.warning(f"제품 URL에서 ID를 추출할 수 없음: {product_url}")
-                    # ID를 추출할 수 없을 경우에도 고유 식별자를 제공하기 위한 임시 ID 생성
-                    product_info["id"] = f"temp_{self.current_index}"
-            except Exception as e:
-                logger.warning(f"제품 URL 또는 ID 추출 중 오류: {str(e)}")
-                product_info["id"] = f"temp_{self.current_index}"
-
             # 네비게이션 버튼 상태
-            product_info["enable_prev"] = self.current_index > 0
-            product_info["enable_next"] = self.current_index < len(self.products) - 1
+            product_info["enable_prev"] = current_index > 0
+            product_info["enable_next"] = current_index < len(products) - 1
 
             # 최종 검색 결과 시그널 발생
             self.search_result.emit(product_info)
@@ -378,21 +805,22 @@ class SearchPlugin(PluginBase, QObject):
             self.search_result.emit(
                 {
                     "error": "제품 정보를 처리하는 중 오류가 발생했습니다.",
-                    "enable_prev": self.current_index > 0 and bool(self.products),
-                    "enable_next": (
-                        self.current_index < len(self.products) - 1
-                        if self.products
-                        else False
-                    ),
+                    "enable_prev": current_index > 0,
+                    "enable_next": current_index < len(products) - 1,
                 }
             )
 
     def next_result(self: "SearchPlugin") -> None:
         """다음 검색 결과를 표시합니다."""
-        if self.products and self.current_index < len(self.products) - 1:
-            self.current_index += 1
+        with self._state_lock:
+            total = len(self.products)
+            moved = self.current_index < total - 1
+            at_last = total > 0 and self.current_index == total - 1
+            if moved:
+                self.current_index += 1
+        if moved:
             self._emit_current_product()
-        elif self.products and self.current_index == len(self.products) - 1:
+        elif at_last:
             self.search_result.emit(
                 {
                     "info": "마지막 제품입니다.",
@@ -411,10 +839,14 @@ class SearchPlugin(PluginBase, QObject):
 
     def previous_result(self: "SearchPlugin") -> None:
         """이전 검색 결과를 표시합니다."""
-        if self.products and self.current_index > 0:
-            self.current_index -= 1
+        with self._state_lock:
+            moved = bool(self.products) and self.current_index > 0
+            at_first = bool(self.products) and self.current_index == 0
+            if moved:
+                self.current_index -= 1
+        if moved:
             self._emit_current_product()
-        elif self.products and self.current_index == 0:
+        elif at_first:
             self.search_result.emit(
                 {
                     "info": "첫 번째 제품입니다.",
@@ -431,239 +863,70 @@ class SearchPlugin(PluginBase, QObject):
                 }
             )
 
-    def get_product_info(
-        self: "SearchPlugin", current_product: WebElement
-    ) -> Optional[Dict[str, Any]]:
-        """WebElement에서 제품 정보를 추출합니다.
+    def _extract_products(
+        self: "SearchPlugin", driver: WebDriver, skip: int = 0
+    ) -> List[ProductRecord]:
+        """검색 결과 페이지의 제품 카드를 레코드로 추출합니다.
+
+        카드 목록, 카드별 필드, 결과 없음 메시지를 `extract_fields` 한 번으로 읽고,
+        검색 API 응답에 같은 제품 ID가 있으면 그 값을 우선 사용합니다. 결과가 없으면
+        결과 없음 메시지를 self._no_result_text에 남깁니다.
 
         Args:
-            current_product: 정보를 추출할 WebElement입니다.
+            driver: 검색 결과 페이지를 연 WebDriver입니다.
+            skip: 지정하면 앞의 skip개 카드는 읽지 않습니다(스크롤로 더 로드된 카드만
+                읽을 때). 이때는 선택자 적중 기록과 결과 없음 메시지를 갱신하지 않습니다.
 
         Returns:
-            제품 정보를 담은 딕셔너리 또는 None입니다.
+            검색 결과 순서대로의 ProductRecord 목록입니다.
         """
-        if current_product is None:
-            logger.warning("get_product_info: current_product가 None입니다.")
-            return None
-
-        try:
-            logger.debug("제품 정보 추출 시작")
-
-            # 안전하게 HTML 출력
-            try:
-                html_preview = current_product.get_attribute("outerHTML")
-                if html_preview:
-                    html_preview = html_preview[:200] + "..."
-                else:
-                    html_preview = "(HTML을 가져올 수 없음)"
-                logger.debug(f"현재 제품 요소 HTML: {html_preview}")
-            except Exception as e:
-                logger.warning(f"HTML 가져오기 실패: {str(e)}")
-
-            # 다양한 CSS 선택자 시도
-            title_selectors = [
-                "p.item_title",
-                ".item_title",
-                ".product_title",
-                ".name",
-                "h3",
-                ".product_name",
-                "div.product_info_product_name p.name",
-            ]
-
-            translated_name_selectors = [
-                ".translated_name",
-                "div.product_info_product_name p.translated_name",
-                "p.translated_name",
-            ]
-
-            brand_selectors = [
-                "p.item_brand",
-                ".item_brand",
-                ".product_brand",
-                ".brand",
-                ".brand_name",
-                "span.brand-name",
-                "p.product_info_brand span.brand-name",
-            ]
-
-            # 브랜드 공식 배송 아이콘 선택자
-            brand_official_selectors = [
-                ".ico-brand-official",
-                "svg.ico-brand-official",
-                ".product_info_brand svg",
-            ]
-
-            price_selectors = [
-                "div.price_area .amount",
-                ".amount",
-                ".price",
-                ".product_price",
-                ".product_amount",
-            ]
-            image_selectors = [
-                "img.product_img",
-                "img",
-                ".product_img",
-                ".thumbnail img",
-                ".product_image img",
-            ]
-
-            # 관심수 및 리뷰수 선택자
-            wish_figure_selectors = [
-                ".wish_figure",
-                "span.wish_figure",
-                "span.wish_figure span",
-            ]
-
-            review_figure_selectors = [
-                ".review_figure",
-                "span.review_figure span:last-child",
-                "span.review_figure span",
-            ]
+        spec: Dict[str, Any] = {
+            "result": {
+                "selectors": SEARCH_RESULT_SELECTORS,
+                "all": True,
+                "skip": skip,
+                "fields": PRODUCT_CARD_FIELDS,
+            },
+        }
+        if not skip:
+            spec["no_result"] = NO_RESULT_SELECTORS
+        matched: Dict[str, Any] = {}
+        fields = extract_fields(driver, spec, matched=None if skip else matched)
+        if not skip:
+            registry = get_registry()
+            registry.record_matches("search", spec, matched)
+            registry.record_matches(
+                "card",
+                PRODUCT_CARD_FIELDS,
+                {
+                    name.removeprefix("result."): value
+                    for name, value in matched.items()
+                    if name.startswith("result.")
+                },
+            )
 
-            # 제품명 찾기
-            name = "이름 없음"
-            for selector in title_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    name = elements[0].text.strip()
-                    logger.debug(f"제품명 찾음: '{name}' (선택자: {selector})")
-                    break
-
-            # 한국어 이름(번역된 이름) 찾기
-            translated_name = ""
-            for selector in translated_name_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    translated_name = elements[0].text.strip()
-                    logger.debug(
-                        f"한국어 이름 찾음: '{translated_name}' (선택자: {selector})"
-                    )
-                    break
-
-            # 브랜드 찾기
-            brand = "브랜드 없음"
-            for selector in brand_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    brand = elements[0].text.strip()
-                    logger.debug(f"브랜드 찾음: '{brand}' (선택자: {selector})")
-                    break
-
-            # 브랜드 공식 배송 아이콘 확인
-            is_brand_official = False
-            for selector in brand_official_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    is_brand_official = True
-                    logger.debug(f"브랜드 공식 배송 아이콘 찾음 (선택자: {selector})")
-                    break
-
-            # 가격 찾기
-            price = "가격 없음"
-            for selector in price_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    price = elements[0].text.strip()
-                    logger.debug(f"가격 찾음: '{price}' (선택자: {selector})")
-                    break
-
-            # 이미지 URL 찾기
-            img_url = None
-            for selector in image_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    img_url = elements[0].get_attribute("src")
-                    logger.debug(f"이미지 URL 찾음: '{img_url}' (선택자: {selector})")
-                    break
-
-            # 관심수 찾기
-            wish_figure = ""
-            for selector in wish_figure_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    wish_text = elements[0].text.strip()
-                    if wish_text:
-                        # "관심 1,087" 형식에서 숫자만 추출
-                        if "관심" in wish_text:
-                            wish_figure = wish_text.split("관심")[-1].strip()
-                        else:
-                            wish_figure = wish_text
-                        logger.debug(
-                            f"관심수 찾음: '{wish_figure}' (선택자: {selector})"
-                        )
-                        break
-
-            # 리뷰수 찾기
-            review_figure = ""
-            for selector in review_figure_selectors:
-                elements = current_product.find_elements("css selector", selector)
-                if elements:
-                    review_text = elements[0].text.strip()
-                    if review_text:
-                        # "리뷰 76" 형식에서 숫자만 추출
-                        if "리뷰" in review_text:
-                            review_figure = review_text.split("리뷰")[-1].strip()
-                        else:
-                            review_figure = review_text
-                        logger.debug(
-                            f"리뷰수 찾음: '{review_figure}' (선택자: {selector})"
-                        )
-                        break
-
-            logger.debug(
-                f"제품 정보 추출 완료: {name}, {brand}, {price}, "
-                f"이미지URL: {img_url is not None}, 관심수: {wish_figure}, 리뷰수: {review_figure}"
+        api_by_id = {
+            info["id"]: info
+            for info in self.api_products
+            if "name" in info and "price" in info
+        }
+        products = [
+            ProductRecord.from_card(
+                card,
+                skip + index,
+                api_by_id.get(product_id_from_url(card.get("product_url"))),
             )
+            for index, card in enumerate(fields.get("result") or [])
+        ]
+        from_api = sum(1 for record in products if record.id in api_by_id)
+        logger.debug(
+            f"제품 카드 {len(products)}개 추출 (검색 API 정보 사용 {from_api}개)"
+        )
 
-            # 기본 정보는 항상 반환, 값이 누락되어도 기본값으로 대체
-            return {
-                "name": name or "이름 없음",
-                "translated_name": translated_name or "",
-                "brand": brand or "브랜드 없음",
-                "price": price or "가격 없음",
-                "image_url": img_url,
-                "wish_figure": wish_figure,
-                "review_figure": review_figure,
-                "is_brand_official": is_brand_official,
-            }
-        except NoSuchElementException as e:
-            logger.error(f"NoSuchElementException: {str(e)}", exc_info=True)
-            # 오류 발생해도, 기본 정보를 담은 결과 반환
-            return {
-                "name": "이름 없음",
-                "translated_name": "이름 없음",
-                "brand": "브랜드 없음",
-                "price": "가격 없음",
-                "image_url": None,
-                "wish_figure": "",
-                "review_figure": "",
-                "is_brand_official": False,
-            }
-        except StaleElementReferenceException as e:
-            logger.error(f"StaleElementReferenceException: {str(e)}", exc_info=True)
-            # 기본 정보 반환
-            return {
-                "name": "이름 없음 (페이지 변경됨)",
-                "translated_name": "이름 없음 (페이지 변경됨)",
-                "brand": "브랜드 없음",
-                "price": "가격 없음",
-                "image_url": None,
-                "wish_figure": "",
-                "review_figure": "",
-                "is_brand_official": False,
-            }
-        except Exception as e:
-            logger.error(f"제품 정보 추출 중 오류: {str(e)}", exc_info=True)
-            # 기본 정보 반환
-            return {
-                "name": "이름 없음 (오류)",
-                "translated_name": "",
-                "brand": "브랜드 없음",
-                "price": "가격 없음",
-                "image_url": None,
-                "wish_figure": "",
-                "review_figure": "",
-                "is_brand_official": False,
-            }
+        if not skip:
+            self._no_result_text = (
+                (fields.get("no_result") or "검색 결과가 없습니다.")
+                if matched.get("no_result", (None, 0))[0]
+                else ""
+            )
+        return products
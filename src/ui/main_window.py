@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import logging  # noqa: F401 # 로깅 모듈 임포트 (setup_logger 내부에서 사용될 수 있음)
+import os
 from datetime import datetime
 from typing import Any
 
-# 런타임 시 필요한 모듈 가져오기
-import requests
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QKeyEvent, QPixmap
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QImage, QKeyEvent, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
+    QFileDialog,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -56,6 +56,22 @@ class MainWindow(QWidget):
         self.controller = main_controller
         # 브랜드 공식 배송 상품 여부 초기화
         self.current_product_is_official = False
+        # 표시 중인 제품의 썸네일 URL (늦게 도착한 다른 제품 썸네일을 거르기 위함)
+        self.current_image_url: str | None = None
+        # 입력 중 검색: 마지막 입력 후 debounce_ms가 지나면 검색합니다.
+        config = plugin_manager.config
+        self.search_as_you_type = config.getboolean(
+            "Search", "search_as_you_type", fallback=True
+        )
+        self.min_query_length = config.getint("Search", "min_query_length", fallback=2)
+        self.search_debounce = QTimer(self)
+        self.search_debounce.setSingleShot(True)
+        self.search_debounce.setInterval(
+            config.getint("Search", "debounce_ms", fallback=400)
+        )
+        self.search_debounce.timeout.connect(self._search_as_you_type)
+        # 마지막으로 요청한 검색어 (같은 검색어로 다시 검색하지 않기 위함)
+        self._last_query = ""
         self.initUI()
         self.connectSignals()
 
@@ -120,6 +136,8 @@ class MainWindow(QWidget):
         self.search_input = QLineEdit(self)
         self.search_input.setPlaceholderText("제품명 입력")
         self.search_input.returnPressed.connect(self.search_product)
+        if self.search_as_you_type:
+            self.search_input.textEdited.connect(self._on_search_text_edited)
         font = self.search_input.font()
         font.setPointSize(font.pointSize() + 4)
         self.search_input.setFont(font)
@@ -137,6 +155,10 @@ class MainWindow(QWidget):
         self.search_details_button.clicked.connect(self.product_details)
         search_input_layout.addWidget(self.search_details_button)
 
+        self.batch_button = QPushButton("일괄 조회", self)
+        self.batch_button.clicked.connect(self.toggle_batch)
+        search_input_layout.addWidget(self.batch_button)
+
         search_layout.addLayout(search_input_layout)
         search_group.setLayout(search_layout)
         search_product_layout.addWidget(search_group, 1)
@@ -254,6 +276,7 @@ class MainWindow(QWidget):
         """컨트롤러의 시그널을 UI 요소의 슬롯에 연결합니다."""
         self.controller.login_status_changed.connect(self.handle_login_status)
         self.controller.search_result_received.connect(self.handle_search_result)
+        self.controller.thumbnail_ready.connect(self.handle_thumbnail)
         self.controller.details_received.connect(self.handle_details)
         self.controller.sizes_ready.connect(self.update_size_combo)
         try:
@@ -262,6 +285,8 @@ class MainWindow(QWidget):
             pass
         self.controller.log_message.connect(self.log_message)
         self.controller.macro_status_changed.connect(self.handle_macro_status)
+        self.controller.browser_status.connect(self.log_message)
+        self.controller.batch_finished.connect(self.handle_batch_finished)
         self.start_button.clicked.connect(self.start_macro)
 
     def show_login_popup(self: MainWindow) -> None:
@@ -308,8 +333,10 @@ class MainWindow(QWidget):
 
     def search_product(self: MainWindow) -> None:
         """제품 검색을 시작합니다."""
+        self.search_debounce.stop()
         query = self.search_input.text()
         if query:
+            self._last_query = query.strip()
             logger.debug(f"UI 검색 요청: '{query}'")  # print -> logger.debug
 
             # UI 초기화
@@ -332,6 +359,55 @@ class MainWindow(QWidget):
         """다음 검색 결과를 요청합니다."""
         self.controller.next_result()
 
+    def _on_search_text_edited(self: MainWindow, text: str) -> None:
+        """검색어가 바뀔 때마다 입력 중 검색 타이머를 다시 시작합니다."""
+        if len(text.strip()) < self.min_query_length:
+            self.search_debounce.stop()
+            return
+        self.search_debounce.start()
+
+    def _search_as_you_type(self: MainWindow) -> None:
+        """입력이 멈추면 검색합니다.
+
+        진행 중인 이전 검색은 컨트롤러가 취소하며, 새 결과가 도착할 때까지 이전
+        결과를 그대로 표시합니다.
+        """
+        query = self.search_input.text().strip()
+        if len(query) < self.min_query_length or query == self._last_query:
+            return
+        self._last_query = query
+        logger.debug(f"입력 중 검색 요청: '{query}'")
+        self.controller.search_product(query)
+
+    def toggle_batch(self: MainWindow) -> None:
+        """검색어 목록 파일을 골라 일괄 조회를 시작하거나, 실행 중이면 중단합니다."""
+        if self.controller.batch_running:
+            self.controller.cancel_batch()
+            return
+
+        input_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "일괄 조회할 검색어 목록",
+            "",
+            "검색어 목록 (*.csv *.txt);;모든 파일 (*)",
+        )
+        if not input_path:
+            return
+        stem, _ext = os.path.splitext(input_path)
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "일괄 조회 결과 저장", f"{stem}_result.csv", "CSV (*.csv)"
+        )
+        if not output_path:
+            return
+        if self.controller.start_batch(input_path, output_path):
+            self.batch_button.setText("일괄 조회 중지")
+
+    def handle_batch_finished(
+        self: MainWindow, output_path: str, ok: int, failed: int
+    ) -> None:
+        """일괄 조회가 끝나면 버튼을 되돌립니다."""
+        self.batch_button.setText("일괄 조회")
+
     def previous_result(self: MainWindow) -> None:
         """이전 검색 결과를 요청합니다."""
         self.controller.previous_result()
@@ -453,20 +529,12 @@ class MainWindow(QWidget):
             f"{brand}\n{name}\n{name_kr}\n{stats_text}\n[{product_id}]"
         )
 
+        # 미리 받은 썸네일을 바로 표시하고, 없으면 받는 동안 로고를 표시합니다.
         image_url = result.get("image_url")
-        if image_url:
-            try:
-                response = requests.get(image_url, timeout=5)
-                image_data = response.content
-                pixmap = QPixmap()
-                success = pixmap.loadFromData(image_data)
-
-                if success and not pixmap.isNull():
-                    self.image_label.setPixmap(pixmap)
-                else:
-                    self.image_label.setPixmap(get_logo_pixmap())
-            except Exception:
-                self.image_label.setPixmap(get_logo_pixmap())
+        self.current_image_url = image_url
+        image = self.controller.thumbnail(image_url) if image_url else None
+        if image is not None:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
         else:
             self.image_label.setPixmap(get_logo_pixmap())
 
@@ -481,6 +549,11 @@ class MainWindow(QWidget):
         self.start_button.setEnabled(False)
         self.macro_status_label.setText("상세 버튼을 눌러 제품 상세 정보를 확인하세요.")
 
+    def handle_thumbnail(self: MainWindow, url: str, image: QImage) -> None:
+        """내려받은 썸네일이 현재 제품의 것이면 표시합니다."""
+        if url == self.current_image_url and not image.isNull():
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+
     def handle_details(self: MainWindow, details: dict[str, Any]) -> None:
         """제품 상세 정보를 처리하고 UI에 표시합니다."""
         if not details:
@@ -0,0 +1 @@
+"""테스트 패키지입니다."""
@@ -0,0 +1,112 @@
+"""DetailCache의 필드별 TTL과 빈 값 처리를 메모리 DB로 확인합니다."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Dict
+from unittest import mock
+
+from src.core.detail_cache import PRICE_FIELDS, STATIC_FIELDS, DetailCache
+
+STATIC_TTL = 3600.0
+PRICE_TTL = 60.0
+NOW = 1_700_000_000.0
+
+DETAIL: Dict[str, Any] = {
+    "recent_price": "150,000원",
+    "fluctuation": "-3,000원",
+    "fluctuation_type": "decrease",
+    "release_price": "129,000원",
+    "model_no": "DD1391-100",
+    "release_date": "21/01/14",
+    "d_day": "",
+    "color": "WHITE/BLACK",
+    "sizes": ["250", "260"],
+}
+
+
+class DetailCacheTest(unittest.TestCase):
+    """DetailCache 테스트입니다."""
+
+    def setUp(self: "DetailCacheTest") -> None:
+        """고정/가격 필드의 TTL이 다른 메모리 캐시를 만듭니다."""
+        ttls = {field: STATIC_TTL for field in STATIC_FIELDS}
+        ttls.update({field: PRICE_TTL for field in PRICE_FIELDS})
+        self.cache = DetailCache(None, ttls)
+
+    def tearDown(self: "DetailCacheTest") -> None:
+        """DB 연결을 닫습니다."""
+        self.cache.close()
+
+    def put(self: "DetailCacheTest", detail: Dict[str, Any], at: float = NOW) -> None:
+        """주어진 시각에 저장합니다."""
+        with mock.patch("src.core.detail_cache.time.time", return_value=at):
+            self.cache.put("12345", detail)
+
+    def get(self: "DetailCacheTest", at: float) -> Any:
+        """주어진 시각에 조회합니다."""
+        with mock.patch("src.core.detail_cache.time.time", return_value=at):
+            return self.cache.get("12345")
+
+    def test_fresh_after_put(self: "DetailCacheTest") -> None:
+        """저장한 필드는 TTL 안에서 모두 fresh입니다 (d_day는 저장하지 않음)."""
+        self.put(DETAIL)
+        cached = self.get(NOW + 1)
+        self.assertEqual(cached.stale, frozenset())
+        self.assertEqual(cached.values["sizes"], ["250", "260"])
+        self.assertNotIn("d_day", cached.values)
+
+    def test_per_field_ttl(self: "DetailCacheTest") -> None:
+        """가격 필드만 먼저 만료되고, 값은 그대로 돌려줍니다."""
+        self.put(DETAIL)
+        cached = self.get(NOW + PRICE_TTL + 1)
+        self.assertEqual(cached.stale, frozenset(PRICE_FIELDS))
+        self.assertEqual(cached.values["recent_price"], "150,000원")
+        cached = self.get(NOW + STATIC_TTL + 1)
+        self.assertEqual(cached.stale, frozenset(STATIC_FIELDS + PRICE_FIELDS))
+
+    def test_placeholders_keep_previous_values(self: "DetailCacheTest") -> None:
+        """자리표시 값("N/A", "-", None)은 저장하지 않아 이전 값과 저장 시각을 유지합니다."""
+        self.put(DETAIL)
+        later = NOW + PRICE_TTL + 1
+        self.put(
+            dict(DETAIL, recent_price="N/A", model_no="-", color=None, sizes=["270"]),
+            at=later,
+        )
+        cached = self.get(later + 1)
+        self.assertEqual(cached.values["recent_price"], "150,000원")
+        self.assertEqual(cached.values["model_no"], "DD1391-100")
+        self.assertEqual(cached.values["color"], "WHITE/BLACK")
+        self.assertEqual(cached.values["sizes"], ["270"])
+        self.assertEqual(cached.stale, frozenset({"recent_price"}))
+
+    def test_empty_sizes_are_cached(self: "DetailCacheTest") -> None:
+        """빈 사이즈 목록은 "사이즈 없음"으로 저장하고, sizes가 없으면 stale입니다."""
+        self.put(dict(DETAIL, sizes=[]))
+        cached = self.get(NOW + 1)
+        self.assertEqual(cached.values["sizes"], [])
+        self.assertNotIn("sizes", cached.stale)
+
+        self.cache.invalidate("12345")
+        self.put({k: v for k, v in DETAIL.items() if k != "sizes"})
+        self.assertIn("sizes", self.get(NOW + 1).stale)
+
+    def test_fluctuation_type_follows_fluctuation(self: "DetailCacheTest") -> None:
+        """등락 종류 ""는 등락 값이 있을 때에만 저장합니다."""
+        self.put(dict(DETAIL, fluctuation="+0원", fluctuation_type=""))
+        self.assertEqual(self.get(NOW + 1).values["fluctuation_type"], "")
+
+        self.cache.invalidate("12345")
+        self.put(dict(DETAIL, fluctuation="N/A", fluctuation_type=""))
+        cached = self.get(NOW + 1)
+        self.assertNotIn("fluctuation_type", cached.values)
+        self.assertIn("fluctuation_type", cached.stale)
+
+    def test_errors_are_not_cached(self: "DetailCacheTest") -> None:
+        """오류 결과는 저장하지 않습니다."""
+        self.put({"error": "timeout", **DETAIL})
+        self.assertIsNone(self.get(NOW + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+"""KreamHttpClient를 로컬 스텁 서버에 연결해 확인합니다.
+
+`[Http] web_base`/`api_base`를 localhost의 `http.server`로 바꾸고, 제품 상세 API
+(`/api/p/products/<id>`)와 계정 API(`/api/m/me`)만 흉내 냅니다.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from configparser import ConfigParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+from src.core.http_client import KreamHttpClient
+from src.plugins.search.detail_plugin import DetailPlugin
+
+SESSION_COOKIE = ("kream_session", "stub-session")
+
+PRODUCT_ID = "12345"
+PRODUCT_PAYLOAD: Dict[str, Any] = {
+    "release": {
+        "id": int(PRODUCT_ID),
+        "name": "Nike Dunk Low Retro Black",
+        "style_code": "DD1391-100",
+        "date_released": "21/01/14",
+        "colorway": "WHITE/BLACK",
+        "original_price": 129000,
+    },
+    "market": {"last_sale_price": 150000, "change_value": -3000},
+    "options": [{"key": "250", "name": "250"}, {"key": "260", "name": "260"}],
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """스텁 API 요청을 처리합니다."""
+
+    # 테스트마다 바꿀 수 있는 제품 응답 (제품 ID → JSON)
+    products: Dict[str, Any] = {}
+    requests_seen: List[str] = []
+
+    def do_GET(self: "_StubHandler") -> None:  # noqa: N802
+        """경로에 따라 계정/제품 응답을 보냅니다."""
+        self.requests_seen.append(self.path)
+        if self.path == "/api/m/me":
+            cookie = self.headers.get("Cookie", "")
+            if "=".join(SESSION_COOKIE) in cookie:
+                self._send(200, {"email": "user@example.com"})
+            else:
+                self._send(401, {"code": "unauthorized"})
+            return
+        product_id = self.path.removeprefix("/api/p/products/")
+        if product_id != self.path and product_id in self.products:
+            self._send(200, self.products[product_id])
+            return
+        self._send(404, {})
+
+    def _send(self: "_StubHandler", status: int, body: Any) -> None:
+        """JSON 응답을 보냅니다."""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self: "_StubHandler", format: str, *args: Any) -> None:
+        """요청 로그를 출력하지 않습니다."""
+
+
+class _FakeDriver:
+    """get_cookies()만 제공하는 WebDriver 대역입니다."""
+
+    def __init__(self: "_FakeDriver", cookies: List[Dict[str, Any]]) -> None:
+        """대역을 초기화합니다."""
+        self.cookies = cookies
+
+    def get_cookies(self: "_FakeDriver") -> List[Dict[str, Any]]:
+        """저장된 쿠키를 반환합니다."""
+        return list(self.cookies)
+
+
+class _FakeBrowser:
+    """KreamHttpClient가 쓰는 BrowserManager 속성만 제공합니다."""
+
+    def __init__(self: "_FakeBrowser", driver: _FakeDriver) -> None:
+        """대역을 초기화합니다."""
+        self.driver = driver
+        self.listeners: List[Callable[[Any, Any], None]] = []
+
+    def add_recovery_listener(
+        self: "_FakeBrowser", listener: Callable[[Any, Any], None]
+    ) -> None:
+        """드라이버 재생성 콜백을 기록합니다."""
+        self.listeners.append(listener)
+
+    def lease_driver(self: "_FakeBrowser", owner: str) -> Any:
+        """HTTP 경로 테스트에서 호출되면 실패합니다."""
+        raise AssertionError("HTTP 경로에서는 브라우저를 열지 않아야 합니다.")
+
+
+class KreamHttpClientTest(unittest.TestCase):
+    """스텁 서버를 상대로 한 KreamHttpClient 테스트입니다."""
+
+    server: ThreadingHTTPServer
+    thread: threading.Thread
+
+    @classmethod
+    def setUpClass(cls: type["KreamHttpClientTest"]) -> None:
+        """스텁 서버를 임의의 포트에서 시작합니다."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls: type["KreamHttpClientTest"]) -> None:
+        """스텁 서버를 종료합니다."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self: "KreamHttpClientTest") -> None:
+        """스텁 서버를 가리키는 클라이언트와 DetailPlugin을 만듭니다."""
+        _StubHandler.products = {PRODUCT_ID: PRODUCT_PAYLOAD}
+        _StubHandler.requests_seen = []
+        base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        config = ConfigParser()
+        config.read_dict({"Http": {"web_base": base, "api_base": base, "timeout": "2"}})
+        self.driver = _FakeDriver(
+            [
+                {
+                    "name": SESSION_COOKIE[0],
+                    "value": SESSION_COOKIE[1],
+                    "domain": "127.0.0.1",
+                    "path": "/",
+                }
+            ]
+        )
+        self.browser = _FakeBrowser(self.driver)
+        self.client = KreamHttpClient(self.browser, config)  # type: ignore[arg-type]
+        self.browser.http = self.client  # type: ignore[attr-defined]
+        config.read_dict({"Cache": {"detail_enabled": "no"}})
+        self.detail = DetailPlugin("detail", self.browser, config)  # type: ignore[arg-type]
+
+    def tearDown(self: "KreamHttpClientTest") -> None:
+        """클라이언트 연결을 닫습니다."""
+        self.client.close()
+
+    def test_is_logged_in_with_driver_cookies(self: "KreamHttpClientTest") -> None:
+        """드라이버 쿠키로 계정 API가 200이면 로그인 상태입니다."""
+        self.assertIs(self.client.is_logged_in(), True)
+
+    def test_is_logged_out_after_cookie_resync(self: "KreamHttpClientTest") -> None:
+        """재생성 알림 뒤 쿠키가 없으면 로그아웃 상태입니다."""
+        self.assertIs(self.client.is_logged_in(), True)
+        self.driver.cookies = []
+        # 드라이버 재생성 알림을 받으면 다음 요청 전에 쿠키를 다시 복사합니다.
+        for listener in self.browser.listeners:
+            listener(None, None)
+        self.assertIs(self.client.is_logged_in(), False)
+
+    def test_is_logged_in_unknown_without_driver(self: "KreamHttpClientTest") -> None:
+        """드라이버가 없으면 요청을 보내지 않고 None입니다."""
+        self.browser.driver = None  # type: ignore[assignment]
+        self.assertIsNone(self.client.is_logged_in())
+        self.assertEqual(_StubHandler.requests_seen, [])
+
+    def test_product_detail(self: "KreamHttpClientTest") -> None:
+        """제품 API 응답을 상세 정보 형식으로 바꿉니다."""
+        detail = self.client.product_detail(PRODUCT_ID)
+        self.assertEqual(detail["model_no"], "DD1391-100")
+        self.assertEqual(detail["release_date"], "21/01/14")
+        self.assertEqual(detail["color"], "WHITE/BLACK")
+        self.assertEqual(detail["release_price"], "129,000원")
+        self.assertEqual(detail["recent_price"], "150,000원")
+        self.assertEqual(detail["fluctuation"], "-3,000원")
+        self.assertEqual(detail["fluctuation_type"], "decrease")
+        self.assertEqual(detail["sizes"], ["250", "260"])
+        self.assertEqual(_StubHandler.requests_seen, [f"/api/p/products/{PRODUCT_ID}"])
+
+    def test_product_detail_without_change_value(self: "KreamHttpClientTest") -> None:
+        """등락 값이 없으면 fluctuation을 넣지 않습니다."""
+        payload = json.loads(json.dumps(PRODUCT_PAYLOAD))
+        del payload["market"]["change_value"]
+        _StubHandler.products[PRODUCT_ID] = payload
+        detail = self.client.product_detail(PRODUCT_ID)
+        self.assertEqual(detail["recent_price"], "150,000원")
+        self.assertNotIn("fluctuation", detail)
+
+    def test_detail_plugin_uses_http_result(self: "KreamHttpClientTest") -> None:
+        """필요한 값이 모두 있으면 HTTP 결과를 그대로 씁니다."""
+        result = self.detail._get_details_via_http(PRODUCT_ID)
+        assert result is not None
+        self.assertEqual(result["fluctuation"], "-3,000원")
+        self.assertEqual(result["sizes"], ["250", "260"])
+
+    def test_detail_plugin_needs_fluctuation(self: "KreamHttpClientTest") -> None:
+        """등락 값이 없으면 HTTP 결과를 쓰지 않습니다."""
+        payload = json.loads(json.dumps(PRODUCT_PAYLOAD))
+        del payload["market"]["change_value"]
+        _StubHandler.products[PRODUCT_ID] = payload
+        # 등락 값이 없으면 빈 값 대신 상세 페이지에서 읽도록 None을 반환합니다.
+        self.assertIsNone(self.detail._get_details_via_http(PRODUCT_ID))
+
+    def test_product_detail_not_found(self: "KreamHttpClientTest") -> None:
+        """404 응답이면 빈 딕셔너리입니다."""
+        self.assertEqual(self.client.product_detail("999"), {})
+
+    def test_disabled_client_sends_nothing(self: "KreamHttpClientTest") -> None:
+        """[Http] enabled가 꺼져 있으면 요청을 보내지 않습니다."""
+        self.client.enabled = False
+        self.assertEqual(self.client.product_detail(PRODUCT_ID), {})
+        self.assertIsNone(self.client.is_logged_in())
+        self.assertEqual(_StubHandler.requests_seen, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""network_capture의 검색/상세 API 응답 파싱을 확인합니다."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Dict
+
+from src.core.network_capture import parse_product_detail, parse_search_products
+
+SEARCH_URL = "https://api.kream.co.kr/api/p/tabs/all/search?keyword=dunk"
+DETAIL_URL = "https://api.kream.co.kr/api/p/products/12345"
+
+SEARCH_PAYLOAD: Dict[str, Any] = {
+    "items": [
+        {
+            "release": {
+                "id": 12345,
+                "name": "Nike Dunk Low Retro Black",
+                "translated_name": "나이키 덩크 로우 레트로 블랙",
+                "brand": {"name": "Nike"},
+                "image_urls": ["https://img.example.com/12345.png"],
+                "is_brand_official": False,
+            },
+            "market": {"lowest_ask": 150000},
+            "counter": {"wish_count": "9.1만", "review_count": "1,204"},
+        },
+        {
+            "release": {
+                "id": 67890,
+                "name": "Jordan 1 Retro High OG",
+                "brand": "Jordan",
+            },
+            "market": {"lowest_ask": None, "market_price": 230000},
+        },
+        # 같은 제품이 다시 나오면 한 번만 사용합니다.
+        {"release": {"id": 12345, "name": "Nike Dunk Low Retro Black"}},
+    ]
+}
+
+DETAIL_PAYLOAD: Dict[str, Any] = {
+    "filters": {"options": [{"name": "전체"}, {"name": "인기순"}]},
+    "item": {
+        "release": {
+            "id": 12345,
+            "style_code": "DD1391-100",
+            "date_released": "21/01/14",
+            "colorway": "WHITE/BLACK",
+            "original_price": 129000,
+        },
+        "market": {"last_sale_price": 150000, "change_value": 3000},
+        "recommendations": [
+            {"release": {"id": 67890}, "options": [{"name": "999"}]},
+        ],
+        "sale": {"options": [{"key": "250", "name": "250"}, {"key": "260"}]},
+    },
+}
+
+
+class ParseSearchProductsTest(unittest.TestCase):
+    """parse_search_products() 테스트입니다."""
+
+    def test_products_in_response_order(self: "ParseSearchProductsTest") -> None:
+        """검색 결과 순서대로 중복 없이 제품 정보를 꺼냅니다."""
+        products = parse_search_products([(SEARCH_URL, SEARCH_PAYLOAD)])
+        self.assertEqual([p["id"] for p in products], ["12345", "67890"])
+        first, second = products
+        self.assertEqual(first["name"], "Nike Dunk Low Retro Black")
+        self.assertEqual(first["translated_name"], "나이키 덩크 로우 레트로 블랙")
+        self.assertEqual(first["brand"], "Nike")
+        self.assertEqual(first["price"], "150,000원")
+        self.assertEqual(first["image_url"], "https://img.example.com/12345.png")
+        self.assertEqual(first["wish_figure"], "9.1만")
+        self.assertEqual(first["review_figure"], "1,204")
+        self.assertIs(first["is_brand_official"], False)
+        self.assertEqual(second["brand"], "Jordan")
+        self.assertEqual(second["price"], "230,000원")
+        # 값이 없는 키는 넣지 않아 DOM 값으로 채울 수 있게 합니다.
+        self.assertNotIn("image_url", second)
+
+    def test_ignores_unrelated_urls(self: "ParseSearchProductsTest") -> None:
+        """검색 API가 아닌 응답은 건너뜁니다."""
+        self.assertEqual(parse_search_products([(DETAIL_URL, SEARCH_PAYLOAD)]), [])
+
+
+class ParseProductDetailTest(unittest.TestCase):
+    """parse_product_detail() 테스트입니다."""
+
+    def test_fields_of_matched_release(self: "ParseProductDetailTest") -> None:
+        """release.id가 일치하는 노드에서 가격/속성 값을 꺼냅니다."""
+        detail = parse_product_detail([(DETAIL_URL, DETAIL_PAYLOAD)], "12345")
+        self.assertEqual(detail["model_no"], "DD1391-100")
+        self.assertEqual(detail["release_date"], "21/01/14")
+        self.assertEqual(detail["color"], "WHITE/BLACK")
+        self.assertEqual(detail["release_price"], "129,000원")
+        self.assertEqual(detail["recent_price"], "150,000원")
+        self.assertEqual(detail["fluctuation"], "+3,000원")
+        self.assertEqual(detail["fluctuation_type"], "increase")
+
+    def test_sizes_from_matched_subtree(self: "ParseProductDetailTest") -> None:
+        """필터나 다른 제품의 옵션 목록은 사이즈로 읽지 않습니다."""
+        detail = parse_product_detail([(DETAIL_URL, DETAIL_PAYLOAD)], "12345")
+        self.assertEqual(detail["sizes"], ["250", "260"])
+
+    def test_no_sizes_outside_matched_node(self: "ParseProductDetailTest") -> None:
+        """일치하는 노드 아래에 옵션이 없으면 사이즈를 넣지 않습니다."""
+        payload = {
+            "filters": DETAIL_PAYLOAD["filters"],
+            "item": {"release": DETAIL_PAYLOAD["item"]["release"]},
+        }
+        detail = parse_product_detail([(DETAIL_URL, payload)], "12345")
+        self.assertEqual(detail["model_no"], "DD1391-100")
+        self.assertNotIn("sizes", detail)
+
+    def test_other_product_url_ignored(self: "ParseProductDetailTest") -> None:
+        """다른 제품의 상세 API 응답은 건너뜁니다."""
+        self.assertEqual(
+            parse_product_detail([(DETAIL_URL, DETAIL_PAYLOAD)], "67890"), {}
+        )
+
+    def test_zero_change_has_no_type(self: "ParseProductDetailTest") -> None:
+        """등락이 0이면 fluctuation_type을 넣지 않습니다."""
+        payload = {
+            "release": {"id": 12345},
+            "market": {"last_sale_price": 150000, "change_value": 0},
+        }
+        detail = parse_product_detail([(DETAIL_URL, payload)], "12345")
+        self.assertEqual(detail["fluctuation"], "+0원")
+        self.assertNotIn("fluctuation_type", detail)
+
+
+if __name__ == "__main__":
+    unittest.main()
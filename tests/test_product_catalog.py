@@ -0,0 +1,108 @@
+"""ProductCatalog의 저장/색인/검색을 메모리 DB로 확인합니다."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Dict
+
+from src.core.product_catalog import ProductCatalog
+
+DUNK: Dict[str, Any] = {
+    "id": "12345",
+    "name": "Nike Dunk Low Retro Black",
+    "translated_name": "나이키 덩크 로우 레트로 블랙",
+    "brand": "Nike",
+    "price": "150,000원",
+    "image_url": "https://img.example.com/12345.png",
+    "is_brand_official": True,
+}
+JORDAN: Dict[str, Any] = {
+    "id": "67890",
+    "name": "Jordan 1 Retro High OG Chicago",
+    "brand": "Jordan",
+    "price": "230,000원",
+}
+DUNK_DETAIL: Dict[str, Any] = {
+    "model_no": "DD1391-100",
+    "release_date": "21/01/14",
+    "sizes": ["250", "260"],
+}
+
+
+class ProductCatalogTest(unittest.TestCase):
+    """FTS5 색인을 사용하는 카탈로그 테스트입니다."""
+
+    def setUp(self: "ProductCatalogTest") -> None:
+        """메모리 카탈로그에 두 제품을 저장합니다."""
+        self.catalog = ProductCatalog(":memory:")
+        self.catalog.add_products([DUNK, JORDAN])
+        self.catalog.add_detail("12345", DUNK_DETAIL)
+
+    def tearDown(self: "ProductCatalogTest") -> None:
+        """DB 연결을 닫습니다."""
+        self.catalog.close()
+
+    def ids(self: "ProductCatalogTest", query: str) -> list[str]:
+        """검색 결과의 제품 ID 목록을 반환합니다."""
+        return [item["id"] for item in self.catalog.search(query)]
+
+    def test_search_by_name_prefix(self: "ProductCatalogTest") -> None:
+        """모든 단어를 앞부분 일치로 찾습니다."""
+        self.assertEqual(sorted(self.ids("retro")), ["12345", "67890"])
+        self.assertEqual(self.ids("dun lo"), ["12345"])
+        self.assertEqual(self.ids("덩크"), ["12345"])
+        self.assertEqual(self.ids("dunk chicago"), [])
+
+    def test_search_by_model_number(self: "ProductCatalogTest") -> None:
+        """하이픈이 있든 없든 모델번호로 찾습니다."""
+        self.assertEqual(self.ids("DD1391-100"), ["12345"])
+        self.assertEqual(self.ids("DD1391100"), ["12345"])
+        self.assertEqual(self.ids("dd1391 100"), ["12345"])
+
+    def test_model_number_match_first(self: "ProductCatalogTest") -> None:
+        """모델번호가 같은 제품을 맨 앞에 둡니다."""
+        self.catalog.add_products(
+            [{"id": "11111", "name": "DD1391100 inspired", "brand": "Other"}]
+        )
+        self.assertEqual(self.ids("DD1391100"), ["12345", "11111"])
+
+    def test_upsert_keeps_other_columns(self: "ProductCatalogTest") -> None:
+        """카드 정보와 상세 정보를 다시 저장해도 서로의 열을 지우지 않습니다."""
+        self.catalog.add_products([dict(DUNK, price="155,000원")])
+        self.catalog.add_detail("12345", {"model_no": "N/A", "sizes": []})
+        (item,) = self.catalog.search("DD1391-100")
+        self.assertEqual(item["price"], "155,000원")
+        self.assertEqual(item["model_no"], "DD1391-100")
+        self.assertEqual(item["release_date"], "21/01/14")
+        self.assertEqual(item["sizes"], ["250", "260"])
+        self.assertIs(item["is_brand_official"], True)
+        self.assertEqual(self.catalog.count(), 2)
+
+    def test_reindex_on_update(self: "ProductCatalogTest") -> None:
+        """이름이 바뀌면 색인도 새 이름으로 바뀝니다."""
+        self.catalog.add_products([dict(JORDAN, name="Jordan 1 Retro High OG Bred")])
+        self.assertEqual(self.ids("bred"), ["67890"])
+        self.assertEqual(self.ids("chicago"), [])
+
+    def test_skips_detail_only_and_temp_products(self: "ProductCatalogTest") -> None:
+        """임시 ID와 카드 정보가 없는 제품은 검색 결과에 넣지 않습니다."""
+        self.assertEqual(self.catalog.add_products([{"id": "temp_1", "name": "x"}]), 0)
+        self.catalog.add_detail("99999", {"model_no": "AB1234-001"})
+        self.catalog.add_detail("88888", {"error": "실패", "model_no": "CD5678-002"})
+        self.assertEqual(self.ids("AB1234-001"), [])
+        self.assertEqual(self.catalog.count(), 3)
+
+
+class ProductCatalogLikeTest(ProductCatalogTest):
+    """FTS5가 없을 때의 LIKE 검색으로 같은 동작을 확인합니다."""
+
+    def setUp(self: "ProductCatalogLikeTest") -> None:
+        """FTS5 색인을 쓰지 않는 카탈로그를 만듭니다."""
+        self.catalog = ProductCatalog(":memory:")
+        self.catalog._fts = False
+        self.catalog.add_products([DUNK, JORDAN])
+        self.catalog.add_detail("12345", DUNK_DETAIL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""SearchCache의 LRU 정리, 만료, 오래된 결과 반환을 확인합니다."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from typing import Any, Optional
+from unittest import mock
+
+from src.core.search_cache import SearchCache
+
+TTL = 600.0
+MAX_AGE = 3600.0
+NOW = 1_700_000_000.0
+
+
+class SearchCacheTest(unittest.TestCase):
+    """임시 SQLite 파일을 쓰는 SearchCache 테스트입니다."""
+
+    def setUp(self: "SearchCacheTest") -> None:
+        """임시 디렉터리에 최대 2개 항목을 두는 캐시를 만듭니다."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "search.sqlite3")
+        self.cache = self.open()
+
+    def tearDown(self: "SearchCacheTest") -> None:
+        """DB 연결을 닫고 임시 디렉터리를 지웁니다."""
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def open(self: "SearchCacheTest") -> SearchCache:
+        """같은 DB 파일로 새 캐시를 엽니다 (메모리 항목 없이 디스크만 사용)."""
+        return SearchCache(self.path, ttl=TTL, max_age=MAX_AGE, max_entries=2)
+
+    def reopen(self: "SearchCacheTest") -> None:
+        """캐시를 닫고 다시 열어 이후 조회가 디스크를 읽게 합니다."""
+        self.cache.close()
+        self.cache = self.open()
+
+    def put(self: "SearchCacheTest", keyword: str, at: float) -> None:
+        """주어진 시각에 검색어 결과를 저장합니다."""
+        with mock.patch("src.core.search_cache.time.time", return_value=at):
+            self.cache.put(keyword, [{"id": keyword}])
+
+    def get(self: "SearchCacheTest", keyword: str, at: float) -> Any:
+        """주어진 시각에 검색어 결과를 조회합니다."""
+        with mock.patch("src.core.search_cache.time.time", return_value=at):
+            return self.cache.get(keyword)
+
+    def used_at(self: "SearchCacheTest", keyword: str) -> Optional[float]:
+        """디스크에 기록된 마지막 사용 시각을 반환합니다."""
+        assert self.cache._db is not None
+        row = self.cache._db.execute(
+            "SELECT used_at FROM results WHERE keyword = ?", (keyword,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def test_fresh_and_stale_reads(self: "SearchCacheTest") -> None:
+        """TTL 안에서는 새 결과, max_age까지는 오래된 결과, 그 뒤로는 None입니다."""
+        self.put("dunk", NOW)
+        self.reopen()
+        fresh = self.get("dunk", NOW + 10)
+        self.assertEqual(fresh.payload, [{"id": "dunk"}])
+        self.assertFalse(fresh.stale)
+        self.assertEqual(fresh.age, 10)
+
+        stale = self.get("dunk", NOW + TTL + 1)
+        self.assertTrue(stale.stale)
+        self.assertEqual(stale.payload, [{"id": "dunk"}])
+
+        self.assertIsNone(self.get("dunk", NOW + MAX_AGE + 1))
+        self.assertEqual(
+            self.cache.stats(),
+            {"hits": 1, "stale_hits": 1, "misses": 1, "hit_ratio": 0.667},
+        )
+
+    def test_keyword_normalized(self: "SearchCacheTest") -> None:
+        """앞뒤/연속 공백과 대소문자가 달라도 같은 검색어로 봅니다."""
+        self.put("  Nike   Dunk ", NOW)
+        self.assertIsNotNone(self.get("nike dunk", NOW + 1))
+        self.cache.invalidate("NIKE DUNK")
+        self.reopen()
+        self.assertIsNone(self.get("nike dunk", NOW + 1))
+
+    def test_disk_evicts_least_recently_used(self: "SearchCacheTest") -> None:
+        """디스크 항목이 max_entries를 넘으면 가장 오래전에 쓴 검색어부터 지웁니다."""
+        self.put("a", NOW)
+        self.put("b", NOW + 1)
+        # 아직 기록되지 않은 a의 사용 시각도 다음 put()의 정리 전에 반영됩니다.
+        self.get("a", NOW + 2)
+        self.put("c", NOW + 3)
+        self.reopen()
+        self.assertIsNone(self.get("b", NOW + 4))
+        self.assertIsNotNone(self.get("a", NOW + 4))
+        self.assertIsNotNone(self.get("c", NOW + 4))
+
+    def test_touches_batched(self: "SearchCacheTest") -> None:
+        """사용 시각은 TOUCH_BATCH개가 모이거나 close()할 때 기록합니다."""
+        self.put("a", NOW)
+        self.put("b", NOW)
+        with mock.patch("src.core.search_cache.TOUCH_BATCH", 2):
+            self.get("a", NOW + 5)
+            self.assertEqual(self.used_at("a"), NOW)
+            self.get("b", NOW + 6)
+            self.assertEqual(self.used_at("a"), NOW + 5)
+            self.assertEqual(self.used_at("b"), NOW + 6)
+
+            self.get("a", NOW + 7)
+            self.reopen()
+            self.assertEqual(self.used_at("a"), NOW + 7)
+
+    def test_memory_evicts_least_recently_used(self: "SearchCacheTest") -> None:
+        """메모리 항목은 MEMORY_ENTRIES개까지만 두고 오래전에 쓴 것부터 버립니다."""
+        cache = SearchCache(None, ttl=TTL, max_age=MAX_AGE)
+        with mock.patch("src.core.search_cache.MEMORY_ENTRIES", 2):
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.get("a")
+            cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").payload, 1)
+        self.assertEqual(cache.get("c").payload, 3)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()